@@ -0,0 +1,176 @@
+""" On-disk bake cache keyed by the fbx content and the options that change the result """
+import bpy
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import numpy as np
+
+
+## bump when the bake result of the same input changes
+CACHE_VERSION = 3
+## options that change the sampled trajectories or the baked curves
+KEY_OPTIONS = ("method", "sample_mode", "bake_x", "bake_y", "bake_z", "is_start_feet", "is_apply_transforms",
+               "root_name", "main_bone_name", "head_top_bone_name", "spine_bone_name",
+               "left_hand_bone_name", "right_hand_bone_name", "left_foot_bone_name", "right_foot_bone_name",
+               "left_toe_bone_name", "right_toe_bone_name", "contact_bone_names",
+               "primary_bone_axis", "secondary_bone_axis", "resample_mode", "resample_fps")
+## arrays of an entry
+ARRAYS = ("times", "root_vectors", "hips_vectors", "root_local", "hips_local")
+## temp files of saves in progress, not entries
+TEMP_SUFFIX = ".tmp"
+## cache folder resolved by the parent process, set for the workers and the command line
+ENV_CACHE_DIR = "MIXAMO_BAKE_CACHE_DIR"
+## id of blender_manifest.toml
+EXTENSION_ID = "import_mixamo_root_motion"
+LEGACY_DIR = os.path.join(tempfile.gettempdir(), "mixamo_root_motion_bake_cache")
+
+_cache_dir = None
+
+
+def _extension_dirs() -> list:
+    """ cache folders of the installed extension in every repository """
+    try:
+        base = bpy.utils.user_resource('EXTENSIONS', path=".user")
+    except (AttributeError, TypeError, ValueError):
+        return []
+    return sorted(glob.glob(os.path.join(base, "*", EXTENSION_ID, "bake_cache")))
+
+
+def set_cache_dir(path: str):
+    """ use path for this process and the workers it starts """
+    global _cache_dir
+    _cache_dir = os.path.abspath(path)
+    os.makedirs(_cache_dir, exist_ok=True)
+
+
+def cache_dir() -> str:
+    """ resolved once per process: ENV_CACHE_DIR, the user cache folder of the extension,
+    the one of the installed extension when imported as a top level package, the temp folder otherwise """
+    global _cache_dir
+    if _cache_dir is None:
+        path = os.environ.get(ENV_CACHE_DIR)
+        if not path:
+            try:
+                path = bpy.utils.extension_path_user(__package__, path="bake_cache", create=True)
+            except (AttributeError, ValueError):
+                ## command line: the package is not an extension module, share the cache of the installed one
+                path = next(iter(_extension_dirs()), LEGACY_DIR)
+        set_cache_dir(path)
+    return _cache_dir
+
+
+def worker_env() -> dict:
+    """ environment of the background processes: the same cache folder as this process """
+    return dict(os.environ, **{ENV_CACHE_DIR: cache_dir()})
+
+
+def file_hash(file_path: str) -> str:
+    digest = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(file_path: str, options: dict) -> str:
+    """ fbx content hash + hash of the result affecting options """
+    key_options = {name: options[name] for name in KEY_OPTIONS if name in options}
+    settings = json.dumps([CACHE_VERSION, key_options], sort_keys=True).encode()
+    return file_hash(file_path)[:32] + "_" + hashlib.sha256(settings).hexdigest()[:16]
+
+
+def _entry_path(key: str) -> str:
+    return os.path.join(cache_dir(), key + ".npz")
+
+
+def _remove(path: str):
+    """ remove a file another process may have removed already """
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def load(key: str):
+    """ cached arrays (times, root_vectors, hips_vectors, root_local, hips_local) or None; broken entries are removed """
+    path = _entry_path(key)
+    if not os.path.exists(path):
+        return None
+    try:
+        with np.load(path) as data:
+            entry = {name: data[name] for name in ARRAYS}
+        os.utime(path)  ## LRU: mtime is the last access
+    except FileNotFoundError:
+        return None
+    except Exception:
+        ## truncated / corrupt file (BadZipFile, EOFError, ...) or missing arrays (KeyError)
+        _remove(path)
+        return None
+    return entry
+
+
+def save(key: str, max_size_mb: int, **arrays):
+    """ store an entry, then evict the least recently used entries above the size cap; best effort, errors are printed """
+    try:
+        path = _entry_path(key)
+        ## unique temp file, workers sharing the cache may save the same key at once
+        handle, temp_path = tempfile.mkstemp(suffix=TEMP_SUFFIX, dir=os.path.dirname(path))
+        try:
+            with os.fdopen(handle, 'wb') as f:
+                np.savez(f, **arrays)
+            os.replace(temp_path, path)
+        except BaseException:
+            _remove(temp_path)
+            raise
+        evict(max_size_mb * 1024 * 1024)
+    except Exception as e:
+        print(f"bake cache: {key} not saved: {e}")
+    return {'FINISHED'}
+
+
+def _entries(folder: str = None) -> list:
+    """ (mtime, size, path) of the entries, oldest first; temp files of running saves are left out """
+    folder = folder or cache_dir()
+    entries = []
+    if not os.path.isdir(folder):
+        return entries
+    for name in os.listdir(folder):
+        if not name.endswith(".npz"):
+            continue
+        path = os.path.join(folder, name)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+    return sorted(entries)
+
+
+def evict(max_bytes: int):
+    """ remove the oldest entries until the cache fits into max_bytes; best effort, errors are printed """
+    try:
+        entries = _entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            _remove(path)
+            total -= size
+    except OSError as e:
+        print(f"bake cache: eviction failed: {e}")
+    return {'FINISHED'}
+
+
+def clear() -> int:
+    """ remove all entries of every cache folder in use; -> number of removed entries """
+    folders = {os.path.normcase(os.path.abspath(folder)): folder
+               for folder in [cache_dir(), LEGACY_DIR] + _extension_dirs()}
+    count = 0
+    for folder in folders.values():
+        entries = _entries(folder)
+        for _, _, path in entries:
+            _remove(path)
+        count += len(entries)
+    return count
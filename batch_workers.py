@@ -0,0 +1,200 @@
+""" Parallel batch import: shard the fbx files across background Blender processes """
+import bpy
+import heapq
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from bpy.types import Context
+from . import bake_cache, library, scene_utils
+
+
+PACKAGE_DIR = os.path.dirname(os.path.abspath(__file__))
+## the worker imports this add-on as a top level package from its install folder
+WORKER_EXPR = ("import sys, importlib; sys.path.insert(0, {parent!r}); "
+               "importlib.import_module({package!r}).batch_workers.worker_main()")
+
+
+def shard_files(file_paths: list, count: int, by_size: bool = True) -> list:
+    """ split files into <count> shards; by size: largest first into the lightest shard """
+    count = max(1, min(count, len(file_paths)))
+    if not by_size:
+        return [file_paths[i::count] for i in range(count)]
+    shards = [[] for _ in range(count)]
+    heap = [(0, i) for i in range(count)]
+    for file_path in sorted(file_paths, key=os.path.getsize, reverse=True):
+        size, i = heapq.heappop(heap)
+        shards[i].append(file_path)
+        heapq.heappush(heap, (size + os.path.getsize(file_path), i))
+    return [shard for shard in shards if shard]
+
+
+def worker_command(job_path: str) -> list:
+    """ command line of one background worker """
+    expr = WORKER_EXPR.format(parent=os.path.dirname(PACKAGE_DIR), package=os.path.basename(PACKAGE_DIR))
+    return [bpy.app.binary_path, "-b", "--factory-startup", "--python-expr", expr, "--", job_path]
+
+
+def worker_main():
+    """ entry point inside the worker: run main() for every file; each file writes its new actions and kept
+    armatures to a .blend library, then its report as JSON (the heartbeat of the parent process) """
+    from .import_mixamo_root_motion import main
+    from .profiling import FileReport
+
+    job_path = sys.argv[sys.argv.index("--") + 1]
+    with open(job_path, encoding='utf-8') as f:
+        job = json.load(f)
+
+    context = bpy.context
+    for index, file_path in enumerate(job["files"]):
+        before_actions, before_objects = set(bpy.data.actions), set(bpy.data.objects)
+        report = FileReport(file_path)
+        main(context, file_path=file_path, report=report, **job["options"])
+        actions = [a for a in bpy.data.actions if a not in before_actions]
+        for action in actions:
+            action.use_fake_user = True
+        report.actions = [a.name for a in actions]
+        ## kept armatures of this file with their children (mesh)
+        objects = {c for o in context.scene.objects if o.type == 'ARMATURE' and o not in before_objects
+                   for c in [o] + list(o.children_recursive)}
+        output = os.path.join(job["folder"], f"{index:05}.blend")
+        bpy.data.libraries.write(output, set(actions) | objects, fake_user=True)
+        ## the report is written last and renamed into place: a file with a report is complete
+        path = os.path.join(job["folder"], f"{index:05}.json")
+        with open(path + ".tmp", 'w', encoding='utf-8') as f:
+            json.dump(report.as_dict(), f)
+        os.replace(path + ".tmp", path)
+
+
+def finished_files(folder: str) -> int:
+    """ number of files a worker has completed """
+    return sum(name.endswith(".json") for name in os.listdir(folder))
+
+
+def start_worker(temp_dir: str, name: str, files: list, options: dict) -> tuple:
+    """ -> job, process """
+    job = {"files": files, "options": options, "folder": os.path.join(temp_dir, name)}
+    os.makedirs(job["folder"])
+    job_path = os.path.join(temp_dir, f"{name}_job.json")
+    with open(job_path, 'w', encoding='utf-8') as f:
+        json.dump(job, f)
+    process = subprocess.Popen(worker_command(job_path), env=bake_cache.worker_env(), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return job, process
+
+
+def find_duplicate(actions: list):
+    """ action imported before with the fingerprint of one of the actions, the lookup of main(); or None """
+    for action in actions:
+        if action is not None and library.FINGERPRINT_PROP in action:
+            duplicate = library.find_action(action[library.FINGERPRINT_PROP], exclude=action)
+            if duplicate is not None:
+                return duplicate
+    return None
+
+
+def append_file(context: Context, output: str, options: dict, report: dict) -> dict:
+    """ append the actions and armatures of one file; the armatures follow the rules of the sequential import:
+    one library armature per skeleton, is_delete_armature removes <Armature.00*>; duplicates of actions of the
+    scene or of earlier shards are dropped like in main(); -> report with the appended action names """
+    with bpy.data.libraries.load(output, link=False) as (data_from, data_to):
+        data_to.actions = data_from.actions
+        data_to.objects = data_from.objects
+    ## same animation as an action of the scene or an earlier file: skip the file or record it as an alias
+    if options.get("duplicate_mode", 'IMPORT') != 'IMPORT':
+        duplicate = find_duplicate(data_to.actions)
+        if duplicate is not None:
+            for obj in data_to.objects:
+                if obj is not None and obj.parent is None:
+                    scene_utils.remove_hierarchy(obj)
+            bpy.data.batch_remove([a for a in data_to.actions if a is not None])
+            report["duplicate_of"], report["actions"] = duplicate.name, []
+            if options["duplicate_mode"] == 'ALIAS':
+                library.add_alias(duplicate, os.path.basename(report["file"]))
+            return report
+    ## appended actions and objects may be renamed on name collisions
+    names = {old: new.name for old, new in zip(data_from.actions, data_to.actions) if new is not None}
+    report["actions"] = [names.get(a, a) for a in report["actions"]]
+    armature_name = bpy.utils.escape_identifier(options.get("armature_name", "Armature"))
+    for obj in data_to.objects:
+        if obj is None or obj.type != 'ARMATURE' or obj.parent is not None:
+            continue
+        signature = obj.get(library.SIGNATURE_PROP)
+        if options.get("import_mode") == 'LIBRARY':
+            keep = not signature or library.find_armature(context.scene, signature) is None
+        else:
+            keep = not (options.get("is_delete_armature") and obj.name.startswith(armature_name + '.00'))
+        if keep:
+            scene_utils.link_hierarchy(obj, context.collection)
+        else:
+            scene_utils.remove_hierarchy(obj)
+    ## library mode: the actions are stashed on the library armature of the scene, not the one of the worker
+    for action in data_to.actions:
+        if action is None or library.SIGNATURE_PROP not in action:
+            continue
+        target = library.find_armature(context.scene, action[library.SIGNATURE_PROP])
+        if target is not None:
+            library.stash(target, action)
+    return report
+
+
+def run_parallel(context: Context, file_paths: list, options: dict, worker_count: int = 0,
+                 shard_by_size: bool = True, file_timeout: float = 120.0) -> dict:
+    """ import files in background workers and append their results; -> file path: FileReport.as_dict()
+
+    A worker that gets no file done within <file_timeout> seconds is stopped: its completed files are kept,
+    the current file fails and a new worker continues with the rest of the shard.
+    """
+    shards = shard_files(file_paths, worker_count or os.cpu_count() or 1, by_size=shard_by_size)
+    temp_dir = tempfile.mkdtemp(prefix="mixamo_import_")
+    workers = []  ## job, process, finished file count, deadline of the next file
+    runs = []  ## jobs in start order, each file is appended in the order of its shard
+    results = {}
+    try:
+        for i, shard in enumerate(shards):
+            job, process = start_worker(temp_dir, f"shard_{i}", shard, options)
+            workers.append([job, process, 0, time.monotonic() + file_timeout])
+            runs.append(job)
+
+        while workers:
+            time.sleep(0.1)
+            for worker in list(workers):
+                job, process, done, deadline = worker
+                finished = finished_files(job["folder"])
+                if finished > done:
+                    worker[2], worker[3] = finished, time.monotonic() + file_timeout
+                    continue
+                if process.poll() is None and time.monotonic() > deadline:
+                    process.kill()
+                    process.wait()
+                    error = f"timeout after {file_timeout:.0f}s"
+                elif process.poll() is not None:
+                    error = f"worker failed (exit code {process.returncode})"
+                else:
+                    continue
+                workers.remove(worker)
+                if finished < len(job["files"]):
+                    ## the current file failed, a new worker continues after it
+                    failed = job["files"][finished]
+                    results[failed] = {"file": failed, "status": 'FAILED', "error": error}
+                    rest = job["files"][finished + 1:]
+                    if rest:
+                        job, process = start_worker(temp_dir, f"run_{len(runs)}", rest, options)
+                        workers.append([job, process, 0, time.monotonic() + file_timeout])
+                        runs.append(job)
+
+        for job in runs:
+            for index in range(finished_files(job["folder"])):
+                path = os.path.join(job["folder"], f"{index:05}")
+                with open(path + ".json", encoding='utf-8') as f:
+                    report = json.load(f)
+                results[report["file"]] = append_file(context, path + ".blend", options, report)
+        return results
+    finally:
+        for _, process, _, _ in workers:
+            if process.poll() is None:
+                process.kill()
+        shutil.rmtree(temp_dir, ignore_errors=True)
@@ -0,0 +1 @@
+""" Benchmarks, run in background Blender: blender -b --factory-startup -P <add-on folder>/benchmarks/<script>.py -- ... """
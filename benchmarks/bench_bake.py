@@ -0,0 +1,136 @@
+""" Micro-benchmarks of the bake math and the keyframe I/O on synthetic Mixamo-like clips
+
+blender -b --factory-startup -P <add-on folder>/benchmarks/bench_bake.py -- [options]
+
+Every case (method x frame count x whole / sub-frame keys) is run --repeat times on a fresh armature,
+the best time per stage is kept. The result is compared with the JSON baseline; a stage slower than
+baseline * (1 + threshold) is a regression and the exit code is 1. A missing baseline is written.
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+
+
+METHODS = ("COPY_DATA", "LOWEST_BONE", "BOUND_BOX")
+ROOT_NAME = "Root"
+## ignore differences below this (seconds), timer noise of the smallest cases
+MIN_DELTA = 0.002
+
+
+def parse_args(argv: list) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(prog="blender -b -P bench_bake.py --", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--frames", type=int, nargs='+', default=[60, 1000, 10000], help="frame counts")
+    parser.add_argument("--methods", nargs='+', choices=METHODS, default=list(METHODS))
+    parser.add_argument("--sample_mode", choices=("ACTION", "DEPSGRAPH"), default='ACTION')
+    parser.add_argument("--repeat", type=int, default=3, help="runs per case, the best time is kept")
+    parser.add_argument("--baseline", default=os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json"),
+                        help="JSON baseline to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    parser.add_argument("--update", action='store_true', help="write the result as the new baseline")
+    parser.add_argument("--output", help="write the result to this JSON file")
+    return parser.parse_args(argv)
+
+
+def run_case(method: str, frame_count: int, subframe: bool, sample_mode: str):
+    """ one pass of the timed stages on a fresh synthetic armature; -> stage: seconds """
+    from . import synthetic
+    from ..import_mixamo_root_motion import BakeMethod, ImportMixamo, RootMotion, bone_name_mapping, get_fcurve
+    from ..profiling import FileReport
+
+    synthetic.clear_scene()
+    obj = synthetic.build_armature()
+    synthetic.build_action(obj, frame_count, subframe=subframe)
+    if method == 'BOUND_BOX':
+        synthetic.build_mesh(obj)
+    bone = lambda name: synthetic.PREFIX + name
+    main_bone_name = bone("Hips")
+
+    report = FileReport(f"{method}/{frame_count}")
+    curves = get_fcurve(obj.animation_data.action, main_bone=main_bone_name)
+    importer = ImportMixamo(obj, main_bone_name=main_bone_name, curves=curves)
+    root_motion = RootMotion(obj, main_bone_name=main_bone_name, curves=curves)
+
+    with report.stage("scale_bone_action_intensity"):
+        importer.scale_bone_action_intensity()
+    with report.stage("sample"):
+        bake_method = BakeMethod(obj, main_bone_name=main_bone_name, method=method, is_start_feet=False,
+                                 bake_x=True, bake_y=True, bake_z=False, head_top_bone_name=bone("HeadTop_End"),
+                                 spine_bone_name=bone("Spine"), left_hand_bone_name=bone("LeftHand"),
+                                 right_hand_bone_name=bone("RightHand"), left_foot_bone_name=bone("LeftFoot"),
+                                 right_foot_bone_name=bone("RightFoot"), left_toe_bone_name=bone("LeftToe_End"),
+                                 right_toe_bone_name=bone("RightToe_End"), curves=curves, sample_mode=sample_mode)
+        root_vectors, hips_vectors = bake_method.run()
+    root_motion.add_root(root_name=ROOT_NAME)
+    root_local = root_motion.vectors_world2local(ROOT_NAME, root_vectors)
+    hips_local = root_motion.vectors_world2local(main_bone_name, hips_vectors)
+    with report.stage("bake_keyframes"):
+        root_motion.bake_keyframes(bone_name=ROOT_NAME, vectors=root_local, is_local=True)
+    with report.stage("edit_keyframes"):
+        root_motion.edit_keyframes(bone_name=main_bone_name, vectors=hips_local, is_local=True)
+    with report.stage("rename_action"):
+        importer.rename_action(file_path="Synthetic Walk.fbx")
+    with report.stage("rename_bones"):
+        importer.rename_bones(bone_name_mapping(obj.data.bones.keys(), prefix_name=synthetic.PREFIX,
+                                                is_suffix_format=True))
+    return report.timings
+
+
+def compare(result: dict, baseline: dict, threshold: float) -> list:
+    """ -> (case, stage, baseline seconds, seconds) of the regressed stages """
+    regressions = []
+    for case, stages in result["cases"].items():
+        for stage, seconds in stages.items():
+            reference = baseline.get("cases", {}).get(case, {}).get(stage)
+            if reference is None:
+                continue
+            if seconds > reference * (1.0 + threshold) and seconds - reference > MIN_DELTA:
+                regressions.append((case, stage, reference, seconds))
+    return regressions
+
+
+def run(argv: list = None) -> int:
+    import bpy
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    args = parse_args(argv)
+
+    result = {"blender": bpy.app.version_string, "sample_mode": args.sample_mode, "cases": {}}
+    for frame_count in args.frames:
+        for subframe in (False, True):
+            for method in args.methods:
+                case = f"{method}/{frame_count}{'/subframe' if subframe else ''}"
+                best = {}
+                for _ in range(max(1, args.repeat)):
+                    for stage, seconds in run_case(method, frame_count, subframe, args.sample_mode).items():
+                        best[stage] = min(best.get(stage, seconds), seconds)
+                result["cases"][case] = best
+                print(f"{case:28}" + "  ".join(f"{stage} {seconds * 1000:.2f}ms" for stage, seconds in best.items()))
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+    if args.update or not os.path.exists(args.baseline):
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(result, f, indent=2)
+        print(f"baseline written to {args.baseline}")
+        return 0
+
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    regressions = compare(result, baseline, args.threshold)
+    for case, stage, reference, seconds in regressions:
+        print(f"REGRESSION {case} {stage}: {reference * 1000:.2f}ms -> {seconds * 1000:.2f}ms")
+    print(f"{len(regressions)} regressions (threshold {args.threshold:.0%})")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    ## run as a script: import the add-on folder as a package, then run this module from it
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.dirname(package_dir))
+    bench = importlib.import_module(os.path.basename(package_dir) + ".benchmarks.bench_bake")
+    sys.exit(bench.run())
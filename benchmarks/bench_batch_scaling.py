@@ -0,0 +1,141 @@
+""" End-to-end batch scaling: time per file and peak memory against the batch size
+
+blender -b --factory-startup -P <add-on folder>/benchmarks/bench_batch_scaling.py -- [options] [-- cli options]
+
+Synthetic clips (armature + skinned mesh + action) are exported once with the bundled fbx exporter,
+then every batch size runs the full import pipeline (cli.py) in a fresh Blender process. The time per
+file of the first and the last files of each batch shows growth inside a batch; the table compares
+batch sizes. Options after a second -- are passed on to cli.py (e.g. -- --method LOWEST_BONE).
+"""
+import argparse
+import importlib
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+
+def parse_args(argv: list) -> tuple:
+    """ -> benchmark arguments, cli arguments """
+    cli_args = []
+    if "--" in argv:
+        argv, cli_args = argv[:argv.index("--")], argv[argv.index("--") + 1:]
+    parser = argparse.ArgumentParser(prog="blender -b -P bench_batch_scaling.py --", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--counts", type=int, nargs='+', default=[1, 10, 50, 200, 500], help="batch sizes")
+    parser.add_argument("--frames", type=int, default=120, help="frames per clip")
+    parser.add_argument("--work", default=os.path.join(tempfile.gettempdir(), "mixamo_batch_scaling"),
+                        help="folder of the generated clips and reports; existing clips are reused")
+    parser.add_argument("--timeout", type=float, default=3600.0, help="seconds per batch")
+    parser.add_argument("--output", help="write the results to this JSON file")
+    return parser.parse_args(argv), cli_args
+
+
+def generate(folder: str, count: int, frame_count: int) -> list:
+    """ export <count> distinct clips; -> fbx paths """
+    import bpy
+    from . import synthetic
+
+    os.makedirs(folder, exist_ok=True)
+    file_paths = [os.path.join(folder, f"clip_{i:04}.fbx") for i in range(count)]
+    for i, file_path in enumerate(file_paths):
+        if os.path.exists(file_path):
+            continue
+        synthetic.clear_scene()
+        obj = synthetic.build_armature()
+        synthetic.build_mesh(obj)
+        synthetic.build_action(obj, frame_count, name=f"clip_{i:04}", offset=i * 0.37)
+        bpy.ops.export_scene.fbx(filepath=file_path, bake_anim=True, add_leaf_bones=False)
+    synthetic.clear_scene()
+    return file_paths
+
+
+def batch_folder(work: str, file_paths: list, count: int) -> str:
+    """ folder with the first <count> clips as hard links (copies where links are not supported) """
+    folder = os.path.join(work, f"batch_{count:04}")
+    shutil.rmtree(folder, ignore_errors=True)
+    os.makedirs(folder)
+    for file_path in file_paths[:count]:
+        target = os.path.join(folder, os.path.basename(file_path))
+        try:
+            os.link(file_path, target)
+        except OSError:
+            shutil.copy(file_path, target)
+    return folder
+
+
+def run_batch(folder: str, report_path: str, cli_args: list, timeout: float) -> dict:
+    """ import the folder with cli.py in a fresh Blender process; -> cli report + wall time """
+    import bpy
+
+    cli_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "cli.py")
+    command = [bpy.app.binary_path, "-b", "--factory-startup", "-P", cli_path, "--",
+               folder, "--report", report_path, "--clean"] + cli_args
+    if os.path.exists(report_path):
+        os.remove(report_path)
+    start = time.perf_counter()
+    subprocess.run(command, timeout=timeout, stdout=subprocess.DEVNULL, check=False)
+    wall_time = time.perf_counter() - start
+    if not os.path.exists(report_path):
+        ## Blender crashed before the report was written
+        return {"files": [], "failed_count": -1, "total_time": wall_time, "wall_time": wall_time}
+    with open(report_path, encoding='utf-8') as f:
+        report = json.load(f)
+    report["wall_time"] = wall_time
+    return report
+
+
+def summarize(count: int, report: dict) -> dict:
+    """ per file time of the batch and of its first / last tenth """
+    times = [file["total_time"] for file in report["files"]]
+    tenth = max(1, len(times) // 10)
+    return {
+        "count": count,
+        "failed": report["failed_count"],
+        "wall_time": report["wall_time"],
+        "total_time": report["total_time"],
+        "time_per_file": report["total_time"] / max(1, count),
+        "first_time_per_file": sum(times[:tenth]) / tenth if times else 0.0,
+        "last_time_per_file": sum(times[-tenth:]) / tenth if times else 0.0,
+        "peak_memory": report.get("peak_memory", 0),
+    }
+
+
+def run(argv: list = None) -> int:
+    import bpy
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    args, cli_args = parse_args(argv)
+    clips = generate(os.path.join(args.work, "clips"), max(args.counts), args.frames)
+
+    rows = []
+    print(f"{'files':>6} {'s/file':>8} {'first':>8} {'last':>8} {'wall s':>8} {'peak MB':>8} {'failed':>6}")
+    for count in sorted(args.counts):
+        folder = batch_folder(args.work, clips, count)
+        report = run_batch(folder, os.path.join(args.work, f"report_{count:04}.json"), cli_args, args.timeout)
+        row = summarize(count, report)
+        rows.append(row)
+        print(f"{count:6} {row['time_per_file']:8.3f} {row['first_time_per_file']:8.3f} "
+              f"{row['last_time_per_file']:8.3f} {row['wall_time']:8.1f} {row['peak_memory'] / 2 ** 20:8.0f} "
+              f"{row['failed']:6}")
+
+    ## superlinear growth: time per file of the largest batch against the smallest
+    growth = rows[-1]["time_per_file"] / rows[0]["time_per_file"] if rows[0]["time_per_file"] else 0.0
+    print(f"time per file x{growth:.2f} from {rows[0]['count']} to {rows[-1]['count']} files")
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump({"blender": bpy.app.version_string, "time": time.strftime("%Y-%m-%d %H:%M:%S"),
+                       "frames": args.frames, "cli_args": cli_args, "growth": growth, "batches": rows}, f, indent=2)
+    return 1 if any(row["failed"] for row in rows) else 0
+
+
+if __name__ == "__main__":
+    ## run as a script: import the add-on folder as a package, then run this module from it
+    package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, os.path.dirname(package_dir))
+    bench = importlib.import_module(os.path.basename(package_dir) + ".benchmarks.bench_batch_scaling")
+    sys.exit(bench.run())
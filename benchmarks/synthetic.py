@@ -0,0 +1,130 @@
+""" Synthetic Mixamo-like armatures and actions for the benchmarks (background Blender) """
+import bpy
+import math
+import numpy as np
+
+
+PREFIX = "mixamorig:"
+## name, parent, head (cm, Y up like a Mixamo fbx)
+BONES = (
+    ("Hips", None, (0, 100, 0)),
+    ("Spine", "Hips", (0, 110, 0)),
+    ("Spine1", "Spine", (0, 122, 0)),
+    ("Spine2", "Spine1", (0, 135, 0)),
+    ("Neck", "Spine2", (0, 150, 0)),
+    ("Head", "Neck", (0, 160, 0)),
+    ("HeadTop_End", "Head", (0, 180, 0)),
+    ("LeftShoulder", "Spine2", (6, 145, 0)),
+    ("LeftArm", "LeftShoulder", (18, 145, 0)),
+    ("LeftForeArm", "LeftArm", (45, 145, 0)),
+    ("LeftHand", "LeftForeArm", (70, 145, 0)),
+    ("RightShoulder", "Spine2", (-6, 145, 0)),
+    ("RightArm", "RightShoulder", (-18, 145, 0)),
+    ("RightForeArm", "RightArm", (-45, 145, 0)),
+    ("RightHand", "RightForeArm", (-70, 145, 0)),
+    ("LeftUpLeg", "Hips", (9, 95, 0)),
+    ("LeftLeg", "LeftUpLeg", (9, 52, 0)),
+    ("LeftFoot", "LeftLeg", (9, 10, 0)),
+    ("LeftToeBase", "LeftFoot", (9, 2, 10)),
+    ("LeftToe_End", "LeftToeBase", (9, 2, 18)),
+    ("RightUpLeg", "Hips", (-9, 95, 0)),
+    ("RightLeg", "RightUpLeg", (-9, 52, 0)),
+    ("RightFoot", "RightLeg", (-9, 10, 0)),
+    ("RightToeBase", "RightFoot", (-9, 2, 10)),
+    ("RightToe_End", "RightToeBase", (-9, 2, 18)),
+)
+
+
+def build_armature(name: str = "Armature"):
+    """ armature object with the Mixamo object transform (rotation X 90°, scale 0.01) """
+    data = bpy.data.armatures.new(name)
+    obj = bpy.data.objects.new(name, data)
+    bpy.context.scene.collection.objects.link(obj)
+    obj.rotation_euler = (math.radians(90), 0, 0)
+    obj.scale = (0.01, 0.01, 0.01)
+    bpy.context.view_layer.objects.active = obj
+
+    bpy.ops.object.mode_set(mode='EDIT', toggle=False)
+    heads = {n: head for n, _, head in BONES}
+    children = {}
+    for n, parent, _ in BONES:
+        children.setdefault(parent, n)
+    for n, parent, head in BONES:
+        bone = data.edit_bones.new(PREFIX + n)
+        bone.head = head
+        child = children.get(n)
+        bone.tail = heads[child] if child else (head[0], head[1] + 5, head[2])
+        if parent:
+            bone.parent = data.edit_bones[PREFIX + parent]
+    bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+    return obj
+
+
+def build_action(obj, frame_count: int, subframe: bool = False, name: str = "Synthetic", offset: float = 0.0):
+    """ dense keys on every channel of every bone like a Mixamo clip; subframe: keys every half frame,
+    offset: phase shift so that generated clips differ """
+    from .. import curve_io
+
+    obj.animation_data_create()
+    action = bpy.data.actions.new(name)
+    obj.animation_data.action = action
+    if bpy.app.version >= (4, 4, 0):
+        slot = action.slots.new(id_type='OBJECT', name=obj.name)
+        action.layers.new("Layer").strips.new(type='KEYFRAME')
+        obj.animation_data.action_slot = slot
+
+    step = 0.5 if subframe else 1.0
+    frames = 1.0 + np.arange(frame_count) * step
+    phase = frames / 30.0 * 2 * math.pi + offset
+    for i, (n, _, _) in enumerate(BONES):
+        bone_name = PREFIX + n
+        data_path = f'pose.bones["{bone_name}"]'
+        if n == "Hips":
+            location = np.stack((np.sin(phase) * 3, np.abs(np.sin(phase)) * 4, frames * 4.0), axis=1)
+            for index, fcurve in enumerate(curve_io.new_fcurves(action, data_path + ".location", 3, bone_name)):
+                curve_io.write_keyframes(fcurve, frames, location[:, index])
+        angle = np.sin(phase + i) * 0.2
+        rotation = np.stack((np.cos(angle), np.sin(angle), np.zeros_like(angle), np.zeros_like(angle)), axis=1)
+        for index, fcurve in enumerate(curve_io.new_fcurves(action, data_path + ".rotation_quaternion", 4, bone_name)):
+            curve_io.write_keyframes(fcurve, frames, rotation[:, index])
+    return action
+
+
+def build_mesh(obj, rings: int = 8, segments: int = 16, radius: float = 4.0):
+    """ skinned tube around every bone, rigidly weighted to it, parented to the armature like a Mixamo character """
+    heads = {n: np.array(head, dtype=np.float64) for n, _, head in BONES}
+    children = {}
+    for n, parent, _ in BONES:
+        children.setdefault(parent, n)
+    angles = np.linspace(0, 2 * math.pi, segments, endpoint=False)
+    circle = np.stack((np.cos(angles), np.zeros(segments), np.sin(angles)), axis=1) * radius
+
+    vertices, faces, groups = [], [], []
+    for n, _, _ in BONES:
+        head = heads[n]
+        tail = heads[children[n]] if n in children else head + (0, 5, 0)
+        start = len(vertices)
+        for t in np.linspace(0.0, 1.0, rings):
+            vertices.extend(head + (tail - head) * t + circle)
+        for r in range(rings - 1):
+            for s in range(segments):
+                a, b = start + r * segments + s, start + r * segments + (s + 1) % segments
+                faces.append((a, b, b + segments, a + segments))
+        groups.append((n, range(start, len(vertices))))
+
+    mesh = bpy.data.meshes.new(obj.name + "_Body")
+    mesh.from_pydata([tuple(v) for v in vertices], [], faces)
+    body = bpy.data.objects.new(mesh.name, mesh)
+    bpy.context.scene.collection.objects.link(body)
+    body.parent = obj
+    for n, indices in groups:
+        body.vertex_groups.new(name=PREFIX + n).add(list(indices), 1.0, 'REPLACE')
+    body.modifiers.new("Armature", 'ARMATURE').object = obj
+    return body
+
+
+def clear_scene():
+    """ remove all objects, meshes, armatures and actions """
+    bpy.data.batch_remove(list(bpy.data.objects) + list(bpy.data.meshes) + list(bpy.data.armatures)
+                          + list(bpy.data.actions))
+    return {'FINISHED'}
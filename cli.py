@@ -0,0 +1,153 @@
+""" Headless batch import
+
+blender -b -P <add-on folder>/cli.py -- [options] inputs...
+
+inputs are fbx files, folders or glob patterns; every option of the import operator is available
+as --<property> (e.g. --method LOWEST_BONE --bake_z true). The result is saved with --output (.blend)
+and/or --export (.fbx), --report writes a JSON report with the status, frame count, stage timings
+and error of every file and the peak memory of the run.
+"""
+import argparse
+import glob
+import importlib
+import json
+import os
+import sys
+import time
+
+
+## options of the operator that make no sense on the command line
+IGNORE_PROPERTIES = ("files", "directory", "filter_glob", "filepath", "use_modal", "is_invoked",
+                     "is_sync_folder", "sync_deleted", "is_watch_folder", "watch_interval")
+
+
+def _bool(value: str) -> bool:
+    if value.lower() in ('1', 'true', 'yes', 'on'):
+        return True
+    if value.lower() in ('0', 'false', 'no', 'off'):
+        return False
+    raise argparse.ArgumentTypeError(f"expected a boolean, got {value!r}")
+
+
+def build_parser(operator_class) -> argparse.ArgumentParser:
+    """ one argument per operator property, defaults and help come from the property definition """
+    from bpy.props import BoolProperty, EnumProperty, FloatProperty, IntProperty, StringProperty
+
+    parser = argparse.ArgumentParser(prog="blender -b -P cli.py --", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs='+', help="fbx files, folders or glob patterns")
+    parser.add_argument("--output", help="save the result as .blend")
+    parser.add_argument("--export", help="export the result as .fbx")
+    parser.add_argument("--report", help="write a JSON report")
+    parser.add_argument("--clean", action='store_true', help="remove all objects of the startup scene first")
+    parser.add_argument("--clear-cache", action='store_true', help="clear the bake cache before importing")
+    parser.add_argument("--cache-dir",
+                        help="bake cache folder; default: $MIXAMO_BAKE_CACHE_DIR, the one of the installed extension")
+    parser.add_argument("--scene-fps", type=float, default=0.0,
+                        help="frame rate of --resample_mode SCENE; default: the scene of the opened .blend")
+
+    types = {BoolProperty: _bool, IntProperty: int, FloatProperty: float, StringProperty: str}
+    for name, prop in operator_class.__annotations__.items():
+        if name in IGNORE_PROPERTIES:
+            continue
+        keywords = prop.keywords
+        if prop.function is EnumProperty:
+            parser.add_argument(f"--{name}", choices=[item[0] for item in keywords["items"]],
+                                default=keywords.get("default"), help=keywords.get("description"))
+        elif prop.function in types:
+            parser.add_argument(f"--{name}", type=types[prop.function],
+                                default=keywords.get("default"), help=keywords.get("description"))
+    return parser
+
+
+def expand_inputs(inputs: list) -> list:
+    """ files, folders (*.fbx) and glob patterns -> sorted unique fbx paths """
+    file_paths = set()
+    for item in inputs:
+        if os.path.isdir(item):
+            file_paths.update(glob.glob(os.path.join(item, "*.fbx")) + glob.glob(os.path.join(item, "*.FBX")))
+        elif os.path.isfile(item):
+            file_paths.add(item)
+        else:
+            file_paths.update(glob.glob(item, recursive=True))
+    return sorted(os.path.abspath(f) for f in file_paths if f.lower().endswith(".fbx"))
+
+
+def run(argv: list = None) -> int:
+    """ parse the command line, import every file, save / export, write the report; -> exit code """
+    import bpy
+    from . import bake_cache, batch_workers
+    from . import profiling
+    from .import_mixamo_root_motion import BATCH_PROPERTIES, BatchImport, main
+    from .profiling import FileReport
+
+    if argv is None:
+        argv = sys.argv[sys.argv.index("--") + 1:] if "--" in sys.argv else []
+    parser = build_parser(BatchImport)
+    args = parser.parse_args(argv)
+
+    file_paths = expand_inputs(args.inputs)
+    options = {name: getattr(args, name) for name in BatchImport.__annotations__ if hasattr(args, name)}
+    batch = {name: options.pop(name) for name in BATCH_PROPERTIES if name in options}
+
+    context = bpy.context
+    if args.clean:
+        bpy.data.batch_remove(list(context.scene.objects))
+    if args.cache_dir:
+        bake_cache.set_cache_dir(args.cache_dir)
+    if args.clear_cache:
+        print(f"bake cache: removed {bake_cache.clear()} entries")
+    ## read once, the imports change the frame rate of the scene
+    options["scene_fps"] = args.scene_fps or context.scene.render.fps / context.scene.render.fps_base
+
+    start = time.perf_counter()
+    reports = []
+    if batch["use_parallel"] and len(file_paths) > 1:
+        results = batch_workers.run_parallel(context, file_paths, options=options,
+                                             worker_count=batch["worker_count"],
+                                             shard_by_size=batch["shard_by_size"],
+                                             file_timeout=batch["file_timeout"])
+        reports = [FileReport.from_dict(results.get(f, {"file": f, "status": 'FAILED', "error": "no result"}))
+                   for f in file_paths]
+    else:
+        for file_path in file_paths:
+            report = FileReport(file_path)
+            if batch["profile_file_name"] and os.path.basename(file_path) == batch["profile_file_name"]:
+                with profiling.profile(os.path.splitext(file_path)[0] + ".prof"):
+                    main(context, file_path=file_path, report=report, **options)
+            else:
+                main(context, file_path=file_path, report=report, **options)
+            reports.append(report)
+            print(f"{report.status:6} {report.total_time:8.3f}s  {file_path}")
+    if batch["is_profile"]:
+        print(profiling.summary(reports))
+    if batch["trace_path"]:
+        profiling.write_trace(reports, batch["trace_path"])
+
+    if args.output:
+        bpy.ops.wm.save_as_mainfile(filepath=os.path.abspath(args.output))
+    if args.export:
+        bpy.ops.export_scene.fbx(filepath=os.path.abspath(args.export), bake_anim=True)
+
+    failed = sum(report.status != 'OK' for report in reports)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump({
+                "blender": bpy.app.version_string,
+                "options": options,
+                "total_time": time.perf_counter() - start,
+                "file_count": len(reports),
+                "failed_count": failed,
+                "peak_memory": profiling.peak_memory_usage(),
+                "files": [report.as_dict() for report in reports],
+            }, f, indent=2)
+    print(f"{len(reports) - failed} / {len(reports)} files imported")
+    return 1 if failed or not reports else 0
+
+
+if __name__ == "__main__":
+    ## run as a script (blender -P cli.py): import the add-on folder as a package, then run its cli module
+    package_dir = os.path.dirname(os.path.abspath(__file__))
+    sys.path.insert(0, os.path.dirname(package_dir))
+    cli = importlib.import_module(os.path.basename(package_dir) + ".cli")
+    sys.exit(cli.run())
@@ -0,0 +1,188 @@
+""" Bulk F-Curve access; foreach_get / foreach_set instead of per keyframe python calls """
+import hashlib
+import re
+import bpy
+import numpy as np
+
+from bpy.types import Action, FCurve
+from . import trajectory
+
+
+## rest value of the transform channels, a static channel at this value is removed
+DEFAULT_VALUES = {
+    "location": (0.0, 0.0, 0.0),
+    "rotation_quaternion": (1.0, 0.0, 0.0, 0.0),
+    "rotation_axis_angle": (0.0, 0.0, 1.0, 0.0),
+    "rotation_euler": (0.0, 0.0, 0.0),
+    "scale": (1.0, 1.0, 1.0),
+}
+
+
+def get_channelbag(action: Action, ensure: bool = False):
+    """ channelbag (4.4+) or the action itself, both own .fcurves; According to the method obtained by switching versions """
+    if bpy.app.version >= (4, 4, 0):
+        ## When importing an FBX file, the slot and strip automatically created by Blender are set to the first one by default.
+        slot = action.slots[0]
+        strip = action.layers[0].strips[0]
+        return strip.channelbag(slot, ensure=ensure)
+    return action
+
+
+## pose.bones["<escaped name>"] at the start of a data path
+_BONE_PATH = re.compile(r'^pose\.bones\["((?:[^"\\]|\\.)*)"\]')
+
+
+def rename_bone_paths(action: Action, mapping: dict):
+    """ rewrite the pose bone data paths and the group names of the action; mapping: old bone name -> new name """
+    escaped = {bpy.utils.escape_identifier(old): bpy.utils.escape_identifier(new) for old, new in mapping.items()}
+    channelbag = get_channelbag(action)
+    for fcurve in channelbag.fcurves:
+        match = _BONE_PATH.match(fcurve.data_path)
+        if match and match.group(1) in escaped:
+            fcurve.data_path = f'pose.bones["{escaped[match.group(1)]}"]' + fcurve.data_path[match.end():]
+    for group in channelbag.groups:
+        if group.name in mapping:
+            group.name = mapping[group.name]
+    return {'FINISHED'}
+
+
+def _enum_value(struct, prop: str, identifier: str) -> int:
+    """ enum identifier -> int, used by foreach_set """
+    return struct.bl_rna.properties[prop].enum_items[identifier].value
+
+
+def new_fcurves(action: Action, data_path: str, count: int, group: str) -> list:
+    """ create (or recreate) the fcurves of an array property, e.g. pose.bones["root"].location """
+    owner = get_channelbag(action, ensure=True)
+    fcurves = owner.fcurves
+    for index in range(count):
+        fcurve = fcurves.find(data_path, index=index)
+        if fcurve is not None:
+            fcurves.remove(fcurve)
+
+    if bpy.app.version >= (4, 4, 0):
+        action_group = owner.groups.get(group) or owner.groups.new(group)
+        curves = [fcurves.new(data_path, index=index) for index in range(count)]
+        for fcurve in curves:
+            fcurve.group = action_group
+        return curves
+    return [fcurves.new(data_path, index=index, action_group=group) for index in range(count)]
+
+
+def write_keyframes(fcurve: FCurve, frames, values, interpolation: str = None, handle_type: str = None):
+    """ replace all keyframes of the fcurve: one add(), a few foreach_set() and a single update() """
+    prefs = bpy.context.preferences.edit
+    interpolation = interpolation or prefs.keyframe_new_interpolation_type
+    handle_type = handle_type or prefs.keyframe_new_handle_type
+
+    co = np.empty((len(frames), 2), dtype=np.float32)
+    co[:, 0] = frames
+    co[:, 1] = values
+    co = co.ravel()
+
+    points = fcurve.keyframe_points
+    if len(points):
+        points.clear()
+    points.add(len(frames))
+    points.foreach_set('co', co)
+    ## handles are recalculated by update(), start them on the key
+    points.foreach_set('handle_left', co)
+    points.foreach_set('handle_right', co)
+    points.foreach_set('interpolation',
+                       [_enum_value(bpy.types.Keyframe, 'interpolation', interpolation)] * len(frames))
+    handle_value = _enum_value(bpy.types.Keyframe, 'handle_left_type', handle_type)
+    points.foreach_set('handle_left_type', [handle_value] * len(frames))
+    points.foreach_set('handle_right_type', [handle_value] * len(frames))
+    fcurve.update()
+    return {'FINISHED'}
+
+
+def get_location_fcurves(action: Action, bone_name: str) -> tuple:
+    """ location x/y/z fcurves of a pose bone, resolved in one call """
+    fcurves = get_channelbag(action).fcurves
+    data_path = f'pose.bones["{bone_name}"].location'
+    return tuple(fcurves.find(data_path, index=index) for index in range(3))
+
+
+def read_keyframes(fcurve: FCurve):
+    """ -> co, handle_left, handle_right; three (n,2) float32 buffers """
+    points = fcurve.keyframe_points
+    buffers = []
+    for prop in ('co', 'handle_left', 'handle_right'):
+        buffer = np.empty(len(points) * 2, dtype=np.float32)
+        points.foreach_get(prop, buffer)
+        buffers.append(buffer.reshape(-1, 2))
+    return tuple(buffers)
+
+
+def write_keyframes_data(fcurve: FCurve, co, handle_left, handle_right):
+    """ write co / handles back, the number of keyframes must not change """
+    points = fcurve.keyframe_points
+    points.foreach_set('co', np.ascontiguousarray(co, dtype=np.float32).ravel())
+    points.foreach_set('handle_left', np.ascontiguousarray(handle_left, dtype=np.float32).ravel())
+    points.foreach_set('handle_right', np.ascontiguousarray(handle_right, dtype=np.float32).ravel())
+    return {'FINISHED'}
+
+
+def scale_values(fcurve: FCurve, factor: float):
+    """ value *= factor, handles are scaled with the keys """
+    co, handle_left, handle_right = read_keyframes(fcurve)
+    co[:, 1] *= factor
+    handle_left[:, 1] *= factor
+    handle_right[:, 1] *= factor
+    return write_keyframes_data(fcurve, co, handle_left, handle_right)
+
+
+def set_values(fcurve: FCurve, values):
+    """ overwrite the key values, handles are shifted together with their key """
+    co, handle_left, handle_right = read_keyframes(fcurve)
+    delta = np.asarray(values, dtype=np.float32)[:len(co)] - co[:, 1]
+    co[:, 1] += delta
+    handle_left[:, 1] += delta
+    handle_right[:, 1] += delta
+    return write_keyframes_data(fcurve, co, handle_left, handle_right)
+
+
+def reduce_action(action: Action, location: float, rotation: float, scale: float) -> tuple:
+    """ remove keys within the tolerance of every transform channel; the reduced curves are linear
+
+    Static channels at their rest value are removed, other static channels keep one key.
+    return: keyframe count before, after
+    """
+    tolerances = {"location": location, "rotation_quaternion": rotation, "rotation_axis_angle": rotation,
+                  "rotation_euler": rotation, "scale": scale}
+    fcurves = get_channelbag(action).fcurves
+    before = after = 0
+    for fcurve in list(fcurves):
+        prop = fcurve.data_path.rpartition('.')[2]
+        count = len(fcurve.keyframe_points)
+        before += count
+        if prop not in tolerances or count < 2 or len(fcurve.modifiers):
+            after += count
+            continue
+        co = read_keyframes(fcurve)[0].astype(np.float64)
+        tolerance = tolerances[prop]
+        if np.ptp(co[:, 1]) <= tolerance:
+            default = DEFAULT_VALUES[prop][fcurve.array_index]
+            if np.abs(co[:, 1] - default).max() <= tolerance:
+                fcurves.remove(fcurve)
+                continue
+            keep = np.arange(1)
+        else:
+            keep = trajectory.reduce_keyframes(co[:, 0], co[:, 1], tolerance)
+        if len(keep) < count:
+            write_keyframes(fcurve, co[keep, 0], co[keep, 1], interpolation='LINEAR')
+        after += len(keep)
+    return before, after
+
+
+def fingerprint(action: Action, salt: str = "", decimals: int = 4) -> str:
+    """ hash of the keyframes of all fcurves rounded to <decimals>; fbx metadata and float noise do not change it """
+    digest = hashlib.sha1(salt.encode())
+    fcurves = sorted(get_channelbag(action).fcurves, key=lambda c: (c.data_path, c.array_index))
+    for fcurve in fcurves:
+        co = read_keyframes(fcurve)[0].astype(np.float64)
+        digest.update(f"{fcurve.data_path}[{fcurve.array_index}]".encode())
+        ## + 0.0: -0.0 and 0.0 hash the same
+        digest.update(np.ascontiguousarray(np.round(co, decimals) + 0.0).tobytes())
+    return digest.hexdigest()
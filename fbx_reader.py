@@ -0,0 +1,289 @@
+""" Streaming reader for binary fbx files: bone translation curves and clip metadata without bpy
+
+Only the node records needed for the animation are parsed (global settings, models, animation curves,
+connections); geometry, materials and embedded textures are skipped by their end offset, arrays are
+decompressed on first access.
+
+python fbx_reader.py [--bone mixamorig:Hips] [--json report.json] inputs...
+"""
+import argparse
+import json
+import os
+import struct
+import sys
+import zlib
+import numpy as np
+
+
+MAGIC = b"Kaydara FBX Binary  \x00"
+TICKS_PER_SECOND = 46186158000
+## GlobalSettings TimeMode -> fps, <= 0: use CustomFrameRate
+FRAME_RATES = (-1.0, 120.0, 100.0, 60.0, 50.0, 48.0, 30.0, 30.0, 30000 / 1001, 30000 / 1001, 25.0, 24.0,
+               -1.0, 24000 / 1001, -1.0, 96.0, 72.0, 60000 / 1001, 120000 / 1001)
+_SCALARS = {b'Y': ('<h', 2), b'C': ('<?', 1), b'I': ('<i', 4), b'F': ('<f', 4), b'D': ('<d', 8), b'L': ('<q', 8)}
+_ARRAYS = {b'f': '<f4', b'd': '<f8', b'l': '<i8', b'i': '<i4', b'b': '<?'}
+## node records that are parsed, None: everything below
+ALL = None
+ANIMATION_NODES = {
+    "GlobalSettings": ALL,
+    "Objects": {"Model": ALL, "AnimationStack": ALL, "AnimationCurveNode": ALL, "AnimationCurve": ALL},
+    "Connections": ALL,
+}
+
+
+class LazyArray():
+    """ array property, read and decompressed on first access """
+    def __init__(self, f, offset: int, dtype: str, length: int, encoding: int, size: int):
+        self.f, self.offset, self.dtype = f, offset, dtype
+        self.length, self.encoding, self.size = length, encoding, size
+        self._value = None
+
+    def decode(self) -> np.ndarray:
+        if self._value is None:
+            self.f.seek(self.offset)
+            data = self.f.read(self.size)
+            if self.encoding == 1:
+                data = zlib.decompress(data)
+            self._value = np.frombuffer(data, dtype=self.dtype, count=self.length)
+        return self._value
+
+
+class FbxNode():
+    def __init__(self, name: str, props: list, children: list):
+        self.name = name
+        self.props = props
+        self.children = children
+
+    def child(self, name: str):
+        return next((c for c in self.children if c.name == name), None)
+
+    def value(self, index: int = 0):
+        """ property value; arrays are decoded, strings are returned as str """
+        value = self.props[index]
+        if isinstance(value, LazyArray):
+            return value.decode()
+        if isinstance(value, bytes):
+            return value.decode('utf-8', errors='replace')
+        return value
+
+    def properties70(self) -> dict:
+        """ Properties70 name: value(s) """
+        props = self.child("Properties70")
+        if props is None:
+            return {}
+        values = {}
+        for p in props.children:
+            items = [p.value(i) for i in range(4, len(p.props))]
+            values[p.value(0)] = items[0] if len(items) == 1 else tuple(items)
+        return values
+
+
+def _read_property(f):
+    code = f.read(1)
+    if code in _SCALARS:
+        fmt, size = _SCALARS[code]
+        return struct.unpack(fmt, f.read(size))[0]
+    if code in (b'S', b'R'):
+        size, = struct.unpack('<I', f.read(4))
+        return f.read(size)
+    if code in _ARRAYS:
+        length, encoding, size = struct.unpack('<III', f.read(12))
+        array = LazyArray(f, f.tell(), _ARRAYS[code], length, encoding, size)
+        f.seek(size, 1)
+        return array
+    raise ValueError(f"unknown fbx property type {code!r} at {f.tell() - 1}")
+
+
+def _read_node(f, wide: bool, wanted):
+    """ -> FbxNode, False for a skipped record, None at the end of a node list """
+    end, count, length, name_length = struct.unpack('<QQQB' if wide else '<IIIB', f.read(25 if wide else 13))
+    if end == 0:
+        return None
+    name = f.read(name_length).decode('ascii', errors='replace')
+    if wanted is not ALL and name not in wanted:
+        f.seek(end)
+        return False
+    props_start = f.tell()
+    props = [_read_property(f) for _ in range(count)]
+    f.seek(props_start + length)
+    children = []
+    if f.tell() < end:
+        below = ALL if wanted is ALL else wanted[name]
+        while True:
+            child = _read_node(f, wide, below)
+            if child is None:
+                break
+            if child is not False:
+                children.append(child)
+    f.seek(end)
+    return FbxNode(name, props, children)
+
+
+class FbxFile():
+    """ open binary fbx; the file stays open for the lazy arrays until close() """
+    def __init__(self, path: str, wanted: dict = ANIMATION_NODES):
+        self.path = path
+        self.f = open(path, 'rb')
+        try:
+            header = self.f.read(27)
+            if not header.startswith(MAGIC):
+                raise ValueError(f"not a binary fbx file: {path}")
+            self.version, = struct.unpack('<I', header[23:27])
+            wide = self.version >= 7500
+            size = os.fstat(self.f.fileno()).st_size
+            self.nodes = []
+            while self.f.tell() < size:
+                node = _read_node(self.f, wide, wanted)
+                if node is None:
+                    break
+                if node is not False:
+                    self.nodes.append(node)
+        except Exception:
+            self.f.close()
+            raise
+
+    def node(self, name: str):
+        return next((n for n in self.nodes if n.name == name), None)
+
+    def close(self):
+        self.f.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+def _object_name(value: str) -> str:
+    """ 'mixamorig:Hips\\x00\\x01Model' -> 'mixamorig:Hips' """
+    return value.split("\x00\x01")[0]
+
+
+def frame_rate(settings: dict) -> float:
+    mode = settings.get("TimeMode", 0)
+    fps = FRAME_RATES[mode] if 0 <= mode < len(FRAME_RATES) else -1.0
+    return fps if fps > 0 else float(settings.get("CustomFrameRate", 30.0) or 30.0)
+
+
+def read_bone_animation(path: str, bone_name: str = "mixamorig:Hips") -> dict:
+    """ translation curve of a bone in its parent space (fbx units) and the clip settings
+
+    return: times (N,) seconds, translation (N,3), rest transform (Lcl Translation / Rotation / Scaling,
+    PreRotation), fps, up axis, unit scale (cm per unit), start / stop of the first take in seconds
+    """
+    with FbxFile(path) as fbx:
+        settings = fbx.node("GlobalSettings").properties70() if fbx.node("GlobalSettings") else {}
+        objects = fbx.node("Objects")
+        models, curve_nodes, curves, stacks = {}, {}, {}, []
+        for node in objects.children if objects else ():
+            if node.name == "Model":
+                models[node.value(0)] = node
+            elif node.name == "AnimationCurveNode":
+                curve_nodes[node.value(0)] = node
+            elif node.name == "AnimationCurve":
+                curves[node.value(0)] = node
+            elif node.name == "AnimationStack":
+                stacks.append(node)
+
+        model_id = next((i for i, m in models.items() if _object_name(m.value(1)) == bone_name), None)
+        if model_id is None:
+            raise KeyError(f"bone not found: {bone_name}")
+        model = models[model_id].properties70()
+        rest = {name: np.array(model.get(name, default), dtype=np.float64)
+                for name, default in (("Lcl Translation", (0.0, 0.0, 0.0)), ("Lcl Rotation", (0.0, 0.0, 0.0)),
+                                      ("Lcl Scaling", (1.0, 1.0, 1.0)), ("PreRotation", (0.0, 0.0, 0.0)))}
+
+        ## connections: curve -(d|X)-> curve node -(Lcl Translation)-> model
+        translation_node, axis_curves = None, {}
+        connections = fbx.node("Connections")
+        links = [(c.value(0), c.value(1), c.value(2), c.value(3) if len(c.props) > 3 else "")
+                 for c in (connections.children if connections else ())]
+        for kind, child, parent, prop in links:
+            if kind == "OP" and parent == model_id and prop == "Lcl Translation" and child in curve_nodes:
+                translation_node = child
+                break
+        for kind, child, parent, prop in links:
+            if kind == "OP" and parent == translation_node and child in curves and prop in ("d|X", "d|Y", "d|Z"):
+                curve = curves[child]
+                axis_curves["XYZ".index(prop[-1])] = (curve.child("KeyTime").value().astype(np.float64)
+                                                      / TICKS_PER_SECOND,
+                                                      curve.child("KeyValueFloat").value().astype(np.float64))
+
+        start = stop = None
+        if stacks:
+            take = stacks[0].properties70()
+            if "LocalStart" in take and "LocalStop" in take:
+                start, stop = take["LocalStart"] / TICKS_PER_SECOND, take["LocalStop"] / TICKS_PER_SECOND
+
+    times = np.unique(np.concatenate([t for t, _ in axis_curves.values()])) if axis_curves else np.zeros(1)
+    translation = np.tile(rest["Lcl Translation"], (len(times), 1))
+    for axis, (key_times, values) in axis_curves.items():
+        translation[:, axis] = np.interp(times, key_times, values)
+    if start is None:
+        start, stop = float(times[0]), float(times[-1])
+    return {
+        "times": times,
+        "translation": translation,
+        "rest": rest,
+        "fps": frame_rate(settings),
+        "up_axis": int(settings.get("UpAxis", 1)),
+        "unit_scale": float(settings.get("UnitScaleFactor", 1.0)),
+        "start": start,
+        "stop": stop,
+    }
+
+
+def analyze(path: str, bone_name: str = "mixamorig:Hips") -> dict:
+    """ clip metadata: duration, frames, key count and the distance the bone travels on the ground plane (meters) """
+    animation = read_bone_animation(path, bone_name=bone_name)
+    ground = [axis for axis in range(3) if axis != animation["up_axis"]]
+    ## copy_for_main_bone style: ground plane trajectory relative to the first key, in meters
+    trajectory = (animation["translation"][:, ground] - animation["translation"][0, ground]) \
+                 * animation["unit_scale"] / 100.0
+    distance = float(np.linalg.norm(np.diff(trajectory, axis=0), axis=1).sum())
+    duration = animation["stop"] - animation["start"]
+    return {
+        "file": path,
+        "fps": animation["fps"],
+        "duration": duration,
+        "frame_count": int(round(duration * animation["fps"])) + 1,
+        "key_count": len(animation["times"]),
+        "distance": distance,
+        "displacement": float(np.linalg.norm(trajectory[-1])),
+        "speed": distance / duration if duration > 0 else 0.0,
+    }
+
+
+def main(argv: list = None) -> int:
+    parser = argparse.ArgumentParser(prog="python fbx_reader.py", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("inputs", nargs='+', help="fbx files, folders or glob patterns")
+    parser.add_argument("--bone", default="mixamorig:Hips", help="bone of the trajectory")
+    parser.add_argument("--json", help="write the results to this JSON file")
+    args = parser.parse_args(argv)
+
+    if __package__:
+        from .cli import expand_inputs
+    else:
+        from cli import expand_inputs
+    results, failed = [], 0
+    print(f"{'fps':>6} {'seconds':>8} {'keys':>6} {'distance':>9} {'speed':>7}  file")
+    for path in expand_inputs(args.inputs):
+        try:
+            result = analyze(path, bone_name=args.bone)
+        except (OSError, ValueError, KeyError, struct.error, zlib.error) as e:
+            failed += 1
+            print(f"FAILED {path}: {e}")
+            continue
+        results.append(result)
+        print(f"{result['fps']:6.2f} {result['duration']:8.2f} {result['key_count']:6} "
+              f"{result['distance']:8.2f}m {result['speed']:5.2f}m/s  {os.path.basename(path)}")
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+""" Folder sync: import only new / changed fbx files; the manifest is stored in the .blend as a text block """
+import bpy
+import json
+import os
+import time
+
+from contextlib import nullcontext
+from bpy.app.handlers import persistent
+from bpy.types import Context
+from . import bake_cache, library, scene_utils
+
+
+MANIFEST_NAME = "mixamo_sync_manifest.json"
+MISSING_PROP = "mixamo_source_missing"
+LOG_LENGTH = 50
+## name suffix of the actions of a changed file during its re-import
+OLD_SUFFIX = ".sync_old"
+
+## directory: bpy.app.timers function
+_watches = {}
+
+
+def load_manifest() -> dict:
+    text = bpy.data.texts.get(MANIFEST_NAME)
+    if text is None or not text.as_string().strip():
+        return {"folders": {}, "log": []}
+    return json.loads(text.as_string())
+
+
+def save_manifest(manifest: dict):
+    text = bpy.data.texts.get(MANIFEST_NAME) or bpy.data.texts.new(MANIFEST_NAME)
+    text.from_string(json.dumps(manifest, indent=1))
+    return {'FINISHED'}
+
+
+def scan(directory: str) -> dict:
+    """ file name: (mtime, size) of the fbx files in the folder """
+    files = {}
+    for entry in os.scandir(directory):
+        if entry.is_file() and entry.name.lower().endswith(".fbx"):
+            stat = entry.stat()
+            files[entry.name] = (stat.st_mtime, stat.st_size)
+    return files
+
+
+def plan(directory: str, known: dict) -> tuple:
+    """ -> new, changed, deleted file names; a changed mtime/size with the same hash only updates the manifest """
+    files = scan(directory)
+    new = sorted(name for name in files if name not in known)
+    deleted = sorted(name for name in known if name not in files)
+    changed = []
+    for name in sorted(set(files) & set(known)):
+        mtime, size = files[name]
+        entry = known[name]
+        if (mtime, size) == (entry["mtime"], entry["size"]):
+            continue
+        if bake_cache.file_hash(os.path.join(directory, name)) != entry["hash"]:
+            changed.append(name)
+        else:
+            entry["mtime"], entry["size"] = mtime, size
+    return new, changed, deleted
+
+
+def remove_actions(names: list, on_deleted: str):
+    """ REMOVE: delete the actions; FLAG: keep them, marked with a custom property """
+    for name in names:
+        action = bpy.data.actions.get(name)
+        if action is None:
+            continue
+        if on_deleted == 'REMOVE':
+            bpy.data.actions.remove(action)
+        else:
+            action[MISSING_PROP] = True
+    return {'FINISHED'}
+
+
+def set_aside_actions(names: list) -> list:
+    """ rename the actions of a changed file, its re-import gets the old names; -> (action, old name) """
+    actions = [(bpy.data.actions[name], name) for name in names if name in bpy.data.actions]
+    for action, name in actions:
+        action.name = name + OLD_SUFFIX
+    return actions
+
+
+def restore_actions(actions: list):
+    """ the re-import failed: the actions set aside get their names back """
+    for action, name in actions:
+        action.name = name
+    return {'FINISHED'}
+
+
+def replace_actions(actions: list, new_names: list):
+    """ the re-import succeeded: remove the old actions and the armatures of the old import;
+    a library armature is kept, it drops the NLA tracks of the old actions and gets the new action """
+    old = {action for action, _ in actions}
+    new_action = bpy.data.actions.get(new_names[0]) if new_names else None
+    for obj in list(bpy.data.objects):
+        if obj.type != 'ARMATURE' or obj.animation_data is None:
+            continue
+        if library.SIGNATURE_PROP in obj:
+            library.unstash(obj, old)
+            if obj.animation_data.action in old:
+                obj.animation_data.action = new_action
+        elif obj.animation_data.action in old:
+            scene_utils.remove_hierarchy(obj)
+    for action in old:
+        bpy.data.actions.remove(action)
+    return {'FINISHED'}
+
+
+def sync(context: Context, directory: str, options: dict, on_deleted: str = 'FLAG') -> dict:
+    """ import new and changed files of the folder, remove / flag the actions of deleted files """
+    from .import_mixamo_root_motion import main
+    from .profiling import FileReport
+
+    directory = os.path.abspath(bpy.path.abspath(directory))
+    manifest = load_manifest()
+    known = manifest["folders"].setdefault(directory, {})
+    new, changed, deleted = plan(directory, known)
+
+    failed = []
+    for name in new + changed:
+        file_path = os.path.join(directory, name)
+        ## changed files replace their old actions once the re-import succeeded
+        old_actions = set_aside_actions(known[name]["actions"] if name in known else [])
+        report = FileReport(file_path)
+        main(context, file_path=file_path, report=report, **options)
+        if report.status != 'OK':
+            ## keep the old actions and the manifest entry, the file is retried by the next sync
+            failed.append(name)
+            restore_actions(old_actions)
+            continue
+        if report.duplicate_of in {action.name for action, _ in old_actions}:
+            ## same animation as before the change: keep the old actions
+            restore_actions(old_actions)
+            report.actions = [old_name for _, old_name in old_actions]
+        else:
+            replace_actions(old_actions, report.actions)
+        stat = os.stat(file_path)
+        known[name] = {"mtime": stat.st_mtime, "size": stat.st_size,
+                       "hash": bake_cache.file_hash(file_path), "actions": report.actions}
+    for name in deleted:
+        remove_actions(known.pop(name)["actions"], on_deleted=on_deleted)
+
+    result = {"time": time.strftime("%Y-%m-%d %H:%M:%S"), "folder": directory, "new": new, "changed": changed,
+              "deleted": deleted, "deleted_actions": on_deleted, "failed": failed}
+    if new or changed or deleted:
+        manifest["log"] = (manifest["log"] + [result])[-LOG_LENGTH:]
+    save_manifest(manifest)
+    return result
+
+
+def start_watch(directory: str, options: dict, on_deleted: str = 'FLAG', interval: float = 10.0):
+    """ poll the folder with bpy.app.timers; replaces an existing watch of the same folder """
+    directory = os.path.abspath(bpy.path.abspath(directory))
+    stop_watch(directory)
+
+    def poll():
+        if _watches.get(directory) is not poll:
+            return None
+        try:
+            windows = bpy.context.window_manager.windows
+            ## timers run without a window in the context
+            with bpy.context.temp_override(window=windows[0]) if windows else nullcontext():
+                result = sync(bpy.context, directory, options, on_deleted=on_deleted)
+            if result["new"] or result["changed"] or result["deleted"]:
+                print(f"Mixamo folder sync {directory}: {len(result['new'])} new, "
+                      f"{len(result['changed'])} changed, {len(result['deleted'])} deleted")
+        except Exception as e:
+            print(e)
+        return interval
+
+    _watches[directory] = poll
+    ## not persistent: a watch belongs to the open .blend, see stop_watch_on_load
+    bpy.app.timers.register(poll, first_interval=interval)
+    return {'FINISHED'}
+
+
+def stop_watch(directory: str = None):
+    """ stop watching a folder, or all folders """
+    directories = list(_watches) if directory is None else [os.path.abspath(bpy.path.abspath(directory))]
+    for d in directories:
+        poll = _watches.pop(d, None)
+        if poll is not None and bpy.app.timers.is_registered(poll):
+            bpy.app.timers.unregister(poll)
+    return {'FINISHED'}
+
+
+def watched_folders() -> list:
+    return list(_watches)
+
+
+@persistent
+def stop_watch_on_load(*args):
+    """ load_pre handler: File > Open / New stops all watches, they would import into the other .blend """
+    stop_watch()
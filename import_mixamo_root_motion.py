@@ -1,103 +1,136 @@
 import bpy
 import os
+import time
+import numpy as np
 
 from bpy_extras.io_utils import ImportHelper
-from bpy.props import StringProperty, BoolProperty, EnumProperty, CollectionProperty
+from bpy.props import StringProperty, BoolProperty, EnumProperty, CollectionProperty, IntProperty, FloatProperty
 from bpy.types import Operator, Panel, Object, Action
 from bpy.utils import escape_identifier
 from mathutils import Vector
+from . import bake_cache, batch_workers, curve_io, folder_sync, library, mesh_sampler, pose_sampler, profiling, scene_utils, sidecar, trajectory
+
+
+## fbx importer options of the import profiles
+FBX_PROFILES = {
+    'FULL': {},
+    'ANIMATION': {"use_image_search": False, "use_custom_props": False, "use_custom_normals": False,
+                  "use_subsurf": False, "use_anim": True},
+}
+BONE_AXES = (
+    ('X', "X Axis", ""),
+    ('Y', "Y Axis", ""),
+    ('Z', "Z Axis", ""),
+    ('-X', "-X Axis", ""),
+    ('-Y', "-Y Axis", ""),
+    ('-Z', "-Z Axis", ""),
+)
 
 
 def get_fcurve(action: Action, main_bone: str):
     """ bone: fcurve; According to the method obtained by switching versions """
-    if bpy.app.version >= (4, 4, 0):
-        ## When importing an FBX file, the slot and strip automatically created by Blender are set to the first one by default.
-        slot = action.slots[0]
-        strip = action.layers[0].strips[0]
-        channelbag = strip.channelbag(slot)
-        curve_x = channelbag.fcurves.find(f'pose.bones["{main_bone}"].location', index=0)
-        curve_y = channelbag.fcurves.find(f'pose.bones["{main_bone}"].location', index=1)
-        curve_z = channelbag.fcurves.find(f'pose.bones["{main_bone}"].location', index=2)
-    else:
-        curve_x = action.fcurves.find(f'pose.bones["{main_bone}"].location', index=0)
-        curve_y = action.fcurves.find(f'pose.bones["{main_bone}"].location', index=1)
-        curve_z = action.fcurves.find(f'pose.bones["{main_bone}"].location', index=2)
-
-    return curve_x, curve_y, curve_z
+    return curve_io.get_location_fcurves(action, bone_name=main_bone)
 
 class ImportMixamo():
-    def __init__(self, obj: Object, main_bone_name: str):
+    def __init__(self, obj: Object, main_bone_name: str, curves: tuple = None):
         """ init variables """
         self.obj = obj
         self.intensity = self.obj.scale.copy()
         self.action = self.obj.animation_data.action
-        self.curve_x, self.curve_y, self.curve_z = get_fcurve(action=self.action, main_bone=main_bone_name)
+        self.curve_x, self.curve_y, self.curve_z = curves or get_fcurve(action=self.action, main_bone=main_bone_name)
     
     def rename_action(self, file_path:str):
         """ rename action, new name use file name """
         self.action.name = os.path.basename(file_path).split('.')[0]
         return {'FINISHED'}
     
-    def remove_prefix_name(self, prefix_name:str):
-        """ remove prefix name from the bone name"""
-        bones = self.obj.pose.bones
-        for bone in bones:
-            if bone.name.startswith(prefix_name):
-                bone.name = bone.name.replace(prefix_name, "")
-        return {'FINISHED'}
-    
-    def suffix_format(self):
-        """ Use lowercase bone names, remove 'left'/'right' from the names, and replace them with a '.L'/.R' suffix """
-        bones = self.obj.pose.bones
-        for bone in bones:
-            bone.name = bone.name.lower()
-            if "left" in bone.name:
-                bone.name = bone.name.replace("left", "") + ".L"
-            elif "right" in bone.name:
-                bone.name = bone.name.replace("right", "") + ".R"
+    def rename_bones(self, mapping: dict):
+        """ rename every bone once; the action is detached meanwhile and its data paths are rewritten directly """
+        bones = self.obj.data.bones
+        items = [(bones[old], old, new) for old, new in mapping.items() if old in bones and new != old]
+        if not items:
+            return {'FINISHED'}
+        animation_data = self.obj.animation_data
+        slot = animation_data.action_slot if bpy.app.version >= (4, 4, 0) else None
+        animation_data.action = None
+        ## bones that hold the new name of another bone are moved out of the way first
+        targets = {new for _, _, new in items}
+        for i, (bone, old, _) in enumerate(items):
+            if old in targets:
+                bone.name = f"__rename_{i}"
+        renamed = {}
+        for bone, old, new in items:
+            bone.name = new
+            renamed[old] = bone.name  ## Blender adds a .001 suffix on a name collision
+        curve_io.rename_bone_paths(self.action, renamed)
+        animation_data.action = self.action
+        if slot is not None:
+            animation_data.action_slot = slot
         return {'FINISHED'}
 
     def delete_armature(self, armature_name:str):
-        """ delete <Armature.00*>, delete cihld objects """
+        """ delete <Armature.00*>, delete cihld objects and the data only they use; the action is kept """
         if self.obj.name.startswith(armature_name + '.00'):
-            bpy.ops.object.select_hierarchy(direction='CHILD', extend=True)
-            bpy.ops.object.delete()
+            self.action.use_fake_user = True
+            scene_utils.remove_hierarchy(self.obj)
+            self.obj = None
         return {'FINISHED'}
 
     def apply_all_transform(self):
-        """ apply all transform to the object """
-        bpy.ops.object.transform_apply(location=True, rotation=True, scale=True)
-        return {'FINISHED'}
+        """ apply all transform to the object and its children """
+        return scene_utils.apply_transforms(self.obj)
 
     def scale_bone_action_intensity(self):
         """ Scale the action intensity of the bones, fix animation """
-        ## x keyframes
-        for kf in self.curve_x.keyframe_points:
-            kf.co.y *= self.intensity.x
-        ## y keyframes
-        for kf in self.curve_y.keyframe_points:
-            kf.co.y *= self.intensity.y
-        ## z keyframs
-        for kf in self.curve_z.keyframe_points:
-            kf.co.y *= self.intensity.z
-        return {'FINISHED'}
-    
-    def set_parent(self, child_bone:str, parent_bone:str):
-        """ set parent of the root bone """
-        bpy.ops.object.mode_set(mode='EDIT', toggle=False)
-        bpy.context.scene.frame_set(1)
-        self.obj.data.edit_bones[child_bone].parent = self.obj.data.edit_bones[parent_bone]
-        bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
+        curve_io.scale_values(self.curve_x, self.intensity.x)
+        curve_io.scale_values(self.curve_y, self.intensity.y)
+        curve_io.scale_values(self.curve_z, self.intensity.z)
         return {'FINISHED'}
 
 
+def parse_bone_remap(text: str) -> dict:
+    """ 'old=new, old=new' -> {old: new} """
+    remap = {}
+    for pair in text.split(","):
+        old, separator, new = pair.partition("=")
+        if separator and old.strip() and new.strip():
+            remap[old.strip()] = new.strip()
+    return remap
+
+
+def bone_name_mapping(names, prefix_name: str = "", is_suffix_format: bool = False, remap: dict = None) -> dict:
+    """ old -> new name of the renamed bones: prefix removal, then the '.L'/'.R' suffix format, then the remap table
+
+    The remap table matches the name after the other options or the original name.
+    """
+    mapping = {}
+    for name in names:
+        new = name
+        ## remove prefix name
+        if prefix_name and new.startswith(prefix_name):
+            new = new.replace(prefix_name, "")
+        ## lowercase, 'left'/'right' replaced with a '.L'/'.R' suffix
+        if is_suffix_format:
+            new = new.lower()
+            if "left" in new:
+                new = new.replace("left", "") + ".L"
+            elif "right" in new:
+                new = new.replace("right", "") + ".R"
+        if remap:
+            new = remap.get(new, remap.get(name, new))
+        if new != name:
+            mapping[name] = new
+    return mapping
+
+
 class BakeMethod():
     """ calculate the height of the root motion """
     def __init__(self, obj, main_bone_name: str, method: str, is_start_feet: bool,
                 bake_x: bool, bake_y: bool, bake_z: bool, head_top_bone_name: str,
                 spine_bone_name: str, left_hand_bone_name: str, right_hand_bone_name: str,
                 left_foot_bone_name: str, right_foot_bone_name: str, left_toe_bone_name: str,
-                right_toe_bone_name: str):
+                right_toe_bone_name: str, curves: tuple = None, sample_mode: str = 'ACTION',
+                contact_bone_names: tuple = (), times=None):
         self.obj = obj
         self.action = obj.animation_data.action
         self.main_bone_name = main_bone_name
@@ -106,6 +139,7 @@ class BakeMethod():
         self.bake_z = bake_z
         self.method = method
         self.is_start_feet = is_start_feet
+        self.sample_mode = sample_mode
 
         self.head_top_bone_name = head_top_bone_name
         self.spine_bone_name = spine_bone_name
@@ -115,109 +149,85 @@ class BakeMethod():
         self.right_foot_bone_name = right_foot_bone_name
         self.left_toe_bone_name = left_toe_bone_name
         self.right_toe_bone_name = right_toe_bone_name
+        self.contact_bone_names = tuple(contact_bone_names)
 
         self.start_point = self.get_start_point()
 
-        self.curve_x, _, _ = get_fcurve(action=self.action, main_bone=main_bone_name)
+        self.curve_x, _, _ = curves or get_fcurve(action=self.action, main_bone=main_bone_name)
 
-        self.frames = []
-        for kf in self.curve_x.keyframe_points:
-            detail_frame = [int(kf.co.x), float("0." + str(kf.co.x).split('.')[1])]
-            self.frames.append(detail_frame)
+        ## sample times (frame + subframe), the main bone keys by default
+        if times is None:
+            times = curve_io.read_keyframes(self.curve_x)[0][:, 0]
+        self.times = np.asarray(times, dtype=np.float64)
     
     def get_location_in_world(self, bone_name:str) -> Vector:
         return self.obj.matrix_world @ self.obj.pose.bones[bone_name].head
+
+    def sample_heads(self, bone_names, times, space: str = 'WORLD') -> dict:
+        """ bone name: (N,3) head locations; sample the action directly or update the scene per frame """
+        if self.sample_mode == 'DEPSGRAPH':
+            return pose_sampler.sample_heads_depsgraph(self.obj, bone_names, times, space=space)
+        heads = pose_sampler.PoseSampler(self.obj, bone_names).sample_heads(times, space=space)
+        if self.sample_mode == 'VALIDATE':
+            reference = pose_sampler.sample_heads_depsgraph(self.obj, bone_names, times, space=space)
+            print(f"{self.action.name}: max sampler error {pose_sampler.max_error(heads, reference):.6f}")
+        return heads
     
     def get_start_point(self):
         """ get first point 待完成... """
-        bpy.context.scene.frame_set(1)
-        left_foot = self.get_location_in_world(bone_name=self.left_foot_bone_name)
-        right_foot = self.get_location_in_world(bone_name=self.right_foot_bone_name)
-        start_point = (left_foot + right_foot) / 2 * Vector((1, 1, 0))
-        return start_point
+        heads = self.sample_heads((self.left_foot_bone_name, self.right_foot_bone_name), times=(1.0,))
+        return trajectory.start_point_from_feet(heads[self.left_foot_bone_name][0],
+                                                heads[self.right_foot_bone_name][0])
+
+    @property
+    def mask(self) -> np.ndarray:
+        return trajectory.axis_mask(self.bake_x, self.bake_y, self.bake_z)
 
     def copy_for_main_bone(self):
         """ copy for main bone [mixamorig:Hips] location in world """
-        vectors, root_vectors = [], []
-        for f in self.frames:
-            bpy.context.scene.frame_set(f[0], subframe=f[1])
-            vectors.append(self.get_location_in_world(bone_name=self.main_bone_name))
-        root_vectors = [Vector((v.x * self.bake_x,
-                                v.y * self.bake_y,
-                                v.z * self.bake_z
-                                )) for v in vectors]
-        hips_vectors = [vectors[i] - root_vectors[i] for i in range(len(vectors))]
-        first_point = vectors[0]
-        root_vectors = [Vector((v.x - first_point.x * self.bake_x,
-                                v.y - first_point.y * self.bake_y,
-                                v.z - first_point.z * self.bake_z,
-                                )) for v in root_vectors]
-        first_point = vectors[0] - self.start_point * self.is_start_feet
-        hips_vectors = [Vector((v.x + first_point.x * self.bake_x,
-                                v.y + first_point.y * self.bake_y,
-                                v.z + first_point.z * self.bake_z,
-                                )) for v in hips_vectors]
-        return root_vectors, hips_vectors
+        vectors = self.sample_heads((self.main_bone_name,), times=self.times)[self.main_bone_name]
+        return trajectory.split_root_motion(vectors, self.mask, self.start_point, self.is_start_feet)
 
     def get_lowest_bone_height(self):
         """ get main bone y_loc min_value (World Coordinate System)"""
-        vectors, min_height_ls = [], []
-        for f in self.frames:
-            bpy.context.scene.frame_set(f[0], subframe=f[1])
-            vectors.append(self.get_location_in_world(bone_name=self.main_bone_name))
-            ## get main bone lowest height
-            headtop = self.obj.pose.bones[self.head_top_bone_name]
-            lefthand = self.obj.pose.bones[self.left_hand_bone_name]
-            righthand = self.obj.pose.bones[self.right_hand_bone_name]
-            spine = self.obj.pose.bones[self.spine_bone_name]
-            lefttoe = self.obj.pose.bones[self.left_toe_bone_name]
-            righttoe = self.obj.pose.bones[self.right_toe_bone_name]
-            min_height = min(headtop.head[2], lefthand.head[2], righthand.head[2], 
-                        spine.head[2], lefttoe.head[2],  righttoe.head[2])
-            min_height_ls.append(min_height)
-
-        root_vectors = [Vector((vectors[i].x * self.bake_x,
-                                vectors[i].y * self.bake_y,
-                                min_height_ls[i] * self.bake_z
-                                )) for i in range(len(vectors))]
-        hips_vectors = [vectors[i] - root_vectors[i] for i in range(len(vectors))]
-        ## root_on_floor x/z
-        first_point = vectors[0] - self.start_point
-        root_vectors = [Vector((v.x - first_point.x * self.bake_x,
-                                v.y - first_point.y * self.bake_y,
-                                v.z )) for v in root_vectors]
-        first_point = vectors[0] - self.start_point * self.is_start_feet
-        hips_vectors = [Vector((v.x + first_point.x * self.bake_x,
-                                v.y + first_point.y * self.bake_y,
-                                v.z )) for v in hips_vectors]
-        return root_vectors, hips_vectors
+        bone_names = self.contact_bone_names or (
+            self.head_top_bone_name, self.left_hand_bone_name, self.right_hand_bone_name,
+            self.spine_bone_name, self.left_toe_bone_name, self.right_toe_bone_name)
+        heads = self.sample_heads(bone_names + (self.main_bone_name,), times=self.times)
+        vectors = heads[self.main_bone_name]
+        ## get lowest contact bone height
+        heights = np.min([heads[name][:, 2] for name in bone_names], axis=0)
+        return trajectory.split_root_motion(vectors, self.mask, self.start_point, self.is_start_feet,
+                                            heights=heights)
 
     def get_bound_box_bottom(self):
+        """ lowest vertex of the skinned meshes; the armature bound box when there is no mesh """
+        meshes = mesh_sampler.skinned_meshes(self.obj)
+        if not meshes:
+            return self.get_armature_bound_box_bottom()
+        sampler = mesh_sampler.MeshSampler(self.obj, meshes)
+        vectors = self.sample_heads((self.main_bone_name,), times=self.times)[self.main_bone_name]
+        if self.sample_mode == 'DEPSGRAPH':
+            heights = sampler.heights_depsgraph(self.times)
+        else:
+            heights = sampler.heights_action(self.times)
+            if self.sample_mode == 'VALIDATE':
+                error = np.abs(heights - sampler.heights_depsgraph(self.times)).max(initial=0.0)
+                print(f"{self.action.name}: max mesh height error {error:.6f}")
+        return trajectory.split_root_motion(vectors, self.mask, self.start_point, self.is_start_feet,
+                                            heights=heights)
+
+    def get_armature_bound_box_bottom(self):
         """ get bound box center """
-        vectors, root_vectors, hips_vectors, lowest_points = [], [], [], []
-        for f in self.frames:
-            bpy.context.scene.frame_set(f[0], subframe=f[1])
-            vectors.append(self.get_location_in_world(bone_name=self.main_bone_name))
-
-            bound_box = [self.obj.matrix_world @ Vector(v) for v in self.obj.bound_box]
-            lowest_point = min(bound_box, key=lambda v:v.z)
-            lowest_points.append(lowest_point)
-
-        root_vectors = [Vector((vectors[i].x * self.bake_x,
-                                vectors[i].y * self.bake_y,
-                                lowest_points[i].z * self.bake_z
-                                )) for i in range(len(vectors))]
-        hips_vectors = [vectors[i] - root_vectors[i] for i in range(len(vectors))]
-        ## root_on_floor x / z
-        first_point = root_vectors[0] - self.start_point
-        root_vectors = [Vector((v.x - first_point.x * self.bake_x,
-                                v.y - first_point.y * self.bake_y,
-                                v.z )) for v in root_vectors]
-        first_point = vectors[0] - self.start_point * self.is_start_feet
-        hips_vectors = [Vector((v.x + first_point.x * self.bake_x,
-                                v.y + first_point.y * self.bake_y,
-                                v.z )) for v in hips_vectors]
-        return root_vectors, hips_vectors
+        vectors, heights = np.empty((len(self.times), 3)), np.empty(len(self.times))
+        for i, t in enumerate(self.times):
+            frame = int(np.floor(t))
+            profiling.frame_set(bpy.context.scene, frame, subframe=float(t - frame))
+            vectors[i] = self.get_location_in_world(bone_name=self.main_bone_name)
+            bound_box = trajectory.transform_points(self.obj.matrix_world, self.obj.bound_box)
+            heights[i] = bound_box[:, 2].min()
+        return trajectory.split_root_motion(vectors, self.mask, self.start_point, self.is_start_feet,
+                                            heights=heights)
 
     def run(self):
         match self.method:
@@ -230,62 +240,77 @@ class BakeMethod():
 
 
 class RootMotion():
-    def __init__(self, obj, main_bone_name:str):
+    def __init__(self, obj, main_bone_name:str, curves: tuple = None):
         self.obj = obj
         self.action = self.obj.animation_data.action
-        self.curve_x, self.curve_y, self.curve_z = get_fcurve(self.action, main_bone=main_bone_name)
+        self.curve_x, self.curve_y, self.curve_z = curves or get_fcurve(self.action, main_bone=main_bone_name)
 
-        ## get frames
-        self.frames = []  ## -> [ whole_frame=float_value ]
-        for kf in self.curve_x.keyframe_points:
-            self.frames.append(kf.co.x)
+        ## key times of the main bone
+        self.frames = curve_io.read_keyframes(self.curve_x)[0][:, 0].astype(np.float64)
     
-    def add_root(self, root_name:str):
-        """ add root bone"""
+    def add_root(self, root_name:str, child_bone: str = None):
+        """ add root bone and set it as parent of <child_bone>; all edit bone work in one edit session """
         bpy.ops.object.mode_set(mode='EDIT', toggle=False)
         # create bone && set bone tail
-        root = self.obj.data.edit_bones.new(root_name)
+        edit_bones = self.obj.data.edit_bones
+        root = edit_bones.new(root_name)
         root.head = (0.0, 0.0, 0.0)
         root.tail = (0.0, 0.0, 0.3)
+        ## parenting keeps the rest matrix of the child, the baked local vectors stay valid
+        if child_bone is not None:
+            edit_bones[child_bone].parent = root
         bpy.ops.object.mode_set(mode='OBJECT', toggle=False)
         return {'FINISHED'}
 
-    def vectors_world2local(self, bone_name, vectors) -> list:
+    def vectors_world2local(self, bone_name, vectors) -> np.ndarray:
         """ mapping coordinate system; world to local """
         local_bone = self.obj.pose.bones[bone_name]
-        local_vectors = [self.obj.matrix_world.inverted() @ local_bone.bone.matrix_local.inverted() @ v 
-                         for v in vectors]
-        return local_vectors
-
-    def bake_keyframes(self, bone_name, vectors):
-        """ bake root motion keyframes """
-        bone=self.obj.pose.bones[bone_name]
-        local_vectors = self.vectors_world2local(bone_name, vectors)
-        for i, f in enumerate(self.frames):
-            bone.location = local_vectors[i]
-            bone.keyframe_insert(data_path='location', frame=f, group=bone_name)
+        return trajectory.world_to_local(vectors, self.obj.matrix_world, local_bone.bone.matrix_local)
+
+    def bake_keyframes(self, bone_name, vectors, is_local: bool = False, times=None):
+        """ bake root motion keyframes at <times> (the main bone keys by default); the location fcurves are written in bulk """
+        local_vectors = vectors if is_local else self.vectors_world2local(bone_name, vectors)
+        fcurves = curve_io.new_fcurves(self.action, data_path=f'pose.bones["{bone_name}"].location',
+                                       count=3, group=bone_name)
+        for i, fcurve in enumerate(fcurves):
+            curve_io.write_keyframes(fcurve, frames=self.frames if times is None else times, values=local_vectors[:, i])
         return {'FINISHED'}
 
-    def edit_keyframes(self, bone_name, vectors):
-        """ edit hips bone keyframe points"""
-        vectors = self.vectors_world2local(bone_name=bone_name, vectors=vectors)
-        for i, kf in enumerate(self.curve_x.keyframe_points):
-            kf.co.y = vectors[i].x
-        for i, kf in enumerate(self.curve_y.keyframe_points):
-            kf.co.y = vectors[i].y
-        for i, kf in enumerate(self.curve_z.keyframe_points):
-            kf.co.y = vectors[i].z
+    def edit_keyframes(self, bone_name, vectors, is_local: bool = False, times=None):
+        """ edit hips bone keyframe points; resampled <times> other than the keys rewrite the curves """
+        if not is_local:
+            vectors = self.vectors_world2local(bone_name=bone_name, vectors=vectors)
+        if times is not None and not np.array_equal(times, self.frames):
+            for i, fcurve in enumerate((self.curve_x, self.curve_y, self.curve_z)):
+                curve_io.write_keyframes(fcurve, frames=times, values=vectors[:, i])
+            return {'FINISHED'}
+        curve_io.set_values(self.curve_x, vectors[:, 0])
+        curve_io.set_values(self.curve_y, vectors[:, 1])
+        curve_io.set_values(self.curve_z, vectors[:, 2])
         return {'FINISHED'}
 
 
-def main(context, file_path: str, is_apply_transform: bool, is_rename_action: bool, is_remove_prefix: bool, 
+def main(context, file_path: str, is_apply_transforms: bool, is_rename_action: bool, is_remove_prefix: bool, 
         is_suffix_format: bool,is_delete_armature: bool, is_add_root: bool, method: str, is_start_feet: bool,
         bake_x: bool, bake_y: bool, bake_z: bool, armature_name: str, root_name: str, prefix_name: str,
         main_bone_name: str, head_top_bone_name: str, spine_bone_name: str, left_hand_bone_name: str,
         right_hand_bone_name: str, left_foot_bone_name: str, right_foot_bone_name: str, 
-        left_toe_bone_name: str,right_toe_bone_name: str,
+        left_toe_bone_name: str,right_toe_bone_name: str, sample_mode: str = 'ACTION', contact_bone_names: str = "",
+        use_reduce_keys: bool = False, reduce_location_tolerance: float = 0.001,
+        reduce_rotation_tolerance: float = 0.001, reduce_scale_tolerance: float = 0.001,
+        import_mode: str = 'SCENE', import_profile: str = 'FULL', primary_bone_axis: str = 'Y',
+        secondary_bone_axis: str = 'X', resample_mode: str = 'SOURCE', resample_fps: float = 30.0,
+        scene_fps: float = 0.0,
+        sidecar_format: str = 'NONE', sidecar_dir: str = "", duplicate_mode: str = 'IMPORT', bone_remap: str = "",
+        use_cache: bool = False, cache_size: int = 512, report: profiling.FileReport = None,
         ):
-    """ main - batch """
+    """ main - batch; per file status, frame count and stage timings are written to <report> """
+    report = report or profiling.FileReport(file_path)
+    key_options = {name: value for name, value in locals().items() if name in bake_cache.KEY_OPTIONS}
+    ## options that change the resulting action, hashed into the animation fingerprint
+    action_options = {name: value for name, value in locals().items()
+                      if name not in ("context", "file_path", "report", "key_options", "duplicate_mode",
+                                      "use_cache", "cache_size", "sidecar_format", "sidecar_dir")}
     ## Parameters
     armature_name = escape_identifier(armature_name)
     root_name = escape_identifier(root_name)
@@ -299,55 +324,161 @@ def main(context, file_path: str, is_apply_transform: bool, is_rename_action: bo
     right_foot_bone_name = escape_identifier(right_foot_bone_name)
     left_toe_bone_name = escape_identifier(left_toe_bone_name)
     right_toe_bone_name = escape_identifier(right_toe_bone_name)
-
+    contact_bone_names = tuple(escape_identifier(name.strip()) for name in contact_bone_names.split(",") if name.strip())
+
+    target_scene, target_collection = context.scene, context.collection or context.scene.collection
+    ## SCENE resampling: the rate read once per batch; each file sets its own rate on the target scene
+    target_fps = scene_fps or target_scene.render.fps / target_scene.render.fps_base
+    ## import into a temporary scene: only the kept armature reaches the target scene,
+    ## everything else the import created is purged at the end
+    existing_ids = scene_utils.id_snapshot()
     try:
-        bpy.ops.import_scene.fbx(filepath=file_path)  ## import fbx file
-
-        obj = context.object
-        ## class instance
-        importer = ImportMixamo(obj, main_bone_name=main_bone_name)
-        bake_method = BakeMethod(obj, main_bone_name=main_bone_name, method=method, is_start_feet=is_start_feet,
-                                bake_x=bake_x, bake_y=bake_y, bake_z=bake_z, head_top_bone_name=head_top_bone_name,
-                                spine_bone_name=spine_bone_name, left_hand_bone_name=left_hand_bone_name, 
-                                right_hand_bone_name=right_hand_bone_name, left_foot_bone_name=left_foot_bone_name, 
-                                right_foot_bone_name=right_foot_bone_name, left_toe_bone_name=left_toe_bone_name,
-                                right_toe_bone_name=right_toe_bone_name)
-        root_motion = RootMotion(obj, main_bone_name=main_bone_name)
-
-        ## apply transform and fix animation
-        if is_apply_transform:
-            importer.scale_bone_action_intensity()
-            importer.apply_all_transform()
-        ## get vectors for bone
-        if is_add_root and (bake_x, bake_y, bake_z):
-            root_vectors, hips_vectors = bake_method.run()
-        ## add root bone
-        if is_add_root:
-            root_motion.add_root(root_name=root_name)
-        # ## bake root motion keyframes
-        if is_add_root and (bake_x, bake_y, bake_z):
-            root_motion.bake_keyframes(bone_name=root_name, vectors=root_vectors)
-            root_motion.edit_keyframes(bone_name=main_bone_name, vectors=hips_vectors)
-        # ## set parent
-        if is_add_root:
-            importer.set_parent(child_bone=main_bone_name, parent_bone=root_name)
-        # ## rename action
-        if is_rename_action:
-            importer.rename_action(file_path=file_path)
-        # ## remove prefix
-        if is_remove_prefix:
-            importer.remove_prefix_name(prefix_name=prefix_name)
-        if is_suffix_format:
-            importer.suffix_format()
-        # ## delete armature
-        if is_delete_armature:
-            importer.delete_armature(armature_name=armature_name)
-        context.scene.frame_set(1)  ## set frame to 1
+        with scene_utils.scratch_scene(context) as import_scene:
+            with report.stage("import"):
+                bpy.ops.import_scene.fbx(filepath=file_path, primary_bone_axis=primary_bone_axis,
+                                         secondary_bone_axis=secondary_bone_axis,
+                                         **FBX_PROFILES[import_profile])  ## import fbx file
+
+            obj = bpy.context.object
+            ## animation only: meshes are only needed by the bound box method
+            if import_profile == 'ANIMATION' and method != 'BOUND_BOX':
+                with report.stage("remove_meshes"):
+                    scene_utils.remove_children(obj)
+            ## same animation as an imported action: skip the file or record it as an alias of the action
+            if duplicate_mode != 'IMPORT':
+                with report.stage("fingerprint"):
+                    fingerprint = curve_io.fingerprint(obj.animation_data.action,
+                                                       salt=repr(sorted(action_options.items())))
+                    duplicate = library.find_action(fingerprint, exclude=obj.animation_data.action)
+                if duplicate is not None:
+                    report.duplicate_of = duplicate.name
+                    if duplicate_mode == 'ALIAS':
+                        library.add_alias(duplicate, os.path.basename(file_path))
+                    return {'FINISHED'}
+            if import_mode == 'LIBRARY':
+                signature = library.skeleton_signature(obj)
+            ## resolve the main bone fcurves once, shared by all class instances
+            curves = get_fcurve(obj.animation_data.action, main_bone=main_bone_name)
+            ## class instance
+            importer = ImportMixamo(obj, main_bone_name=main_bone_name, curves=curves)
+            root_motion = RootMotion(obj, main_bone_name=main_bone_name, curves=curves)
+            ## sample times: the main bone keys or a fixed rate grid over their range (frames of the file)
+            if resample_mode == 'SOURCE':
+                times = root_motion.frames
+            else:
+                rate = target_fps if resample_mode == 'SCENE' else resample_fps
+                times = trajectory.resample_times(root_motion.frames,
+                                                  step=import_scene.render.fps / import_scene.render.fps_base / rate)
+            report.frame_count = len(times)
+            is_bake = is_add_root and (bake_x, bake_y, bake_z)
+
+            ## cache hit: skip sampling, write the cached curves
+            cached = None
+            if is_bake and use_cache:
+                with report.stage("cache"):
+                    key = bake_cache.cache_key(file_path, key_options)
+                    cached = bake_cache.load(key)
+                if cached is not None and (len(cached["times"]) != len(times) or
+                                           not np.allclose(cached["times"], times)):
+                    cached = None
+                report.cache = 'MISS' if cached is None else 'HIT'
+
+            ## apply transform and fix animation
+            if is_apply_transforms:
+                with report.stage("scale_bone_action_intensity"):
+                    importer.scale_bone_action_intensity()
+                with report.stage("apply_all_transform"):
+                    importer.apply_all_transform()
+            ## get vectors for bone
+            if is_bake and cached is None:
+                with report.stage("sample"):
+                    bake_method = BakeMethod(obj, main_bone_name=main_bone_name, method=method, is_start_feet=is_start_feet,
+                                            bake_x=bake_x, bake_y=bake_y, bake_z=bake_z, head_top_bone_name=head_top_bone_name,
+                                            spine_bone_name=spine_bone_name, left_hand_bone_name=left_hand_bone_name, 
+                                            right_hand_bone_name=right_hand_bone_name, left_foot_bone_name=left_foot_bone_name, 
+                                            right_foot_bone_name=right_foot_bone_name, left_toe_bone_name=left_toe_bone_name,
+                                            right_toe_bone_name=right_toe_bone_name, curves=curves, sample_mode=sample_mode,
+                                            contact_bone_names=contact_bone_names, times=times)
+                    root_vectors, hips_vectors = bake_method.run()
+            ## add root bone and set parent
+            if is_add_root:
+                with report.stage("add_root"):
+                    root_motion.add_root(root_name=root_name, child_bone=main_bone_name)
+            # ## bake root motion keyframes
+            if is_bake:
+                if cached is None:
+                    root_local = root_motion.vectors_world2local(root_name, root_vectors)
+                    hips_local = root_motion.vectors_world2local(main_bone_name, hips_vectors)
+                    if use_cache:
+                        with report.stage("cache"):
+                            bake_cache.save(key, max_size_mb=cache_size, times=times,
+                                            root_vectors=root_vectors, hips_vectors=hips_vectors,
+                                            root_local=root_local, hips_local=hips_local)
+                else:
+                    root_vectors = cached["root_vectors"]
+                    root_local, hips_local = cached["root_local"], cached["hips_local"]
+                with report.stage("bake_keyframes"):
+                    root_motion.bake_keyframes(bone_name=root_name, vectors=root_local, is_local=True, times=times)
+                with report.stage("edit_keyframes"):
+                    root_motion.edit_keyframes(bone_name=main_bone_name, vectors=hips_local, is_local=True,
+                                               times=times)
+                ## root trajectory (world) for game runtimes, next to the fbx file by default
+                if sidecar_format != 'NONE':
+                    with report.stage("sidecar"):
+                        folder = bpy.path.abspath(sidecar_dir) if sidecar_dir else os.path.dirname(file_path)
+                        name = os.path.basename(file_path).split('.')[0]
+                        sidecar.write(os.path.join(folder, name), times, root_vectors,
+                                      fps=import_scene.render.fps / import_scene.render.fps_base,
+                                      encoding=sidecar_format)
+            # ## reduce keyframes
+            if use_reduce_keys:
+                with report.stage("reduce_keyframes"):
+                    report.keyframes = list(curve_io.reduce_action(importer.action,
+                                                                  location=reduce_location_tolerance,
+                                                                  rotation=reduce_rotation_tolerance,
+                                                                  scale=reduce_scale_tolerance))
+            # ## rename action
+            if is_rename_action:
+                with report.stage("rename_action"):
+                    importer.rename_action(file_path=file_path)
+            report.actions = [importer.action.name]
+            if duplicate_mode != 'IMPORT':
+                importer.action[library.FINGERPRINT_PROP] = fingerprint
+            # ## remove prefix, suffix format and remap table in one pass
+            with report.stage("rename_bones"):
+                mapping = bone_name_mapping(obj.data.bones.keys(), prefix_name=prefix_name if is_remove_prefix else "",
+                                            is_suffix_format=is_suffix_format, remap=parse_bone_remap(bone_remap))
+                importer.rename_bones(mapping)
+            # ## keep one armature per skeleton / delete armature
+            with report.stage("delete_armature"):
+                if import_mode == 'LIBRARY':
+                    library.store(target_scene, target_collection, obj, signature=signature)
+                else:
+                    if is_delete_armature:
+                        importer.delete_armature(armature_name=armature_name)
+                    if importer.obj is not None:
+                        scene_utils.link_hierarchy(obj, target_collection)
+                        ## the fbx importer sets the frame rate of the file on the import scene
+                        target_scene.render.fps = import_scene.render.fps
+                        target_scene.render.fps_base = import_scene.render.fps_base
+        profiling.frame_set(context.scene, 1)  ## set frame to 1
     except Exception as e:
+        report.fail(e)
         print(e)
+    finally:
+        with report.stage("purge"):
+            scene_utils.purge_orphans(existing_ids)
+        report.close()
     return {'FINISHED'}
 
 
+## operator properties that control the batch, not main()
+BATCH_PROPERTIES = ("filter_glob", "directory", "files", "filepath",
+                    "use_modal", "is_invoked", "use_parallel", "worker_count", "shard_by_size", "file_timeout",
+                    "is_sync_folder", "sync_deleted", "is_watch_folder", "watch_interval",
+                    "is_profile", "trace_path", "profile_file_name")
+
+
 ## ImportHelper
 class BatchImport(Operator, ImportHelper):
     """ Batch import """
@@ -416,11 +547,114 @@ class BatchImport(Operator, ImportHelper):
         items = (
             ('COPY_DATA', "Copy", "Copy position keyframes of the main bone in world coordinates. See 'Main bone' in 'Name Settings' for details"),
             ('LOWEST_BONE', "Bone", "Get the height of the lowest bone from six key bones as height axis data. See 'Name Settings' for details"),
-            ('BOUND_BOX', "Bound box", "Get the height of the bottom of the bounding box"),
+            ('BOUND_BOX', "Bound box", "Get the height of the lowest vertex of the skinned meshes (the armature bounding box without a mesh)"),
         ),
         default = 'COPY_DATA',
     ) # type: ignore
     
+    import_mode: EnumProperty(
+        name = "Import mode",
+        description = "Where the imported animations are stored",
+        items = (
+            ('SCENE', "Armatures", "Every file keeps its own armature in the scene"),
+            ('LIBRARY', "Animation library", "Keep one armature per skeleton; every other file only adds its action (with fake user) to it"),
+        ),
+        default = 'SCENE',
+    ) # type: ignore
+
+    contact_bone_names: StringProperty(
+        name = "Contact bones",
+        description = "Comma separated bones whose lowest point in world space is the height of the Bone method; empty uses the six key bones of 'Name Settings'",
+        default = "",
+    ) # type: ignore
+
+    use_reduce_keys: BoolProperty(
+        name = "Reduce keyframes",
+        description = "Remove keyframes within the tolerance from all transform curves of the action; reduced curves use linear interpolation, static channels at their rest value are removed",
+        default = False,
+    ) # type: ignore
+
+    reduce_location_tolerance: FloatProperty(
+        name = "Location",
+        description = "Maximum location error of the reduced curves",
+        default = 0.001, min = 0.0, soft_max = 0.1, precision = 4, unit = 'LENGTH',
+    ) # type: ignore
+
+    reduce_rotation_tolerance: FloatProperty(
+        name = "Rotation",
+        description = "Maximum error of the reduced rotation curves (radians / quaternion components)",
+        default = 0.001, min = 0.0, soft_max = 0.1, precision = 4,
+    ) # type: ignore
+
+    reduce_scale_tolerance: FloatProperty(
+        name = "Scale",
+        description = "Maximum scale error of the reduced curves",
+        default = 0.001, min = 0.0, soft_max = 0.1, precision = 4,
+    ) # type: ignore
+
+    import_profile: EnumProperty(
+        name = "Import profile",
+        description = "Fbx importer options",
+        items = (
+            ('FULL', "Full", "Default fbx importer options; meshes, materials and textures are imported"),
+            ('ANIMATION', "Animation only", "Skip image search, custom properties and custom normals; meshes and other child objects are removed right after the import (kept for the Bound box method)"),
+        ),
+        default = 'FULL',
+    ) # type: ignore
+
+    duplicate_mode: EnumProperty(
+        name = "Duplicates",
+        description = "Files with the same animation as an imported action (keyframes compared after the import, options included)",
+        items = (
+            ('IMPORT', "Import", "Import every file"),
+            ('SKIP', "Skip", "Skip files whose animation was already imported"),
+            ('ALIAS', "Alias", "Skip files whose animation was already imported, record their file names on the existing action"),
+        ),
+        default = 'IMPORT',
+    ) # type: ignore
+
+    primary_bone_axis: EnumProperty(
+        name = "Primary bone axis",
+        description = "Passed to the fbx importer",
+        items = BONE_AXES,
+        default = 'Y',
+    ) # type: ignore
+
+    secondary_bone_axis: EnumProperty(
+        name = "Secondary bone axis",
+        description = "Passed to the fbx importer",
+        items = BONE_AXES,
+        default = 'X',
+    ) # type: ignore
+
+    resample_mode: EnumProperty(
+        name = "Sample rate",
+        description = "Times at which the root and the main bone are baked",
+        items = (
+            ('SOURCE', "Source keys", "Bake at the keyframes of the main bone in the file"),
+            ('SCENE', "Scene frame rate", "Bake at a fixed rate: the frame rate of the scene"),
+            ('CUSTOM', "Custom", "Bake at a fixed custom rate"),
+        ),
+        default = 'SOURCE',
+    ) # type: ignore
+
+    resample_fps: FloatProperty(
+        name = "Rate",
+        description = "Samples per second of the custom sample rate",
+        default = 30.0, min = 1.0, soft_max = 120.0,
+    ) # type: ignore
+
+    sample_mode: EnumProperty(
+        name = "Sampling",
+        description = "How bone locations are sampled for baking",
+        items = (
+            ('ACTION', "Action", "Evaluate the action F-Curves and the bone chains directly, without updating the scene for every frame"),
+            ('DEPSGRAPH', "Scene", "Update the whole scene for every frame (reference, slow)"),
+            ('VALIDATE', "Validate", "Sample the action and compare it with the scene reference; the max error is printed to the console"),
+        ),
+        default = 'ACTION',
+    ) # type: ignore
+
     is_start_feet: BoolProperty(
         name = "Root starts from feet",
         description = "Root bone initially positioned at the feet; used for cases where the armature is not at world center in initial state",
@@ -445,6 +679,130 @@ class BatchImport(Operator, ImportHelper):
         default = False,
     ) # type: ignore
     
+    sidecar_format: EnumProperty(
+        name = "Root motion file",
+        description = "Write the baked root trajectory of every file as a binary file for game runtimes",
+        items = (
+            ('NONE', "None", "Do not write root motion files"),
+            ('FLOAT32', "Float32", "Header and float32 rows (frame, x, y, z); can be memory-mapped"),
+            ('UINT16', "Quantized", "Header and uint16 rows quantized to the bounds of the header"),
+            ('NPZ', "NumPy (.npz)", "Header fields and float32 rows as NumPy arrays"),
+        ),
+        default = 'NONE',
+    ) # type: ignore
+
+    sidecar_dir: StringProperty(
+        name = "Folder",
+        description = "Folder of the root motion files; empty writes them next to the fbx files",
+        default = "",
+        subtype = 'DIR_PATH',
+    ) # type: ignore
+
+    ## batch settings
+    use_modal: BoolProperty(
+        name = "Show progress",
+        description = "Import one file at a time in the background of the interface, with progress and remaining time in the status bar; Esc stops after the current file and keeps the imported ones",
+        default = True,
+    ) # type: ignore
+
+    is_invoked: BoolProperty(
+        name = "Invoked",
+        description = "Started from the file browser; only then the import runs modal, scripted calls stay synchronous",
+        default = False,
+        options = {'HIDDEN', 'SKIP_SAVE'},
+    ) # type: ignore
+
+    use_parallel: BoolProperty(
+        name = "Parallel import",
+        description = "Import the files in background Blender processes and append their actions and kept armatures",
+        default = False,
+    ) # type: ignore
+
+    worker_count: IntProperty(
+        name = "Workers",
+        description = "Number of background processes; 0 uses the number of CPU cores",
+        default = 0,
+        min = 0,
+    ) # type: ignore
+
+    shard_by_size: BoolProperty(
+        name = "Balance by file size",
+        description = "Distribute the files to the workers by file size instead of by count",
+        default = True,
+    ) # type: ignore
+
+    file_timeout: FloatProperty(
+        name = "Timeout per file",
+        description = "A worker is stopped when one file takes longer than this (seconds); its completed files are kept and a new worker continues with the rest",
+        default = 120.0,
+        min = 1.0,
+        subtype = 'TIME_ABSOLUTE',
+        unit = 'TIME_ABSOLUTE',
+    ) # type: ignore
+
+    is_sync_folder: BoolProperty(
+        name = "Sync folder",
+        description = "Import only the fbx files of the folder that are new or changed since the last sync; the file selection is ignored",
+        default = False,
+    ) # type: ignore
+
+    sync_deleted: EnumProperty(
+        name = "Deleted files",
+        description = "What happens to the actions of files that were removed from the folder",
+        items = (
+            ('FLAG', "Flag", "Keep the actions, marked with the 'mixamo_source_missing' property"),
+            ('REMOVE', "Remove", "Remove the actions"),
+        ),
+        default = 'FLAG',
+    ) # type: ignore
+
+    is_watch_folder: BoolProperty(
+        name = "Watch folder",
+        description = "Keep syncing the folder in the background",
+        default = False,
+    ) # type: ignore
+
+    watch_interval: FloatProperty(
+        name = "Interval",
+        description = "Seconds between two checks of the watched folder",
+        default = 10.0,
+        min = 1.0,
+        subtype = 'TIME_ABSOLUTE',
+        unit = 'TIME_ABSOLUTE',
+    ) # type: ignore
+
+    is_profile: BoolProperty(
+        name = "Profile",
+        description = "Report the time spent in every stage of the import",
+        default = False,
+    ) # type: ignore
+
+    trace_path: StringProperty(
+        name = "Trace",
+        description = "Write wall time, frame_set calls and memory change per file and stage to this .json / .csv file",
+        default = "",
+        subtype = 'FILE_PATH',
+    ) # type: ignore
+
+    profile_file_name: StringProperty(
+        name = "cProfile file",
+        description = "Run cProfile while importing the file with this name; the stats are saved as <name>.prof",
+        default = "",
+    ) # type: ignore
+
+    use_cache: BoolProperty(
+        name = "Bake cache",
+        description = "Reuse the baked root motion of unchanged files; the cache is keyed by the file content and the bake settings",
+        default = False,
+    ) # type: ignore
+
+    cache_size: IntProperty(
+        name = "Cache size (MB)",
+        description = "Least recently used entries are removed above this size",
+        default = 512,
+        min = 1,
+    ) # type: ignore
+
     ## name settings
     armature_name: StringProperty(
         name = "Armature",
@@ -464,6 +822,12 @@ class BatchImport(Operator, ImportHelper):
         default = "mixamorig:",
     ) # type: ignore
 
+    bone_remap: StringProperty(
+        name = "Bone remap",
+        description = "Extra bone renames, 'old=new' pairs separated by commas; old is the name after the prefix / suffix options or the original name",
+        default = "",
+    ) # type: ignore
+
     main_bone_name: StringProperty(
         name = "Main bone",
         description = "Original root bone name, which contains animation data",
@@ -518,27 +882,145 @@ class BatchImport(Operator, ImportHelper):
         default = "mixamorig:Spine",
     ) # type: ignore
 
+    def main_keywords(self) -> dict:
+        """ operator properties passed to main(), with the scene frame rate at the start of the batch """
+        return dict(self.as_keywords(ignore=BATCH_PROPERTIES), scene_fps=self._scene_fps)
+
+    def invoke(self, context, event):
+        self.is_invoked = True
+        return ImportHelper.invoke(self, context, event)
+
     def execute(self, context):
-        for file in self.files:
-            file_path = os.path.join(self.directory, file.name)
-            main(context, file_path=file_path, 
-                is_apply_transform=self.is_apply_transforms, is_rename_action=self.is_rename_action, 
-                is_remove_prefix=self.is_remove_prefix, is_suffix_format=self.is_suffix_format, 
-                is_delete_armature=self.is_delete_armature, 
-                is_add_root=self.is_add_root, method=self.method, is_start_feet=self.is_start_feet,
-                bake_x=self.bake_x, bake_y=self.bake_y, bake_z=self.bake_z,
-                armature_name=self.armature_name, root_name=self.root_name, prefix_name=self.prefix_name,
-                main_bone_name=self.main_bone_name, head_top_bone_name=self.head_top_bone_name,
-                spine_bone_name=self.spine_bone_name, left_hand_bone_name=self.left_hand_bone_name,
-                right_hand_bone_name=self.right_hand_bone_name, left_foot_bone_name=self.left_foot_bone_name, 
-                right_foot_bone_name=self.right_foot_bone_name, left_toe_bone_name=self.left_toe_bone_name,
-                right_toe_bone_name=self.right_toe_bone_name,
-                )
+        ## the imports change the frame rate of the scene
+        self._scene_fps = context.scene.render.fps / context.scene.render.fps_base
+        if self.is_sync_folder:
+            return self.execute_sync(context)
+
+        file_paths = [os.path.join(self.directory, file.name) for file in self.files]
+        if self.use_parallel and len(file_paths) > 1:
+            results = batch_workers.run_parallel(context, file_paths, options=self.main_keywords(),
+                                                 worker_count=self.worker_count, shard_by_size=self.shard_by_size,
+                                                 file_timeout=self.file_timeout)
+            reports = [profiling.FileReport.from_dict(results[f]) for f in file_paths if f in results]
+        elif self.use_modal and self.is_invoked and context.window is not None and not bpy.app.background:
+            return self.start_modal(context, file_paths)
+        else:
+            reports = [self.import_file(context, file_path) for file_path in file_paths]
+        return self.finish(reports, file_count=len(file_paths))
+
+    def import_file(self, context, file_path: str) -> profiling.FileReport:
+        """ main() for one file, with cProfile for the selected file """
+        report = profiling.FileReport(file_path)
+        if self.profile_file_name and os.path.basename(file_path) == self.profile_file_name:
+            with profiling.profile(self.stats_path(file_path)):
+                main(context, file_path=file_path, report=report, **self.main_keywords())
+        else:
+            main(context, file_path=file_path, report=report, **self.main_keywords())
+        return report
+
+    def start_modal(self, context, file_paths: list):
+        """ one file per timer tick, the interface stays responsive """
+        self._file_paths = file_paths
+        self._reports = []
+        self._is_cancelled = False
+        self._start_time = time.perf_counter()
+        window_manager = context.window_manager
+        window_manager.progress_begin(0, len(file_paths))
+        self._timer = window_manager.event_timer_add(0.01, window=context.window)
+        window_manager.modal_handler_add(self)
+        return {'RUNNING_MODAL'}
+
+    def modal(self, context, event):
+        if event.type == 'ESC':
+            ## the current file is already done, stop before the next one
+            self._is_cancelled = True
+        if event.type != 'TIMER':
+            return {'RUNNING_MODAL'} if event.type == 'ESC' else {'PASS_THROUGH'}
+
+        done = len(self._reports)
+        if self._is_cancelled or done >= len(self._file_paths):
+            return self.end_modal(context)
+        file_path = self._file_paths[done]
+        context.workspace.status_text_set(self.status_text(done, os.path.basename(file_path)))
+        self._reports.append(self.import_file(context, file_path))
+        context.window_manager.progress_update(len(self._reports))
+        return {'RUNNING_MODAL'}
+
+    def status_text(self, done: int, file_name: str) -> str:
+        """ progress and estimated remaining time """
+        text = f"Mixamo import {done + 1} / {len(self._file_paths)}: {file_name}"
+        if done:
+            remaining = (time.perf_counter() - self._start_time) / done * (len(self._file_paths) - done)
+            text += f"  (about {int(remaining // 60)}:{int(remaining % 60):02d} left)"
+        return text + "  Esc: stop"
+
+    def end_modal(self, context):
+        window_manager = context.window_manager
+        window_manager.event_timer_remove(self._timer)
+        window_manager.progress_end()
+        context.workspace.status_text_set(None)
+        if self._is_cancelled:
+            self.report({'WARNING'}, f"Stopped after {len(self._reports)} / {len(self._file_paths)} files")
+        return self.finish(self._reports, file_count=len(self._file_paths))
+
+    def stats_path(self, file_path: str) -> str:
+        """ cProfile stats next to the trace, or next to the fbx file """
+        folder = os.path.dirname(bpy.path.abspath(self.trace_path)) if self.trace_path else os.path.dirname(file_path)
+        return os.path.join(folder, os.path.splitext(os.path.basename(file_path))[0] + ".prof")
+
+    def finish(self, reports: list, file_count: int):
+        """ report failed files, the profile summary and write the trace """
+        failed = [r for r in reports if r.status != 'OK']
+        for report in failed:
+            self.report({'WARNING'}, f"{os.path.basename(report.file_path)}: {report.error}")
+        if self.is_profile:
+            self.report({'INFO'}, profiling.summary(reports))
+        if self.trace_path:
+            profiling.write_trace(reports, bpy.path.abspath(self.trace_path))
+        merged = [r for r in reports if r.duplicate_of]
+        if merged:
+            self.report({'INFO'}, f"{len(merged)} duplicate files merged: " + ", ".join(
+                f"{os.path.basename(r.file_path)} -> {r.duplicate_of}" for r in merged))
+        reduced = [r.keyframes for r in reports if r.keyframes]
+        if reduced:
+            self.report({'INFO'}, f"Keyframes reduced from {sum(k[0] for k in reduced)} to {sum(k[1] for k in reduced)}")
+        self.report({'INFO'}, f"Imported {len(reports) - len(failed) - len(merged)} / {file_count} files")
+        return {'FINISHED'}
+
+    def execute_sync(self, context):
+        """ import new / changed files of the folder, optionally keep watching it """
+        result = folder_sync.sync(context, self.directory, options=self.main_keywords(), on_deleted=self.sync_deleted)
+        for name in result["failed"]:
+            self.report({'WARNING'}, f"{name}: import failed")
+        self.report({'INFO'}, f"{len(result['new'])} new, {len(result['changed'])} changed, "
+                              f"{len(result['deleted'])} deleted")
+        if self.is_watch_folder:
+            folder_sync.start_watch(self.directory, options=self.main_keywords(), on_deleted=self.sync_deleted,
+                                    interval=self.watch_interval)
         return {'FINISHED'}
     
     def draw(self, context):
         pass
 
+class StopWatchFolder(Operator):
+    """ Stop watching all synced folders """
+    bl_idname = "import_mixamo.stop_watch"
+    bl_label = "Stop Watching Folders"
+
+    def execute(self, context):
+        folder_sync.stop_watch()
+        return {'FINISHED'}
+
+class ClearBakeCache(Operator):
+    """ Remove all entries of the bake cache """
+    bl_idname = "import_mixamo.clear_cache"
+    bl_label = "Clear Bake Cache"
+
+    def execute(self, context):
+        count = bake_cache.clear()
+        self.report({'INFO'}, f"Removed {count} cache entries")
+        return {'FINISHED'}
+
 ## Panel: import setings
 class IMPORT_PT_base_settings(Panel):
     bl_space_type = 'FILE_BROWSER'
@@ -555,6 +1037,12 @@ class IMPORT_PT_base_settings(Panel):
         layout = self.layout
         sfile = context.space_data
         operator = sfile.active_operator
+        layout.prop(operator, 'import_mode')
+        layout.prop(operator, 'import_profile')
+        layout.prop(operator, 'duplicate_mode')
+        row = layout.row(align=True)
+        row.prop(operator, 'primary_bone_axis', text="")
+        row.prop(operator, 'secondary_bone_axis', text="")
         column = layout.column(align=True)
         column.prop(operator, 'is_apply_transforms', icon='CON_TRANSFORM')
         column.prop(operator, 'is_add_root', icon='GROUP_BONE')
@@ -583,6 +1071,13 @@ class IMPORT_PT_bake_settings(Panel):
         operator = sfile.active_operator
 
         layout.prop(operator, 'method')
+        if operator.method == 'LOWEST_BONE':
+            layout.prop(operator, 'contact_bone_names')
+        layout.prop(operator, 'sample_mode')
+        row = layout.row(align=True)
+        row.prop(operator, 'resample_mode')
+        if operator.resample_mode == 'CUSTOM':
+            row.prop(operator, 'resample_fps')
         layout.prop(operator, 'is_start_feet', icon='ACTION')
 
         row = layout.row(align=True)
@@ -590,6 +1085,120 @@ class IMPORT_PT_bake_settings(Panel):
         row.prop(operator, 'bake_y', icon='KEYFRAME_HLT')
         row.prop(operator, 'bake_z', icon='KEYFRAME_HLT')
 
+        layout.prop(operator, 'sidecar_format')
+        if operator.sidecar_format != 'NONE':
+            layout.prop(operator, 'sidecar_dir')
+
+## Panel: keyframe reduction
+class IMPORT_PT_reduce_settings(Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = "Reduce Keyframes"
+    bl_parent_id = "IMPORT_PT_base_settings"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        return operator.bl_idname == "IMPORT_MIXAMO_OT_root_motion"
+
+    def draw_header(self, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        self.layout.prop(operator, 'use_reduce_keys', text="")
+
+    def draw(self, context):
+        layout = self.layout
+        sfile = context.space_data
+        operator = sfile.active_operator
+
+        column = layout.column(align=True)
+        column.active = operator.use_reduce_keys
+        column.prop(operator, 'reduce_location_tolerance')
+        column.prop(operator, 'reduce_rotation_tolerance')
+        column.prop(operator, 'reduce_scale_tolerance')
+
+## Panel: batch settings
+class IMPORT_PT_batch_settings(Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = "Batch"
+    bl_parent_id = "IMPORT_PT_base_settings"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        return operator.bl_idname == "IMPORT_MIXAMO_OT_root_motion"
+
+    def draw_header(self, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        self.layout.prop(operator, 'use_parallel', text="")
+
+    def draw(self, context):
+        layout = self.layout
+        sfile = context.space_data
+        operator = sfile.active_operator
+
+        column = layout.column(align=True)
+        column.active = operator.use_parallel
+        column.prop(operator, 'worker_count')
+        column.prop(operator, 'shard_by_size')
+        column.prop(operator, 'file_timeout')
+
+        row = layout.row()
+        row.active = not operator.use_parallel
+        row.prop(operator, 'use_modal')
+
+        column = layout.column(align=True)
+        column.prop(operator, 'use_cache')
+        row = column.row(align=True)
+        row.active = operator.use_cache
+        row.prop(operator, 'cache_size')
+        row.operator(ClearBakeCache.bl_idname, text="", icon='TRASH')
+
+        column = layout.column(align=True)
+        column.prop(operator, 'is_profile')
+        column.prop(operator, 'trace_path')
+        column.prop(operator, 'profile_file_name')
+
+## Panel: folder sync settings
+class IMPORT_PT_sync_settings(Panel):
+    bl_space_type = 'FILE_BROWSER'
+    bl_region_type = 'TOOL_PROPS'
+    bl_label = "Folder Sync"
+    bl_parent_id = "IMPORT_PT_base_settings"
+    bl_options = {'DEFAULT_CLOSED'}
+
+    @classmethod
+    def poll(cls, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        return operator.bl_idname == "IMPORT_MIXAMO_OT_root_motion"
+
+    def draw_header(self, context):
+        sfile = context.space_data
+        operator = sfile.active_operator
+        self.layout.prop(operator, 'is_sync_folder', text="")
+
+    def draw(self, context):
+        layout = self.layout
+        sfile = context.space_data
+        operator = sfile.active_operator
+
+        column = layout.column(align=True)
+        column.active = operator.is_sync_folder
+        column.prop(operator, 'sync_deleted')
+        column.prop(operator, 'is_watch_folder')
+        row = column.row(align=True)
+        row.active = operator.is_watch_folder
+        row.prop(operator, 'watch_interval')
+        if folder_sync.watched_folders():
+            layout.operator(StopWatchFolder.bl_idname, icon='CANCEL')
+
 ## Panel: name settings
 class IMPORT_PT_name_settings(Panel):
     bl_space_type = 'FILE_BROWSER'
@@ -613,6 +1222,7 @@ class IMPORT_PT_name_settings(Panel):
         column.prop(operator, 'armature_name')
         column.prop(operator, 'root_name')
         column.prop(operator, 'prefix_name')
+        column.prop(operator, 'bone_remap')
         column.prop(operator, 'main_bone_name')
         column.prop(operator, 'head_top_bone_name')
         column.prop(operator, 'spine_bone_name')
@@ -630,16 +1240,29 @@ def menu_func_import(self, context):
 # Register and add to the "file selector" menu (required to use F3 search "Text Import Operator" for quick access).
 def register():
     bpy.utils.register_class(BatchImport)
+    bpy.utils.register_class(ClearBakeCache)
+    bpy.utils.register_class(StopWatchFolder)
     bpy.utils.register_class(IMPORT_PT_base_settings)
     bpy.utils.register_class(IMPORT_PT_bake_settings)
+    bpy.utils.register_class(IMPORT_PT_reduce_settings)
+    bpy.utils.register_class(IMPORT_PT_batch_settings)
+    bpy.utils.register_class(IMPORT_PT_sync_settings)
     bpy.utils.register_class(IMPORT_PT_name_settings)
     bpy.types.TOPBAR_MT_file_import.append(menu_func_import)
+    bpy.app.handlers.load_pre.append(folder_sync.stop_watch_on_load)
 
 def unregister():
+    bpy.app.handlers.load_pre.remove(folder_sync.stop_watch_on_load)
     bpy.types.TOPBAR_MT_file_import.remove(menu_func_import)
     bpy.utils.unregister_class(IMPORT_PT_name_settings)
+    bpy.utils.unregister_class(IMPORT_PT_sync_settings)
+    bpy.utils.unregister_class(IMPORT_PT_batch_settings)
+    bpy.utils.unregister_class(IMPORT_PT_reduce_settings)
     bpy.utils.unregister_class(IMPORT_PT_bake_settings)
     bpy.utils.unregister_class(IMPORT_PT_base_settings)
+    folder_sync.stop_watch()
+    bpy.utils.unregister_class(StopWatchFolder)
+    bpy.utils.unregister_class(ClearBakeCache)
     bpy.utils.unregister_class(BatchImport)
 
 if __name__ == "__main__":
@@ -0,0 +1,96 @@
+""" Animation library: one armature per skeleton, every imported file only adds an action """
+import hashlib
+import bpy
+
+from bpy.types import Object, Scene
+from . import scene_utils
+
+
+SIGNATURE_PROP = "mixamo_skeleton"
+## animation fingerprint of an imported action, file names of the duplicates aliased to it
+FINGERPRINT_PROP = "mixamo_fingerprint"
+ALIASES_PROP = "mixamo_aliases"
+
+
+def skeleton_signature(obj: Object) -> str:
+    """ hash of the bone hierarchy and rest pose, computed right after the fbx import """
+    digest = hashlib.sha1()
+    digest.update(repr([round(v, 4) for row in obj.matrix_world for v in row]).encode())
+    for bone in sorted(obj.data.bones, key=lambda b: b.name):
+        parent = bone.parent.name if bone.parent else ""
+        matrix = [round(v, 4) for row in bone.matrix_local for v in row]
+        digest.update(repr((bone.name, parent, matrix)).encode())
+    return digest.hexdigest()
+
+
+def find_armature(scene: Scene, signature: str):
+    """ library armature of the skeleton in the scene, or None """
+    for obj in scene.objects:
+        if obj.type == 'ARMATURE' and obj.get(SIGNATURE_PROP) == signature:
+            return obj
+    return None
+
+
+def find_action(fingerprint: str, exclude=None):
+    """ imported action with the animation fingerprint, or None """
+    for action in bpy.data.actions:
+        if action != exclude and action.get(FINGERPRINT_PROP) == fingerprint:
+            return action
+    return None
+
+
+def add_alias(action, name: str):
+    """ record a duplicate file as an alias of the action """
+    aliases = list(action.get(ALIASES_PROP, ()))
+    if name not in aliases:
+        action[ALIASES_PROP] = aliases + [name]
+    return {'FINISHED'}
+
+
+def stash(obj: Object, action):
+    """ muted NLA track of the action on the library armature; the slot (4.4+) is renamed to the armature,
+    so assigning the action to it animates it """
+    animation_data = obj.animation_data or obj.animation_data_create()
+    if any(strip.action == action for track in animation_data.nla_tracks for strip in track.strips):
+        return {'FINISHED'}
+    slot = None
+    if bpy.app.version >= (4, 4, 0) and len(action.slots):
+        ## the slot was named after the deleted import object (OBArmature.001)
+        slot = action.slots[0]
+        slot.name_display = obj.name
+    track = animation_data.nla_tracks.new()
+    track.name = action.name
+    track.mute = True
+    strip = track.strips.new(action.name, int(action.frame_range[0]), action)
+    if slot is not None:
+        strip.action_slot = slot
+    return {'FINISHED'}
+
+
+def unstash(obj: Object, actions: set):
+    """ remove the NLA tracks of the actions from the armature """
+    if obj.animation_data is None:
+        return {'FINISHED'}
+    tracks = obj.animation_data.nla_tracks
+    for track in list(tracks):
+        if any(strip.action in actions for strip in track.strips):
+            tracks.remove(track)
+    return {'FINISHED'}
+
+
+def store(scene: Scene, collection, obj: Object, signature: str) -> Object:
+    """ keep the action of the imported armature, stashed on the library armature of the skeleton;
+    only the first armature of a skeleton is kept in the scene """
+    action = obj.animation_data.action
+    action.use_fake_user = True
+    action[SIGNATURE_PROP] = signature
+
+    target = find_armature(scene, signature)
+    if target is None:
+        obj[SIGNATURE_PROP] = signature
+        stash(obj, action)
+        scene_utils.link_hierarchy(obj, collection)
+        return obj
+    stash(target, action)
+    scene_utils.remove_hierarchy(obj)
+    return target
@@ -0,0 +1,123 @@
+""" Floor contact height of the skinned meshes of an armature from a small set of candidate vertices """
+import bpy
+import hashlib
+import numpy as np
+
+from bpy.types import Object
+from . import library, pose_sampler, profiling, trajectory
+
+
+## weights per vertex kept for skinning, Mixamo uses up to 4
+MAX_INFLUENCES = 4
+## candidates of recently sampled meshes, every clip of a character imports the same mesh again
+CACHE_SIZE = 16
+## mesh key: candidates, points, groups, weights
+_candidates = {}
+
+
+def skinned_meshes(obj: Object) -> list:
+    """ mesh objects deformed by the armature through an armature modifier """
+    return [child for child in obj.children_recursive if child.type == 'MESH' and len(child.data.vertices)
+            and any(m.type == 'ARMATURE' and m.object == obj and m.show_viewport for m in child.modifiers)]
+
+
+class MeshSampler():
+    """ lowest vertex height per sample; every mesh is narrowed to the outermost vertices of each bone region
+
+    The candidates are picked once in the rest pose: every vertex belongs to the bone with its largest
+    weight, each bone region keeps the vertices that are outermost along 26 directions.
+    """
+    def __init__(self, obj: Object, meshes: list, count: int = 2):
+        self.obj = obj
+        bones = obj.data.bones
+        self.bone_names = sorted({group.name for mesh_obj in meshes for group in mesh_obj.vertex_groups
+                                  if group.name in bones and bones[group.name].use_deform})
+        bone_index = {name: i for i, name in enumerate(self.bone_names)}
+        static = len(self.bone_names)  ## influence of vertices without bone weights
+        matrix_world = np.array(obj.matrix_world, dtype=np.float64)
+
+        self.meshes = []  ## (mesh object, vertex count, candidates, points, groups, weights)
+        signature = library.skeleton_signature(obj)
+        for mesh_obj in meshes:
+            vertices = mesh_obj.data.vertices
+            co = np.empty(len(vertices) * 3, dtype=np.float32)
+            vertices.foreach_get('co', co)
+            ## mesh space -> armature space, like the armature modifier
+            matrix = np.linalg.inv(matrix_world) @ np.array(mesh_obj.matrix_world, dtype=np.float64)
+            key = self.mesh_key(signature, mesh_obj, co, matrix, count)
+            if key not in _candidates:
+                points = trajectory.transform_points(matrix, co.reshape(-1, 3))
+                _candidates[key] = self.pick_candidates(mesh_obj, points, bone_index, static, count)
+                while len(_candidates) > CACHE_SIZE:
+                    _candidates.pop(next(iter(_candidates)))
+            self.meshes.append((mesh_obj, len(vertices)) + _candidates[key])
+
+    def mesh_key(self, signature: str, mesh_obj: Object, co, matrix, count: int) -> str:
+        """ skeleton signature, rest vertices, placement and vertex groups of the mesh """
+        digest = hashlib.sha1(f"{signature}:{count}".encode())
+        digest.update(co.tobytes())
+        digest.update(np.round(matrix, 6).tobytes())
+        digest.update(repr([group.name for group in mesh_obj.vertex_groups]).encode())
+        digest.update(repr(self.bone_names).encode())
+        return digest.hexdigest()
+
+    @staticmethod
+    def pick_candidates(mesh_obj: Object, points, bone_index: dict, static: int, count: int) -> tuple:
+        """ -> candidates, points, groups, weights of the candidates """
+        vertices = mesh_obj.data.vertices
+        group_bone = {group.index: bone_index.get(group.name, -1) for group in mesh_obj.vertex_groups}
+        groups = np.full((len(vertices), MAX_INFLUENCES), static, dtype=np.int64)
+        weights = np.zeros((len(vertices), MAX_INFLUENCES))
+        for v in vertices:
+            influences = sorted(((g.weight, group_bone.get(g.group, -1)) for g in v.groups), reverse=True)
+            influences = [(w, b) for w, b in influences if b >= 0 and w > 0.0][:MAX_INFLUENCES]
+            for k, (w, b) in enumerate(influences):
+                groups[v.index, k], weights[v.index, k] = b, w
+        total = weights.sum(axis=1)
+        weights[total > 0] /= total[total > 0, None]
+        weights[total <= 0, 0] = 1.0
+
+        candidates = []
+        dominant = groups[np.arange(len(groups)), weights.argmax(axis=1)]
+        for b in np.unique(dominant):
+            region = np.flatnonzero(dominant == b)
+            candidates.append(region[trajectory.extreme_indices(points[region], count=count)])
+        candidates = np.concatenate(candidates)
+        return candidates, points[candidates], groups[candidates], weights[candidates]
+
+    def heights_action(self, times) -> np.ndarray:
+        """ (N,) lowest world height; bones from the action (PoseSampler), linear blend skinning of the candidates """
+        times = np.asarray(times, dtype=np.float64).reshape(-1)
+        matrix_world = np.array(self.obj.matrix_world, dtype=np.float64)
+        rows = np.tile(matrix_world[2], (len(times), len(self.bone_names) + 1, 1))
+        if self.bone_names:
+            sampler = pose_sampler.PoseSampler(self.obj, self.bone_names)
+            pose = sampler.pose_matrices(times)[[sampler.index[name] for name in self.bone_names]]
+            rest = np.array([self.obj.data.bones[name].matrix_local for name in self.bone_names], dtype=np.float64)
+            skin = pose @ np.linalg.inv(rest)[:, None]  ## (G,N,4,4)
+            rows[:, :-1] = np.einsum('j,gnjk->ngk', matrix_world[2], skin)
+        return np.min([trajectory.lowest_skinned_height(points, groups, weights, rows)
+                       for _, _, _, points, groups, weights in self.meshes], axis=0)
+
+    def heights_depsgraph(self, times) -> np.ndarray:
+        """ (N,) lowest world height of the candidates of the evaluated meshes, frame_set per sample """
+        times = np.asarray(times, dtype=np.float64).reshape(-1)
+        heights = np.empty(len(times))
+        for i, t in enumerate(times):
+            frame = int(np.floor(t))
+            profiling.frame_set(bpy.context.scene, frame, subframe=float(t - frame))
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            lowest = np.inf
+            for mesh_obj, count, candidates, _, _, _ in self.meshes:
+                evaluated = mesh_obj.evaluated_get(depsgraph)
+                vertices = evaluated.data.vertices
+                co = np.empty(len(vertices) * 3, dtype=np.float32)
+                vertices.foreach_get('co', co)
+                co = co.reshape(-1, 3)
+                ## modifiers that change the topology: use all vertices
+                if len(vertices) == count:
+                    co = co[candidates]
+                z_row = np.array(evaluated.matrix_world, dtype=np.float64)[2]
+                lowest = min(lowest, float((co @ z_row[:3] + z_row[3]).min()))
+            heights[i] = lowest
+        return heights
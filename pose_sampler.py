@@ -0,0 +1,115 @@
+""" Sample bone locations without scene updates: evaluate the action fcurves, then forward kinematics """
+import bpy
+import numpy as np
+
+from bpy.types import Object
+from . import curve_io, profiling, trajectory
+
+
+class PoseSampler():
+    """ pose bone matrices for a set of bone chains at all sample times at once
+
+    Evaluates only the action (no NLA, drivers or constraints) with full rotation/scale inheritance,
+    which is what Mixamo armatures use. The depsgraph sampler is kept as a reference to validate it.
+    """
+    def __init__(self, obj: Object, bone_names):
+        self.obj = obj
+        self.action = obj.animation_data.action
+        self.fcurves = curve_io.get_channelbag(self.action).fcurves
+
+        ## bone chains: every requested bone and all of its parents, parents first
+        bones = self.obj.data.bones
+        chain = set()
+        for name in bone_names:
+            bone = bones[name]
+            while bone is not None and bone.name not in chain:
+                chain.add(bone.name)
+                bone = bone.parent
+        self.bone_names = sorted(chain, key=lambda name: len(bones[name].parent_recursive))
+        index = {name: i for i, name in enumerate(self.bone_names)}
+        self.parents = [index[bones[name].parent.name] if bones[name].parent else -1 for name in self.bone_names]
+        self.rest_matrices = np.array([bones[name].matrix_local for name in self.bone_names], dtype=np.float64)
+        self.index = index
+
+    def evaluate_channel(self, bone_name: str, prop: str, size: int, times) -> np.ndarray:
+        """ (N,size) values of a pose bone property; not animated channels keep their current value """
+        pose_bone = self.obj.pose.bones[bone_name]
+        data_path = f'pose.bones["{bpy.utils.escape_identifier(bone_name)}"].{prop}'
+        values = np.empty((len(times), size))
+        for i in range(size):
+            fcurve = self.fcurves.find(data_path, index=i)
+            if fcurve is None or fcurve.mute:
+                values[:, i] = getattr(pose_bone, prop)[i]
+            elif len(fcurve.modifiers) or fcurve.extrapolation != 'CONSTANT':
+                values[:, i] = [fcurve.evaluate(t) for t in times]
+            else:
+                co, handle_left, handle_right = curve_io.read_keyframes(fcurve)
+                interpolation = np.empty(len(co), dtype=np.int32)
+                fcurve.keyframe_points.foreach_get('interpolation', interpolation)
+                if trajectory.has_easing(interpolation):
+                    ## easing types are evaluated by Blender
+                    values[:, i] = [fcurve.evaluate(t) for t in times]
+                else:
+                    values[:, i] = trajectory.evaluate_keyframes(co, handle_left, handle_right, interpolation, times)
+        return values
+
+    def basis_matrices(self, bone_name: str, times) -> np.ndarray:
+        """ (N,4,4) PoseBone.matrix_basis per sample """
+        rotation_mode = self.obj.pose.bones[bone_name].rotation_mode
+        location = self.evaluate_channel(bone_name, 'location', 3, times)
+        scale = self.evaluate_channel(bone_name, 'scale', 3, times)
+        if rotation_mode == 'QUATERNION':
+            rotation = trajectory.quaternion_to_matrix(self.evaluate_channel(bone_name, 'rotation_quaternion', 4, times))
+        elif rotation_mode == 'AXIS_ANGLE':
+            rotation = trajectory.axis_angle_to_matrix(self.evaluate_channel(bone_name, 'rotation_axis_angle', 4, times))
+        else:
+            rotation = trajectory.euler_to_matrix(self.evaluate_channel(bone_name, 'rotation_euler', 3, times),
+                                                  order=rotation_mode)
+        return trajectory.compose_matrices(location, rotation, scale)
+
+    def pose_matrices(self, times) -> np.ndarray:
+        """ (B,N,4,4) PoseBone.matrix (armature space) of all chain bones """
+        times = np.asarray(times, dtype=np.float64).reshape(-1)
+        basis = np.array([self.basis_matrices(name, times) for name in self.bone_names])
+        return trajectory.forward_kinematics(self.rest_matrices, self.parents, basis)
+
+    def sample_heads(self, times, space: str = 'WORLD') -> dict:
+        """ bone name: (N,3) head location per sample; space: 'WORLD' or 'ARMATURE' """
+        pose = self.pose_matrices(times)
+        heads = {}
+        for name, i in self.index.items():
+            head = pose[i, :, :3, 3]
+            if space == 'WORLD':
+                head = trajectory.transform_points(self.obj.matrix_world, head)
+            heads[name] = head
+        return heads
+
+
+def sample_heads_depsgraph(obj: Object, bone_names, times, space: str = 'WORLD') -> dict:
+    """ reference sampler: update the whole scene with frame_set for every sample
+
+    All pose bone matrices are read with one foreach_get per sample, heads are moved to world space at the end.
+    """
+    times = np.asarray(times, dtype=np.float64).reshape(-1)
+    pose_bones = obj.pose.bones
+    index = [pose_bones.find(name) for name in bone_names]
+    if -1 in index:
+        raise KeyError(f"bone not found: {bone_names[index.index(-1)]}")
+    buffer = np.empty(len(pose_bones) * 16, dtype=np.float32)
+    heads = np.empty((len(times), len(index), 3))
+    matrix_world = np.empty((len(times), 4, 4))
+    for i, t in enumerate(times):
+        frame = int(np.floor(t))
+        profiling.frame_set(bpy.context.scene, frame, subframe=float(t - frame))
+        pose_bones.foreach_get('matrix', buffer)
+        ## matrices are read column-major: row 3 of the transposed matrix is the translation
+        heads[i] = buffer.reshape(-1, 4, 4)[index, 3, :3]
+        matrix_world[i] = obj.matrix_world
+    if space == 'WORLD':
+        heads = np.einsum('nij,nbj->nbi', matrix_world[:, :3, :3], heads) + matrix_world[:, None, :3, 3]
+    return {name: heads[:, b] for b, name in enumerate(bone_names)}
+
+
+def max_error(heads: dict, reference: dict) -> float:
+    """ max coordinate difference between two samplings, e.g. action sampler and depsgraph reference """
+    return max((float(np.abs(heads[name] - reference[name]).max(initial=0.0)) for name in reference), default=0.0)
@@ -0,0 +1,182 @@
+""" Per file report and stage instrumentation: wall time, frame_set calls and memory per stage """
+import cProfile
+import csv
+import json
+import os
+import pstats
+import sys
+import time
+
+from contextlib import contextmanager
+
+
+## number of scene.frame_set calls made through frame_set()
+_frame_set_count = 0
+
+
+def frame_set(scene, frame: int, subframe: float = 0.0):
+    """ scene.frame_set, counted for the stage report """
+    global _frame_set_count
+    _frame_set_count += 1
+    scene.frame_set(frame, subframe=subframe)
+
+
+def frame_set_count() -> int:
+    return _frame_set_count
+
+
+def _windows_memory_counters():
+    """ PROCESS_MEMORY_COUNTERS of the current process or None """
+    import ctypes
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD),
+                    ("PeakWorkingSetSize", ctypes.c_size_t), ("WorkingSetSize", ctypes.c_size_t),
+                    ("QuotaPeakPagedPoolUsage", ctypes.c_size_t), ("QuotaPagedPoolUsage", ctypes.c_size_t),
+                    ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t), ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+                    ("PagefileUsage", ctypes.c_size_t), ("PeakPagefileUsage", ctypes.c_size_t)]
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    handle = ctypes.windll.kernel32.GetCurrentProcess()
+    if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return counters
+    return None
+
+
+def peak_memory_usage() -> int:
+    """ peak resident memory of the process in bytes """
+    if sys.platform == "win32":
+        counters = _windows_memory_counters()
+        return counters.PeakWorkingSetSize if counters else 0
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    import resource
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def memory_usage() -> int:
+    """ resident memory of the process in bytes; peak resident memory where the current one is not available """
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, AttributeError):
+        pass
+    if sys.platform == "win32":
+        counters = _windows_memory_counters()
+        return counters.WorkingSetSize if counters else 0
+    return peak_memory_usage()
+
+
+class FileReport():
+    """ result of main() for one file """
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.status = 'OK'
+        self.error = ""
+        self.frame_count = 0
+        self.cache = ""  ## HIT / MISS when the bake cache is used
+        self.actions = []
+        self.duplicate_of = ""  ## existing action with the same animation fingerprint
+        self.keyframes = []  ## keyframe count before / after the keyframe reduction
+        self.timings = {}  ## stage: seconds
+        self.frame_sets = {}  ## stage: frame_set calls
+        self.memory = {}  ## stage: resident memory change in bytes
+        self.memory_start = memory_usage()
+        self.memory_delta = 0
+
+    @contextmanager
+    def stage(self, name: str):
+        """ time a pipeline stage; the same stage may run more than once """
+        start, frame_sets, memory = time.perf_counter(), frame_set_count(), memory_usage()
+        try:
+            yield
+        finally:
+            self.timings[name] = self.timings.get(name, 0.0) + time.perf_counter() - start
+            self.frame_sets[name] = self.frame_sets.get(name, 0) + frame_set_count() - frame_sets
+            self.memory[name] = self.memory.get(name, 0) + memory_usage() - memory
+
+    def fail(self, error: Exception):
+        self.status = 'FAILED'
+        self.error = f"{type(error).__name__}: {error}"
+
+    def close(self):
+        """ end of the file: memory change of the whole file """
+        self.memory_delta = memory_usage() - self.memory_start
+
+    @property
+    def total_time(self) -> float:
+        return sum(self.timings.values())
+
+    def as_dict(self) -> dict:
+        return {
+            "file": self.file_path,
+            "status": self.status,
+            "error": self.error,
+            "frame_count": self.frame_count,
+            "cache": self.cache,
+            "actions": self.actions,
+            "duplicate_of": self.duplicate_of,
+            "keyframes": self.keyframes,
+            "timings": self.timings,
+            "frame_sets": self.frame_sets,
+            "memory": self.memory,
+            "memory_delta": self.memory_delta,
+            "total_time": self.total_time,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        report = cls(data["file"])
+        for key, value in data.items():
+            if key not in ("file", "total_time"):
+                setattr(report, key, value)
+        return report
+
+
+def summary(reports: list) -> str:
+    """ one line: files, total time and the slowest stages """
+    stages = {}
+    for report in reports:
+        for name, seconds in report.timings.items():
+            stages[name] = stages.get(name, 0.0) + seconds
+    total = sum(stages.values())
+    frame_sets = sum(sum(report.frame_sets.values()) for report in reports)
+    top = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in sorted(stages.items(), key=lambda s: -s[1])[:4])
+    return f"{len(reports)} files in {total:.2f}s ({frame_sets} frame_set); {top}"
+
+
+def write_trace(reports: list, path: str):
+    """ per file and stage rows; .csv or .json by the file extension """
+    rows = [{"file": report.file_path, "stage": name, "seconds": seconds,
+             "frame_set": report.frame_sets.get(name, 0), "memory_delta": report.memory.get(name, 0)}
+            for report in reports for name, seconds in report.timings.items()]
+    if path.lower().endswith(".csv"):
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=["file", "stage", "seconds", "frame_set", "memory_delta"])
+            writer.writeheader()
+            writer.writerows(rows)
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({"files": [report.as_dict() for report in reports], "stages": rows}, f, indent=2)
+    return {'FINISHED'}
+
+
+@contextmanager
+def profile(stats_path: str, top: int = 30):
+    """ cProfile around a block; the stats are saved to stats_path and the top entries printed """
+    profiler = cProfile.Profile()
+    profiler.enable()
+    try:
+        yield profiler
+    finally:
+        profiler.disable()
+        profiler.dump_stats(stats_path)
+        pstats.Stats(profiler).sort_stats('cumulative').print_stats(top)
+        print(f"profile saved to {stats_path}")
@@ -0,0 +1,96 @@
+""" Scene / datablock helpers that do not depend on the current selection """
+import bpy
+
+from contextlib import contextmanager
+from bpy.types import Context, Object
+from mathutils import Matrix
+
+
+## datablock types an fbx import creates
+IMPORT_ID_TYPES = ("objects", "meshes", "armatures", "materials", "images", "textures", "node_groups",
+                   "actions", "collections", "cameras", "lights", "curves")
+
+
+def id_snapshot() -> set:
+    """ all datablocks an import can create, to find the new ones afterwards """
+    return {i for attr in IMPORT_ID_TYPES for i in getattr(bpy.data, attr)}
+
+
+def purge_orphans(before: set) -> int:
+    """ remove datablocks created since <before> that nothing uses, until no new orphan is left; -> count """
+    removed = 0
+    while True:
+        orphans = [i for i in id_snapshot() - before if i.users == 0 and not i.use_fake_user]
+        if not orphans:
+            return removed
+        bpy.data.batch_remove(orphans)
+        removed += len(orphans)
+
+
+@contextmanager
+def scratch_scene(context: Context, name: str = "Mixamo Import"):
+    """ run the block in a temporary scene; operators and frame_set only see the imported objects """
+    scene = bpy.data.scenes.new(name)
+    scene.render.fps = context.scene.render.fps
+    scene.render.fps_base = context.scene.render.fps_base
+    try:
+        with context.temp_override(scene=scene, view_layer=scene.view_layers[0]):
+            yield scene
+    finally:
+        bpy.data.scenes.remove(scene)
+
+
+def link_hierarchy(obj: Object, collection):
+    """ link the object and its children to a collection of another scene """
+    for o in [obj] + list(obj.children_recursive):
+        if o.name not in collection.objects:
+            collection.objects.link(o)
+    return {'FINISHED'}
+
+
+def apply_transforms(obj: Object):
+    """ bake the world matrix of the object and its children into their data, like transform_apply on the hierarchy
+
+    Armature rest bones and meshes (with their shape keys) are transformed in bulk by Armature/Mesh.transform,
+    every object ends with an identity matrix; shared data is transformed once. The view layer is updated,
+    matrix_world is read right after by the samplers.
+    """
+    objects = [obj] + list(obj.children_recursive)
+    matrices = {o: o.matrix_world.copy() for o in objects}
+    done = set()
+    for o in objects:
+        if o.data is not None and hasattr(o.data, "transform") and o.data not in done:
+            if o.type == 'MESH':
+                o.data.transform(matrices[o], shape_keys=True)
+            else:
+                o.data.transform(matrices[o])
+            done.add(o.data)
+        o.matrix_parent_inverse = Matrix.Identity(4)
+        o.matrix_basis = Matrix.Identity(4)
+    bpy.context.view_layer.update()
+    return {'FINISHED'}
+
+
+def remove_objects(objects: list):
+    """ remove the objects and the data only they use (meshes, materials, images) """
+    datas = {o.data for o in objects if o.data is not None}
+    materials = {slot.material for o in objects for slot in o.material_slots if slot.material is not None}
+    images = {node.image for m in materials if m.node_tree
+              for node in m.node_tree.nodes if node.type == 'TEX_IMAGE' and node.image is not None}
+    bpy.data.batch_remove(objects)
+    ## order matters: meshes hold the materials, materials hold the images
+    for ids in (datas, materials, images):
+        orphans = [i for i in ids if i.users == 0]
+        if orphans:
+            bpy.data.batch_remove(orphans)
+    return {'FINISHED'}
+
+
+def remove_hierarchy(obj: Object):
+    """ remove the object, its children and the data only they use """
+    return remove_objects([obj] + list(obj.children_recursive))
+
+
+def remove_children(obj: Object):
+    """ remove the children of the object and the data only they use, e.g. the meshes of an armature """
+    return remove_objects(list(obj.children_recursive))
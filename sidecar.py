@@ -0,0 +1,96 @@
+""" Binary root motion sidecar files for game runtimes; no bpy dependency
+
+Layout (little-endian): a 64 byte header, then frame_count rows of (frame, x, y, z)
+- FLOAT32: float32 rows, can be memory-mapped as is
+- UINT16: uint16 rows quantized to [start_frame, end_frame] and the bounds of the header
+NPZ files store the header fields and the float32 rows as arrays.
+"""
+import struct
+import numpy as np
+
+
+MAGIC = b"MXRM"
+VERSION = 1
+## magic, version, encoding, fps, frame count, start frame, end frame, distance, bounds min (3), bounds max (3)
+HEADER = struct.Struct("<4sHHfIfff3f3f12x")
+ENCODINGS = {'FLOAT32': 0, 'UINT16': 1}
+EXTENSIONS = {'FLOAT32': ".rootmotion", 'UINT16': ".rootmotion", 'NPZ': ".npz"}
+QUANTIZE = 65535
+
+
+def path_distance(positions) -> float:
+    """ length of the root path """
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    return float(np.linalg.norm(np.diff(positions, axis=0), axis=1).sum())
+
+
+def _quantize(values, low, high) -> np.ndarray:
+    scale = np.where(high > low, high - low, 1.0)
+    return np.round((values - low) / scale * QUANTIZE).astype('<u2')
+
+
+def _dequantize(values, low, high) -> np.ndarray:
+    return low + values.astype(np.float64) / QUANTIZE * (high - low)
+
+
+def write(path: str, times, positions, fps: float, encoding: str = 'FLOAT32') -> str:
+    """ write the root trajectory; path without extension, it is added by the encoding; -> file path """
+    times = np.asarray(times, dtype=np.float64).reshape(-1)
+    positions = np.asarray(positions, dtype=np.float64).reshape(-1, 3)
+    low = positions.min(axis=0) if len(positions) else np.zeros(3)
+    high = positions.max(axis=0) if len(positions) else np.zeros(3)
+    start, end = (times[0], times[-1]) if len(times) else (0.0, 0.0)
+    header = dict(fps=fps, frame_count=len(times), start_frame=start, end_frame=end,
+                  distance=path_distance(positions), bounds_min=low, bounds_max=high)
+    rows = np.column_stack((times, positions))
+
+    path += EXTENSIONS[encoding]
+    if encoding == 'NPZ':
+        np.savez(path, version=VERSION, rows=rows.astype('<f4'), **header)
+        return path
+    if encoding == 'UINT16':
+        data = np.column_stack((_quantize(times, start, end), _quantize(positions, low, high)))
+    else:
+        data = rows.astype('<f4')
+    with open(path, 'wb') as f:
+        f.write(HEADER.pack(MAGIC, VERSION, ENCODINGS[encoding], fps, len(times), start, end,
+                            header["distance"], *low, *high))
+        f.write(np.ascontiguousarray(data).tobytes())
+    return path
+
+
+def read_header(path: str) -> dict:
+    with open(path, 'rb') as f:
+        values = HEADER.unpack(f.read(HEADER.size))
+    if values[0] != MAGIC:
+        raise ValueError(f"not a root motion file: {path}")
+    if values[1] != VERSION:
+        raise ValueError(f"unsupported root motion file version {values[1]}: {path}")
+    encodings = {value: name for name, value in ENCODINGS.items()}
+    if values[2] not in encodings:
+        raise ValueError(f"unknown root motion encoding {values[2]}: {path}")
+    encoding = encodings[values[2]]
+    return dict(version=values[1], encoding=encoding, fps=values[3], frame_count=values[4],
+                start_frame=values[5], end_frame=values[6], distance=values[7],
+                bounds_min=np.array(values[8:11]), bounds_max=np.array(values[11:14]))
+
+
+def read(path: str) -> dict:
+    """ header fields + rows (N,4) of frame, x, y, z; FLOAT32 rows are memory-mapped """
+    if path.lower().endswith(".npz"):
+        with np.load(path) as data:
+            fields = {name: data[name][()] if data[name].ndim == 0 else data[name] for name in data.files}
+        if fields.get("version") != VERSION:
+            raise ValueError(f"unsupported root motion file version {fields.get('version')}: {path}")
+        return fields
+    header = read_header(path)
+    dtype = '<f4' if header["encoding"] == 'FLOAT32' else '<u2'
+    if not header["frame_count"]:
+        header["rows"] = np.empty((0, 4), dtype=np.float32)
+        return header
+    data = np.memmap(path, dtype=dtype, mode='r', offset=HEADER.size, shape=(header["frame_count"], 4))
+    if header["encoding"] == 'UINT16':
+        data = np.column_stack((_dequantize(data[:, 0], header["start_frame"], header["end_frame"]),
+                                _dequantize(data[:, 1:], header["bounds_min"], header["bounds_max"])))
+    header["rows"] = data
+    return header
@@ -0,0 +1,14 @@
+""" pytest plugin: the add-on folder is a Blender package whose __init__ imports bpy; it is collected as a
+plain folder, the tests import the bpy-free modules as top level modules """
+import os
+import pytest
+
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_collect_directory(path, parent):
+    if str(path) == ADDON_DIR:
+        return pytest.Dir.from_parent(parent, path=path)
+    return None
@@ -0,0 +1,81 @@
+""" the NumPy samplers against the depsgraph after apply_transforms; runs where bpy can be imported
+(Blender's python or the bpy module), skipped otherwise """
+import importlib
+import os
+import sys
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+
+ADDON_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.dirname(ADDON_DIR))
+PACKAGE = os.path.basename(ADDON_DIR)
+pose_sampler = importlib.import_module(PACKAGE + ".pose_sampler")
+scene_utils = importlib.import_module(PACKAGE + ".scene_utils")
+synthetic = importlib.import_module(PACKAGE + ".benchmarks.synthetic")
+
+BONES = tuple(synthetic.PREFIX + name for name in ("Hips", "Spine", "HeadTop_End", "LeftHand", "RightToe_End"))
+TIMES = np.linspace(1.0, 20.0, 39)
+
+
+@pytest.fixture
+def armature():
+    """ Mixamo-like armature (rotation X 90°, scale 0.01) with a skinned mesh and an action """
+    synthetic.clear_scene()
+    obj = synthetic.build_armature()
+    synthetic.build_mesh(obj)
+    synthetic.build_action(obj, 40, subframe=True)
+    yield obj
+    synthetic.clear_scene()
+
+
+def test_apply_transforms_updates_matrix_world(armature):
+    scene_utils.apply_transforms(armature)
+    np.testing.assert_allclose(np.array(armature.matrix_world), np.eye(4), atol=1e-6)
+    for child in armature.children_recursive:
+        np.testing.assert_allclose(np.array(child.matrix_world), np.eye(4), atol=1e-6)
+
+
+@pytest.mark.parametrize("is_apply_transforms", (False, True))
+def test_action_sampler_matches_depsgraph(armature, is_apply_transforms):
+    if is_apply_transforms:
+        scene_utils.apply_transforms(armature)
+    heads = pose_sampler.PoseSampler(armature, BONES).sample_heads(TIMES)
+    reference = pose_sampler.sample_heads_depsgraph(armature, BONES, TIMES)
+    assert pose_sampler.max_error(heads, reference) < 1e-4
+
+
+@pytest.mark.parametrize("interpolation", ('SINE', 'BACK', 'ELASTIC'))
+def test_action_sampler_easing(armature, interpolation):
+    """ easing channels are evaluated by Blender, not as bezier """
+    curve_io = importlib.import_module(PACKAGE + ".curve_io")
+    for fcurve in curve_io.get_channelbag(armature.animation_data.action).fcurves:
+        for point in fcurve.keyframe_points:
+            point.interpolation = interpolation
+    heads = pose_sampler.PoseSampler(armature, BONES).sample_heads(TIMES)
+    reference = pose_sampler.sample_heads_depsgraph(armature, BONES, TIMES)
+    assert pose_sampler.max_error(heads, reference) < 1e-4
+
+
+@pytest.mark.parametrize("is_apply_transforms", (False, True))
+def test_mesh_heights_match_depsgraph(armature, is_apply_transforms):
+    mesh_sampler = importlib.import_module(PACKAGE + ".mesh_sampler")
+    if is_apply_transforms:
+        scene_utils.apply_transforms(armature)
+    sampler = mesh_sampler.MeshSampler(armature, mesh_sampler.skinned_meshes(armature))
+    np.testing.assert_allclose(sampler.heights_action(TIMES), sampler.heights_depsgraph(TIMES), atol=1e-4)
+
+
+def test_apply_transforms_shape_keys(armature):
+    """ the evaluated mesh follows the Basis key, it must be transformed with the vertices """
+    body = armature.children[0]
+    body.shape_key_add(name="Basis")
+    body.shape_key_add(name="Smile", from_mix=False).value = 0.0
+    scene_utils.apply_transforms(armature)
+    co = np.empty(len(body.data.vertices) * 3)
+    body.data.vertices.foreach_get('co', co)
+    for key in body.data.shape_keys.key_blocks:
+        key_co = np.empty(len(key.data) * 3)
+        key.data.foreach_get('co', key_co)
+        np.testing.assert_allclose(key_co, co, atol=1e-5)
@@ -0,0 +1,179 @@
+""" fbx_reader.py on small binary fbx files written by hand, version 7400 (32 bit offsets) and 7500 (64 bit) """
+import struct
+import zlib
+import numpy as np
+import pytest
+
+import fbx_reader
+
+
+TICKS = fbx_reader.TICKS_PER_SECOND
+FRAMES = np.arange(31)  ## one second at 30 fps
+HIPS_X = FRAMES * 10.0  ## 3 meters along x (cm)
+HIPS_Y = np.full(31, 95.0)  ## height, y up
+HIPS_Z = np.sin(FRAMES / 5.0)
+
+
+def prop(value) -> bytes:
+    """ one property record """
+    if isinstance(value, bool):
+        return b'C' + struct.pack('<?', value)
+    if isinstance(value, int):
+        return b'L' + struct.pack('<q', value)
+    if isinstance(value, float):
+        return b'D' + struct.pack('<d', value)
+    if isinstance(value, str):
+        data = value.encode()
+        return b'S' + struct.pack('<I', len(data)) + data
+    array, compress = value
+    code = {np.dtype('<f4'): b'f', np.dtype('<f8'): b'd', np.dtype('<i8'): b'l', np.dtype('<i4'): b'i'}[array.dtype]
+    data = array.tobytes()
+    if compress:
+        data = zlib.compress(data)
+    return code + struct.pack('<III', len(array), int(compress), len(data)) + data
+
+
+def node(name: str, props: list = (), children: list = ()) -> tuple:
+    return name, props, children
+
+
+def write_node(item: tuple, offset: int, wide: bool) -> bytes:
+    """ node record at <offset>; the end offset is absolute """
+    name, props, children = item
+    header_size = (25 if wide else 13) + len(name)
+    props_data = b"".join(prop(p) for p in props)
+    body = b""
+    if children:
+        position = offset + header_size + len(props_data)
+        for child in children:
+            data = write_node(child, position, wide)
+            body += data
+            position += len(data)
+        body += b"\x00" * (25 if wide else 13)
+    end = offset + header_size + len(props_data) + len(body)
+    fmt = '<QQQB' if wide else '<IIIB'
+    return struct.pack(fmt, end, len(props), len(props_data), len(name)) + name.encode() + props_data + body
+
+
+def write_fbx(path, version: int, nodes: list):
+    wide = version >= 7500
+    data = fbx_reader.MAGIC + b"\x1a\x00" + struct.pack('<I', version)
+    for item in nodes:
+        data += write_node(item, len(data), wide)
+    data += b"\x00" * (25 if wide else 13)
+    path.write_bytes(data)
+    return str(path)
+
+
+def p70(*entries) -> tuple:
+    return node("Properties70", children=[node("P", list(entry)) for entry in entries])
+
+
+def curve(curve_id: int, values, compress: bool) -> tuple:
+    key_times = (FRAMES * (TICKS // 30)).astype('<i8')
+    return node("AnimationCurve", [curve_id, "\x00\x01AnimCurve", ""], [
+        node("Default", [0.0]),
+        node("KeyTime", [(key_times, compress)]),
+        node("KeyValueFloat", [(np.asarray(values, dtype='<f4'), compress)]),
+    ])
+
+
+def clip_nodes(time_mode: int = 6, custom_fps: float = 30.0) -> list:
+    """ a Mixamo-like clip: hips with a translation curve node, a skipped mesh and texture data """
+    hips, spine, stack, curve_node = 100, 101, 200, 300
+    return [
+        node("FBXHeaderExtension", children=[node("FBXVersion", [7400])]),
+        node("GlobalSettings", children=[p70(
+            ("UpAxis", "int", "Integer", "", 1),
+            ("UnitScaleFactor", "double", "Number", "", 1.0),
+            ("TimeMode", "enum", "", "", time_mode),
+            ("CustomFrameRate", "double", "Number", "", custom_fps),
+        )]),
+        node("Objects", children=[
+            node("Geometry", [400, "Body\x00\x01Geometry", "Mesh"],
+                 [node("Vertices", [(np.zeros(3000, dtype='<f8'), True)])]),
+            node("Model", [hips, "mixamorig:Hips\x00\x01Model", "LimbNode"], [p70(
+                ("Lcl Translation", "Lcl Translation", "", "A", 0.0, 95.0, 0.0),
+                ("PreRotation", "Vector3D", "Vector", "", -90.0, 0.0, 0.0),
+            )]),
+            node("Model", [spine, "mixamorig:Spine\x00\x01Model", "LimbNode"]),
+            node("AnimationStack", [stack, "mixamo.com\x00\x01AnimStack", ""], [p70(
+                ("LocalStart", "KTime", "Time", "", 0),
+                ("LocalStop", "KTime", "Time", "", int(TICKS)),
+            )]),
+            node("AnimationCurveNode", [curve_node, "T\x00\x01AnimCurveNode", ""]),
+            curve(301, HIPS_X, compress=True),
+            curve(302, HIPS_Y, compress=False),
+            curve(303, HIPS_Z, compress=True),
+        ]),
+        node("Connections", children=[
+            node("C", ["OO", spine, hips]),
+            node("C", ["OP", curve_node, hips, "Lcl Translation"]),
+            node("C", ["OP", 301, curve_node, "d|X"]),
+            node("C", ["OP", 302, curve_node, "d|Y"]),
+            node("C", ["OP", 303, curve_node, "d|Z"]),
+        ]),
+        node("Takes", children=[node("Current", ["mixamo.com"])]),
+    ]
+
+
+@pytest.fixture(params=(7400, 7500))
+def clip(request, tmp_path):
+    return write_fbx(tmp_path / f"clip_{request.param}.fbx", request.param, clip_nodes())
+
+
+def test_read_bone_animation(clip):
+    animation = fbx_reader.read_bone_animation(clip, "mixamorig:Hips")
+    np.testing.assert_allclose(animation["times"], FRAMES / 30.0)
+    np.testing.assert_allclose(animation["translation"], np.column_stack((HIPS_X, HIPS_Y, HIPS_Z)), rtol=1e-6)
+    np.testing.assert_allclose(animation["rest"]["Lcl Translation"], (0.0, 95.0, 0.0))
+    np.testing.assert_allclose(animation["rest"]["PreRotation"], (-90.0, 0.0, 0.0))
+    np.testing.assert_allclose(animation["rest"]["Lcl Scaling"], (1.0, 1.0, 1.0))
+    assert animation["fps"] == 30.0
+    assert animation["up_axis"] == 1
+    assert animation["unit_scale"] == 1.0
+    assert (animation["start"], animation["stop"]) == (0.0, 1.0)
+
+
+def test_analyze(clip):
+    result = fbx_reader.analyze(clip, "mixamorig:Hips")
+    assert result["frame_count"] == 31
+    assert result["key_count"] == 31
+    assert result["duration"] == pytest.approx(1.0)
+    ## ground plane x / z in meters
+    ground = np.column_stack((HIPS_X, HIPS_Z)) / 100.0
+    distance = np.linalg.norm(np.diff(ground - ground[0], axis=0), axis=1).sum()
+    assert result["distance"] == pytest.approx(distance, rel=1e-6)
+    assert result["displacement"] == pytest.approx(np.linalg.norm(ground[-1] - ground[0]), rel=1e-6)
+    assert result["speed"] == pytest.approx(distance, rel=1e-6)
+
+
+def test_unwanted_nodes_are_skipped(clip):
+    with fbx_reader.FbxFile(clip) as fbx:
+        assert [n.name for n in fbx.nodes] == ["GlobalSettings", "Objects", "Connections"]
+        assert {n.name for n in fbx.node("Objects").children} == \
+               {"Model", "AnimationStack", "AnimationCurveNode", "AnimationCurve"}
+
+
+def test_custom_frame_rate(tmp_path):
+    path = write_fbx(tmp_path / "custom.fbx", 7500, clip_nodes(time_mode=14, custom_fps=12.5))
+    assert fbx_reader.read_bone_animation(path)["fps"] == 12.5
+
+
+def test_missing_bone(clip):
+    with pytest.raises(KeyError):
+        fbx_reader.read_bone_animation(clip, "mixamorig:Tail")
+
+
+def test_not_binary_fbx(tmp_path):
+    path = tmp_path / "ascii.fbx"
+    path.write_text("; FBX 7.4.0 project file\n")
+    with pytest.raises(ValueError):
+        fbx_reader.read_bone_animation(str(path))
+
+
+def test_main(clip, tmp_path, capsys):
+    report = tmp_path / "report.json"
+    assert fbx_reader.main([clip, "--json", str(report)]) == 0
+    assert "clip_" in capsys.readouterr().out
+    assert report.exists()
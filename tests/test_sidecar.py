@@ -0,0 +1,80 @@
+""" sidecar.py: write -> read round trips of every encoding and the header checks """
+import numpy as np
+import pytest
+
+import sidecar
+
+
+RNG = np.random.default_rng(3)
+TIMES = np.arange(1.0, 61.0)
+POSITIONS = np.cumsum(RNG.normal(size=(60, 3)) * (0.05, 0.05, 0.01), axis=0)
+FPS = 30.0
+
+
+@pytest.mark.parametrize("encoding", ['FLOAT32', 'NPZ'])
+def test_round_trip_float(tmp_path, encoding):
+    path = sidecar.write(str(tmp_path / "walk"), TIMES, POSITIONS, FPS, encoding=encoding)
+    assert path.endswith(sidecar.EXTENSIONS[encoding])
+    data = sidecar.read(path)
+    rows = data["rows"]
+    assert rows.shape == (len(TIMES), 4)
+    assert np.allclose(rows[:, 0], TIMES)
+    assert np.allclose(rows[:, 1:], POSITIONS, atol=1e-6)
+    assert data["frame_count"] == len(TIMES)
+    assert data["fps"] == pytest.approx(FPS)
+    assert data["start_frame"] == pytest.approx(TIMES[0])
+    assert data["end_frame"] == pytest.approx(TIMES[-1])
+    assert data["distance"] == pytest.approx(sidecar.path_distance(POSITIONS), rel=1e-6)
+    assert np.allclose(data["bounds_min"], POSITIONS.min(axis=0), atol=1e-6)
+    assert np.allclose(data["bounds_max"], POSITIONS.max(axis=0), atol=1e-6)
+
+
+def test_round_trip_uint16_error_bound(tmp_path):
+    path = sidecar.write(str(tmp_path / "walk"), TIMES, POSITIONS, FPS, encoding='UINT16')
+    data = sidecar.read(path)
+    rows = data["rows"]
+    assert data["encoding"] == 'UINT16'
+    ## half a quantization step of the range, float32 header bounds add a little
+    span = POSITIONS.max(axis=0) - POSITIONS.min(axis=0)
+    bound = span / sidecar.QUANTIZE / 2 + 1e-6
+    assert np.all(np.abs(rows[:, 1:] - POSITIONS) <= bound)
+    assert np.all(np.abs(rows[:, 0] - TIMES) <= (TIMES[-1] - TIMES[0]) / sidecar.QUANTIZE / 2 + 1e-6)
+
+
+def test_uint16_constant_axis(tmp_path):
+    positions = POSITIONS.copy()
+    positions[:, 2] = 0.25
+    path = sidecar.write(str(tmp_path / "walk"), TIMES, positions, FPS, encoding='UINT16')
+    assert np.allclose(sidecar.read(path)["rows"][:, 3], 0.25)
+
+
+@pytest.mark.parametrize("encoding", ['FLOAT32', 'UINT16'])
+def test_empty(tmp_path, encoding):
+    path = sidecar.write(str(tmp_path / "empty"), [], np.empty((0, 3)), FPS, encoding=encoding)
+    data = sidecar.read(path)
+    assert data["frame_count"] == 0
+    assert data["rows"].shape == (0, 4)
+
+
+def test_bad_magic(tmp_path):
+    path = sidecar.write(str(tmp_path / "walk"), TIMES, POSITIONS, FPS)
+    with open(path, 'r+b') as f:
+        f.write(b"NOPE")
+    with pytest.raises(ValueError, match="not a root motion file"):
+        sidecar.read(path)
+
+
+def test_bad_version(tmp_path):
+    path = sidecar.write(str(tmp_path / "walk"), TIMES, POSITIONS, FPS)
+    with open(path, 'r+b') as f:
+        f.seek(len(sidecar.MAGIC))
+        f.write((sidecar.VERSION + 1).to_bytes(2, 'little'))
+    with pytest.raises(ValueError, match="version"):
+        sidecar.read_header(path)
+
+
+def test_bad_version_npz(tmp_path):
+    path = str(tmp_path / "walk.npz")
+    np.savez(path, version=sidecar.VERSION + 1, rows=np.zeros((1, 4), dtype='<f4'))
+    with pytest.raises(ValueError, match="version"):
+        sidecar.read(path)
@@ -0,0 +1,177 @@
+""" trajectory.py against the per-Vector formulas of BakeMethod before the NumPy rewrite """
+import numpy as np
+import pytest
+
+import trajectory
+
+
+RNG = np.random.default_rng(7)
+VECTORS = RNG.normal(size=(40, 3)) * (1.0, 1.0, 0.2) + (0.3, -0.2, 1.0)
+HEIGHTS = RNG.normal(size=40) * 0.05
+START_POINT = np.array((0.1, -0.3, 0.0))
+MASKS = [(x, y, z) for x in (False, True) for y in (False, True) for z in (False, True)]
+
+
+def old_copy_for_main_bone(vectors, bake, start_point, is_start_feet):
+    """ BakeMethod.copy_for_main_bone """
+    bake_x, bake_y, bake_z = bake
+    root_vectors = [np.array((v[0] * bake_x, v[1] * bake_y, v[2] * bake_z)) for v in vectors]
+    hips_vectors = [vectors[i] - root_vectors[i] for i in range(len(vectors))]
+    first_point = vectors[0]
+    root_vectors = [np.array((v[0] - first_point[0] * bake_x,
+                              v[1] - first_point[1] * bake_y,
+                              v[2] - first_point[2] * bake_z)) for v in root_vectors]
+    first_point = vectors[0] - start_point * is_start_feet
+    hips_vectors = [np.array((v[0] + first_point[0] * bake_x,
+                              v[1] + first_point[1] * bake_y,
+                              v[2] + first_point[2] * bake_z)) for v in hips_vectors]
+    return root_vectors, hips_vectors
+
+
+def old_floor_height(vectors, heights, bake, start_point, is_start_feet, first_from_root):
+    """ BakeMethod.get_lowest_bone_height / get_bound_box_bottom (first_from_root) """
+    bake_x, bake_y, bake_z = bake
+    root_vectors = [np.array((vectors[i][0] * bake_x, vectors[i][1] * bake_y, heights[i] * bake_z))
+                    for i in range(len(vectors))]
+    hips_vectors = [vectors[i] - root_vectors[i] for i in range(len(vectors))]
+    first_point = (root_vectors[0] if first_from_root else vectors[0]) - start_point
+    root_vectors = [np.array((v[0] - first_point[0] * bake_x,
+                              v[1] - first_point[1] * bake_y,
+                              v[2])) for v in root_vectors]
+    first_point = vectors[0] - start_point * is_start_feet
+    hips_vectors = [np.array((v[0] + first_point[0] * bake_x,
+                              v[1] + first_point[1] * bake_y,
+                              v[2])) for v in hips_vectors]
+    return root_vectors, hips_vectors
+
+
+@pytest.mark.parametrize("bake", MASKS)
+@pytest.mark.parametrize("is_start_feet", (False, True))
+def test_split_copy_data(bake, is_start_feet):
+    root, hips = trajectory.split_root_motion(VECTORS, trajectory.axis_mask(*bake), START_POINT,
+                                              is_start_feet=is_start_feet)
+    old_root, old_hips = old_copy_for_main_bone(VECTORS, bake, START_POINT, is_start_feet)
+    np.testing.assert_allclose(root, old_root, atol=1e-12)
+    np.testing.assert_allclose(hips, old_hips, atol=1e-12)
+
+
+@pytest.mark.parametrize("method", ("LOWEST_BONE", "BOUND_BOX"))
+@pytest.mark.parametrize("bake", MASKS)
+@pytest.mark.parametrize("is_start_feet", (False, True))
+def test_split_floor_height(method, bake, is_start_feet):
+    root, hips = trajectory.split_root_motion(VECTORS, trajectory.axis_mask(*bake), START_POINT,
+                                              is_start_feet=is_start_feet, heights=HEIGHTS)
+    old_root, old_hips = old_floor_height(VECTORS, HEIGHTS, bake, START_POINT, is_start_feet,
+                                          first_from_root=method == "BOUND_BOX")
+    np.testing.assert_allclose(root, old_root, atol=1e-12)
+    np.testing.assert_allclose(hips, old_hips, atol=1e-12)
+
+
+def test_split_empty():
+    root, hips = trajectory.split_root_motion(np.empty((0, 3)), (1, 1, 0), START_POINT)
+    assert root.shape == hips.shape == (0, 3)
+
+
+def keyframes(co, interpolation, handle_left=None, handle_right=None):
+    co = np.asarray(co, dtype=np.float64)
+    return (co, co if handle_left is None else handle_left, co if handle_right is None else handle_right,
+            np.full(len(co), interpolation))
+
+
+def test_evaluate_constant():
+    co, left, right, ipo = keyframes([(0, 1.0), (10, 3.0), (20, -1.0)], trajectory.INTERPOLATION_CONSTANT)
+    values = trajectory.evaluate_keyframes(co, left, right, ipo, [-5, 0, 5, 9.99, 10, 15, 20, 25])
+    np.testing.assert_allclose(values, [1, 1, 1, 1, 3, 3, -1, -1])
+
+
+def test_evaluate_linear():
+    co, left, right, ipo = keyframes([(0, 1.0), (10, 3.0), (20, -1.0)], trajectory.INTERPOLATION_LINEAR)
+    values = trajectory.evaluate_keyframes(co, left, right, ipo, [-5, 0, 5, 10, 12.5, 20, 25])
+    np.testing.assert_allclose(values, [1, 1, 2, 3, 2, -1, -1])
+
+
+def test_evaluate_bezier():
+    ## flat handles at a third of the segment: x(s) = s, y(s) = smoothstep
+    co = np.array([(0.0, 0.0), (1.0, 1.0)])
+    right = np.array([(1 / 3, 0.0), (4 / 3, 1.0)])
+    left = np.array([(-1 / 3, 0.0), (2 / 3, 1.0)])
+    times = np.linspace(0.0, 1.0, 11)
+    values = trajectory.evaluate_keyframes(co, left, right, np.full(2, 2), times)
+    np.testing.assert_allclose(values, 3 * times ** 2 - 2 * times ** 3, atol=1e-6)
+
+
+def test_evaluate_bezier_overlapping_handles():
+    ## handles longer than the segment are scaled down like BKE_fcurve_correct_bezpart: still monotonic in x
+    co = np.array([(0.0, 0.0), (1.0, 1.0)])
+    right = np.array([(2.0, 0.0), (3.0, 1.0)])
+    left = np.array([(-2.0, 0.0), (-1.0, 1.0)])
+    times = np.linspace(0.0, 1.0, 21)
+    values = trajectory.evaluate_keyframes(co, left, right, np.full(2, 2), times)
+    assert np.all(np.diff(values) >= -1e-9)
+    np.testing.assert_allclose(values[[0, -1]], [0.0, 1.0])
+
+
+def test_evaluate_easing():
+    co, left, right, ipo = keyframes([(0, 0.0), (10, 1.0), (20, 0.0)], trajectory.INTERPOLATION_BEZIER + 1)
+    assert trajectory.has_easing(ipo)
+    with pytest.raises(ValueError):
+        trajectory.evaluate_keyframes(co, left, right, ipo, [5])
+    ## the interpolation of the last key starts no segment
+    ipo[:-1] = trajectory.INTERPOLATION_BEZIER
+    assert not trajectory.has_easing(ipo)
+    trajectory.evaluate_keyframes(co, left, right, ipo, [5, 15, 25])
+
+
+def test_evaluate_single_and_empty():
+    co = np.array([(3.0, 2.5)])
+    np.testing.assert_allclose(trajectory.evaluate_keyframes(co, co, co, [1], [0, 3, 9]), [2.5, 2.5, 2.5])
+    empty = np.empty((0, 2))
+    np.testing.assert_allclose(trajectory.evaluate_keyframes(empty, empty, empty, [], [0, 1]), [0, 0])
+
+
+@pytest.mark.parametrize("tolerance", (0.0, 0.001, 0.01, 0.1))
+def test_reduce_keyframes_error_bound(tolerance):
+    times = np.arange(200, dtype=np.float64)
+    values = np.sin(times / 13.0) + RNG.normal(size=200) * 0.002
+    keep = trajectory.reduce_keyframes(times, values, tolerance)
+    assert keep[0] == 0 and keep[-1] == len(times) - 1
+    assert np.all(np.diff(keep) > 0)
+    error = np.abs(np.interp(times, times[keep], values[keep]) - values)
+    assert error.max() <= tolerance + 1e-12
+    if tolerance >= 0.01:
+        assert len(keep) < len(times) // 2
+
+
+def test_reduce_keyframes_line():
+    times = np.linspace(1.0, 50.0, 50)
+    np.testing.assert_array_equal(trajectory.reduce_keyframes(times, 2.0 * times - 1.0, 1e-9), [0, 49])
+    np.testing.assert_array_equal(trajectory.reduce_keyframes(times[:2], times[:2], 0.1), [0, 1])
+
+
+@pytest.mark.parametrize("keys, step", [
+    (np.arange(1, 101), 30 / 24),
+    (np.arange(1, 101), 30 / 60),
+    ([1.0, 2.0, 3.0], 5.0),
+    ([1.0, 2.0, 3.0], 1.0),
+    (np.linspace(0.5, 37.25, 80), 0.7),
+])
+def test_resample_times_endpoints(keys, step):
+    times = trajectory.resample_times(keys, step=step)
+    assert times[0] == np.min(keys)
+    assert times[-1] == np.max(keys)
+    assert np.all(np.diff(times) > 0)
+    ## uniform grid, only the last interval may be shorter
+    np.testing.assert_allclose(np.diff(times)[:-1], step)
+    assert np.diff(times)[-1] <= step + 1e-9
+
+
+@pytest.mark.parametrize("keys", ([1.0, 1.0000001], [1.0, 1.5], [2.0, 2.0]))
+def test_resample_times_shorter_than_step(keys):
+    times = trajectory.resample_times(keys, step=1.0)
+    np.testing.assert_array_equal(times, np.unique(keys))
+
+
+def test_resample_times_source():
+    keys = np.array([1.0, 1.5, 4.0])
+    np.testing.assert_array_equal(trajectory.resample_times(keys), keys)
+    np.testing.assert_array_equal(trajectory.resample_times([7.0], step=2.0), [7.0])
@@ -0,0 +1,290 @@
+""" Root motion math on (N,3) / (N,4,4) arrays; no bpy dependency """
+import numpy as np
+
+
+def axis_mask(bake_x: bool, bake_y: bool, bake_z: bool) -> np.ndarray:
+    """ bake axes -> (3,) float mask """
+    return np.array((bake_x, bake_y, bake_z), dtype=np.float64)
+
+
+def as_points(vectors) -> np.ndarray:
+    """ any sequence of 3d vectors -> (N,3) float64 array """
+    return np.asarray(vectors, dtype=np.float64).reshape(-1, 3)
+
+
+def start_point_from_feet(left_foot, right_foot) -> np.ndarray:
+    """ middle of the feet, projected on the floor (z = 0) """
+    point = (np.asarray(left_foot, dtype=np.float64) + np.asarray(right_foot, dtype=np.float64)) / 2
+    point[2] = 0.0
+    return point
+
+
+def split_root_motion(vectors, mask, start_point, is_start_feet: bool = False, heights=None):
+    """ Split the main bone trajectory into root and hips trajectories (World Coordinate System)
+
+    vectors: (N,3) main bone location per sample
+    mask: (3,) bake axes
+    start_point: (3,) root location at the first sample, see BakeMethod.get_start_point
+    heights: (N,) floor height per sample; None copies the main bone height (COPY_DATA)
+    return: root_vectors (N,3), hips_vectors (N,3)
+    """
+    vectors = as_points(vectors)
+    mask = np.asarray(mask, dtype=np.float64)
+    start_point = np.asarray(start_point, dtype=np.float64)
+    if not len(vectors):
+        return vectors.copy(), vectors.copy()
+
+    root_vectors = vectors * mask
+    if heights is None:
+        ## copy: the root starts at the world center
+        offset_mask = mask
+        root_offset = vectors[0]
+    else:
+        ## the height axis comes from the floor, only x/y are moved to the start point
+        root_vectors[:, 2] = np.asarray(heights, dtype=np.float64) * mask[2]
+        offset_mask = mask * (1.0, 1.0, 0.0)
+        root_offset = vectors[0] - start_point
+    hips_vectors = vectors - root_vectors
+
+    root_vectors -= root_offset * offset_mask
+    hips_vectors += (vectors[0] - start_point * is_start_feet) * offset_mask
+    return root_vectors, hips_vectors
+
+
+def transform_points(matrix, vectors) -> np.ndarray:
+    """ matrix (4,4) or (N,4,4) @ points (N,3), same as mathutils Matrix @ Vector """
+    matrix = np.asarray(matrix, dtype=np.float64)
+    vectors = as_points(vectors)
+    if matrix.ndim == 2:
+        return vectors @ matrix[:3, :3].T + matrix[:3, 3]
+    return np.einsum('nij,nj->ni', matrix[:, :3, :3], vectors) + matrix[:, :3, 3]
+
+
+def world_to_local(vectors, matrix_world, matrix_local) -> np.ndarray:
+    """ mapping coordinate system; world to bone local (rest), matrices are computed once """
+    matrix = np.linalg.inv(np.asarray(matrix_world, dtype=np.float64)) @ \
+             np.linalg.inv(np.asarray(matrix_local, dtype=np.float64))
+    return transform_points(matrix, vectors)
+
+
+def resample_times(key_times, step: float = None) -> np.ndarray:
+    """ sample times: the key times (step None), or a uniform grid of <step> frames over the key range
+
+    The first and the last key are always samples; the last one ends the grid early when the range is not
+    a multiple of <step>.
+    """
+    key_times = np.asarray(key_times, dtype=np.float64).reshape(-1)
+    if step is None or not len(key_times):
+        return key_times.copy()
+    start, end = key_times.min(), key_times.max()
+    if end == start:
+        return np.array([start])
+    count = int(np.floor((end - start) / step + 1e-6)) + 1
+    times = start + np.arange(count) * step
+    ## a range shorter than a step keeps both keys
+    if count == 1 or end - times[-1] > 1e-6 * step:
+        times = np.append(times, end)
+    else:
+        times[-1] = end
+    return times
+
+
+## F-Curve evaluation (keyframe_points read with foreach_get, see curve_io.read_keyframes)
+INTERPOLATION_CONSTANT = 0
+INTERPOLATION_LINEAR = 1
+INTERPOLATION_BEZIER = 2  ## the easing types (SINE, QUAD, BACK, ELASTIC...) follow
+
+
+def has_easing(interpolation) -> bool:
+    """ a segment uses an easing type, evaluate_keyframes() can't evaluate the curve; the last key starts none """
+    return bool(np.any(np.asarray(interpolation)[:-1] > INTERPOLATION_BEZIER))
+
+
+def _bezier(p0, p1, p2, p3, s):
+    """ cubic bezier, per segment control points and parameter s """
+    r = 1.0 - s
+    return r * r * r * p0 + 3.0 * r * r * s * p1 + 3.0 * r * s * s * p2 + s * s * s * p3
+
+
+def evaluate_keyframes(co, handle_left, handle_right, interpolation, times, iterations: int = 30) -> np.ndarray:
+    """ evaluate one F-Curve at all times at once; constant extrapolation, no modifiers
+
+    co / handle_left / handle_right: (n,2) keyframe buffers
+    interpolation: (n,) Keyframe.interpolation enum values; ValueError for easing types, see has_easing()
+    """
+    co = np.asarray(co, dtype=np.float64).reshape(-1, 2)
+    times = np.asarray(times, dtype=np.float64)
+    if len(co) == 0:
+        return np.zeros(len(times))
+    if len(co) == 1:
+        return np.full(len(times), co[0, 1])
+
+    seg = np.clip(np.searchsorted(co[:, 0], times, side='right') - 1, 0, len(co) - 2)
+    x0, y0 = co[seg, 0], co[seg, 1]
+    x3, y3 = co[seg + 1, 0], co[seg + 1, 1]
+    width = x3 - x0
+    u = np.clip(np.divide(times - x0, width, out=np.zeros_like(times), where=width > 0), 0.0, 1.0)
+    values = y0 + (y3 - y0) * u
+
+    ipo = np.asarray(interpolation)[seg]
+    if np.any(ipo > INTERPOLATION_BEZIER):
+        raise ValueError("easing interpolation is not supported, use FCurve.evaluate")
+    values = np.where(ipo == INTERPOLATION_CONSTANT, y0, values)
+    bezier = np.flatnonzero(ipo == INTERPOLATION_BEZIER)
+    if len(bezier):
+        s_seg = seg[bezier]
+        p0 = co[s_seg]
+        p3 = co[s_seg + 1]
+        p1 = np.asarray(handle_right, dtype=np.float64).reshape(-1, 2)[s_seg]
+        p2 = np.asarray(handle_left, dtype=np.float64).reshape(-1, 2)[s_seg + 1]
+        ## same as BKE_fcurve_correct_bezpart: handles may not overlap in time
+        len1 = np.abs(p0[:, 0] - p1[:, 0])
+        len2 = np.abs(p3[:, 0] - p2[:, 0])
+        total = len1 + len2
+        fac = np.divide(width[bezier], total, out=np.ones_like(total), where=total > width[bezier])[:, None]
+        p1 = p0 + (p1 - p0) * fac
+        p2 = p3 + (p2 - p3) * fac
+        ## x(s) is monotonic; bisection for x(s) = time
+        target = times[bezier]
+        lo, hi = np.zeros(len(bezier)), np.ones(len(bezier))
+        for _ in range(iterations):
+            mid = (lo + hi) * 0.5
+            below = _bezier(p0[:, 0], p1[:, 0], p2[:, 0], p3[:, 0], mid) < target
+            lo = np.where(below, mid, lo)
+            hi = np.where(below, hi, mid)
+        values[bezier] = _bezier(p0[:, 1], p1[:, 1], p2[:, 1], p3[:, 1], (lo + hi) * 0.5)
+
+    values = np.where(times <= co[0, 0], co[0, 1], values)
+    values = np.where(times >= co[-1, 0], co[-1, 1], values)
+    return values
+
+
+## Forward kinematics
+def quaternion_to_matrix(quaternions) -> np.ndarray:
+    """ (N,4) w, x, y, z -> (N,3,3), normalized like Blender does for pose bones """
+    q = np.asarray(quaternions, dtype=np.float64).reshape(-1, 4)
+    length = np.linalg.norm(q, axis=1, keepdims=True)
+    q = np.divide(q, length, out=np.tile([1.0, 0.0, 0.0, 0.0], (len(q), 1)), where=length > 0)
+    w, x, y, z = q.T
+    return np.stack((
+        np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+        np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+        np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1),
+    ), axis=1)
+
+
+def axis_angle_to_matrix(axis_angles) -> np.ndarray:
+    """ (N,4) angle, x, y, z -> (N,3,3) """
+    a = np.asarray(axis_angles, dtype=np.float64).reshape(-1, 4)
+    half = a[:, 0] / 2
+    axis = a[:, 1:]
+    length = np.linalg.norm(axis, axis=1, keepdims=True)
+    axis = np.divide(axis, length, out=np.tile([0.0, 1.0, 0.0], (len(a), 1)), where=length > 0)
+    return quaternion_to_matrix(np.column_stack((np.cos(half), axis * np.sin(half)[:, None])))
+
+
+def euler_to_matrix(eulers, order: str = 'XYZ') -> np.ndarray:
+    """ (N,3) -> (N,3,3); order as in PoseBone.rotation_mode, the first axis is applied first """
+    e = np.asarray(eulers, dtype=np.float64).reshape(-1, 3)
+    matrix = np.tile(np.eye(3), (len(e), 1, 1))
+    for axis in order:
+        i = 'XYZ'.index(axis)
+        c, s = np.cos(e[:, i]), np.sin(e[:, i])
+        rot = np.tile(np.eye(3), (len(e), 1, 1))
+        j, k = (i + 1) % 3, (i + 2) % 3
+        rot[:, j, j], rot[:, j, k] = c, -s
+        rot[:, k, j], rot[:, k, k] = s, c
+        matrix = rot @ matrix
+    return matrix
+
+
+def compose_matrices(locations, rotations, scales) -> np.ndarray:
+    """ location (N,3), rotation (N,3,3), scale (N,3) -> (N,4,4); T @ R @ S like PoseBone.matrix_basis """
+    locations = as_points(locations)
+    matrix = np.tile(np.eye(4), (len(locations), 1, 1))
+    matrix[:, :3, :3] = np.asarray(rotations, dtype=np.float64) * as_points(scales)[:, None, :]
+    matrix[:, :3, 3] = locations
+    return matrix
+
+
+def forward_kinematics(rest_matrices, parents, basis_matrices) -> np.ndarray:
+    """ pose matrices in armature space; full rotation/scale inheritance
+
+    rest_matrices: (B,4,4) Bone.matrix_local
+    parents: (B,) index of the parent bone, -1 for none; parents come before their children
+    basis_matrices: (B,N,4,4) PoseBone.matrix_basis per sample
+    return: (B,N,4,4) PoseBone.matrix per sample
+    """
+    rest_matrices = np.asarray(rest_matrices, dtype=np.float64)
+    basis_matrices = np.asarray(basis_matrices, dtype=np.float64)
+    pose = np.empty_like(basis_matrices)
+    for b, parent in enumerate(parents):
+        if parent < 0:
+            pose[b] = rest_matrices[b] @ basis_matrices[b]
+        else:
+            offset = np.linalg.inv(rest_matrices[parent]) @ rest_matrices[b]
+            pose[b] = pose[parent] @ offset @ basis_matrices[b]
+    return pose
+
+
+def reduce_keyframes(times, values, tolerance: float) -> np.ndarray:
+    """ indices of the keys kept by Ramer-Douglas-Peucker; the error is the distance to the linear
+    interpolation of the kept keys at every removed key, always <= tolerance """
+    times = np.asarray(times, dtype=np.float64)
+    values = np.asarray(values, dtype=np.float64)
+    if len(times) <= 2:
+        return np.arange(len(times))
+    keep = np.zeros(len(times), dtype=bool)
+    keep[[0, -1]] = True
+    segments = [(0, len(times) - 1)]
+    while segments:
+        a, b = segments.pop()
+        if b - a < 2:
+            continue
+        line = values[a] + (values[b] - values[a]) * (times[a + 1:b] - times[a]) / (times[b] - times[a])
+        error = np.abs(values[a + 1:b] - line)
+        i = int(error.argmax())
+        if error[i] > tolerance:
+            keep[a + 1 + i] = True
+            segments += [(a, a + 1 + i), (a + 1 + i, b)]
+    return np.flatnonzero(keep)
+
+
+## Skinned mesh contact height (candidate vertices read once, see mesh_sampler.MeshSampler)
+## the 26 directions of a cube's faces, edges and corners
+CANDIDATE_DIRECTIONS = np.array([(x, y, z) for x in (-1, 0, 1) for y in (-1, 0, 1) for z in (-1, 0, 1)
+                                 if (x, y, z) != (0, 0, 0)], dtype=np.float64)
+CANDIDATE_DIRECTIONS /= np.linalg.norm(CANDIDATE_DIRECTIONS, axis=1)[:, None]
+
+
+def extreme_indices(points, count: int = 2, directions=CANDIDATE_DIRECTIONS) -> np.ndarray:
+    """ sorted unique indices of the <count> outermost points along every direction (approximate hull) """
+    points = as_points(points)
+    count = min(count, len(points))
+    if not count:
+        return np.empty(0, dtype=np.int64)
+    projections = points @ np.asarray(directions, dtype=np.float64).T
+    return np.unique(np.argpartition(-projections, count - 1, axis=0)[:count])
+
+
+def lowest_skinned_height(points, groups, weights, height_rows, chunk: int = 64) -> np.ndarray:
+    """ min world height of linear blend skinned points per sample
+
+    points: (C,3) rest points in armature space
+    groups: (C,K) influence index per point, into height_rows
+    weights: (C,K) normalized influence weights, 0 for unused slots
+    height_rows: (N,G,4) world z row of the skinning matrix of every influence per sample
+    return: (N,) lowest height per sample
+    """
+    points = np.concatenate((as_points(points), np.ones((len(points), 1))), axis=1)
+    height_rows = np.asarray(height_rows, dtype=np.float64)
+    ## influence slots used by any point; summed one slot at a time, a (n,C,4) gather instead of (n,C,K,4)
+    slots = [k for k in range(weights.shape[1]) if weights[:, k].any()]
+    heights = np.empty(len(height_rows))
+    for start in range(0, len(height_rows), chunk):
+        block = height_rows[start:start + chunk]
+        total = np.zeros((len(block), len(points)))
+        for k in slots:
+            total += np.einsum('ncj,cj->nc', block[:, groups[:, k]], points) * weights[:, k]
+        heights[start:start + chunk] = total.min(axis=1)
+    return heights
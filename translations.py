@@ -226,10 +226,10 @@ translations_tuple = (
      ("zh_HANS", "边界盒",
       (False, ())),
      ),
-    (("*", "Get the height of the bottom of the bounding box"),
+    (("*", "Get the height of the lowest vertex of the skinned meshes (the armature bounding box without a mesh)"),
      (("bpy.types.IMPORT_MIXAMO_OT_root_motion.method:'BOUND_BOX'",),
       ()),
-     ("zh_HANS", "获取边界盒底部的高度",
+     ("zh_HANS", "获取蒙皮网格最低顶点的高度（没有网格时使用骨架的边界盒）",
       (False, ())),
      ),
     (("*", "Prefix name"),
@@ -292,6 +292,612 @@ translations_tuple = (
      ("zh_HANS", "脊椎骨骼名",
       (False, ())),
      ),
+    (("*", "Sampling"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode",),
+      ()),
+     ("zh_HANS", "采样",
+      (False, ())),
+     ),
+    (("*", "How bone locations are sampled for baking"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode",),
+      ()),
+     ("zh_HANS", "烘焙时骨骼位置的采样方式",
+      (False, ())),
+     ),
+    (("*", "Action"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode:'ACTION'",),
+      ()),
+     ("zh_HANS", "动作",
+      (False, ())),
+     ),
+    (("*", "Evaluate the action F-Curves and the bone chains directly, without updating the scene for every frame"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode:'ACTION'",),
+      ()),
+     ("zh_HANS", "直接计算动作F曲线和骨骼链，无需每帧更新场景",
+      (False, ())),
+     ),
+    (("*", "Scene"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode:'DEPSGRAPH'",),
+      ()),
+     ("zh_HANS", "场景",
+      (False, ())),
+     ),
+    (("*", "Update the whole scene for every frame (reference, slow)"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode:'DEPSGRAPH'",),
+      ()),
+     ("zh_HANS", "每帧更新整个场景（参考，较慢）",
+      (False, ())),
+     ),
+    (("*", "Validate"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode:'VALIDATE'",),
+      ()),
+     ("zh_HANS", "校验",
+      (False, ())),
+     ),
+    (("*", "Sample the action and compare it with the scene reference; the max error is printed to the console"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sample_mode:'VALIDATE'",),
+      ()),
+     ("zh_HANS", "采样动作并与场景参考结果比较；最大误差输出到控制台",
+      (False, ())),
+     ),
+    (("*", "Import mode"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_mode",),
+      ()),
+     ("zh_HANS", "导入模式",
+      (False, ())),
+     ),
+    (("*", "Where the imported animations are stored"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_mode",),
+      ()),
+     ("zh_HANS", "导入动画的存放方式",
+      (False, ())),
+     ),
+    (("*", "Armatures"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_mode:'SCENE'",),
+      ()),
+     ("zh_HANS", "骨架",
+      (False, ())),
+     ),
+    (("*", "Every file keeps its own armature in the scene"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_mode:'SCENE'",),
+      ()),
+     ("zh_HANS", "每个文件在场景中保留各自的骨架",
+      (False, ())),
+     ),
+    (("*", "Animation library"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_mode:'LIBRARY'",),
+      ()),
+     ("zh_HANS", "动画库",
+      (False, ())),
+     ),
+    (("*", "Keep one armature per skeleton; every other file only adds its action (with fake user) to it"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_mode:'LIBRARY'",),
+      ()),
+     ("zh_HANS", "每种骨架只保留一个骨架物体；其余文件只把动作（带伪用户）添加给它",
+      (False, ())),
+     ),
+    (("*", "Parallel import"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_parallel",),
+      ()),
+     ("zh_HANS", "并行导入",
+      (False, ())),
+     ),
+    (("*", "Import the files in background Blender processes and append their actions and kept armatures"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_parallel",),
+      ()),
+     ("zh_HANS", "在后台Blender进程中导入文件并追加它们的动作和保留的骨架",
+      (False, ())),
+     ),
+    (("*", "Workers"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.worker_count",),
+      ()),
+     ("zh_HANS", "进程数",
+      (False, ())),
+     ),
+    (("*", "Number of background processes; 0 uses the number of CPU cores"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.worker_count",),
+      ()),
+     ("zh_HANS", "后台进程数量；0 表示使用CPU核心数",
+      (False, ())),
+     ),
+    (("*", "Balance by file size"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.shard_by_size",),
+      ()),
+     ("zh_HANS", "按文件大小分配",
+      (False, ())),
+     ),
+    (("*", "Distribute the files to the workers by file size instead of by count"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.shard_by_size",),
+      ()),
+     ("zh_HANS", "按文件大小而不是数量把文件分配给各个进程",
+      (False, ())),
+     ),
+    (("*", "Timeout per file"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.file_timeout",),
+      ()),
+     ("zh_HANS", "单文件超时",
+      (False, ())),
+     ),
+    (("*", "A worker is stopped when one file takes longer than this (seconds); its completed files are kept and a new worker continues with the rest"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.file_timeout",),
+      ()),
+     ("zh_HANS", "单个文件耗时超过此时间（秒）时终止进程；已完成的文件会保留，剩余文件由新进程继续导入",
+      (False, ())),
+     ),
+    (("*", "Batch"),
+     (("bpy.types.IMPORT_PT_batch_settings",),
+      ()),
+     ("zh_HANS", "批处理",
+      (False, ())),
+     ),
+    (("*", "Bake cache"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_cache",),
+      ()),
+     ("zh_HANS", "烘焙缓存",
+      (False, ())),
+     ),
+    (("*", "Reuse the baked root motion of unchanged files; the cache is keyed by the file content and the bake settings"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_cache",),
+      ()),
+     ("zh_HANS", "未修改的文件复用已烘焙的根位移；缓存以文件内容和烘焙设置为键",
+      (False, ())),
+     ),
+    (("*", "Cache size (MB)"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.cache_size",),
+      ()),
+     ("zh_HANS", "缓存大小（MB）",
+      (False, ())),
+     ),
+    (("*", "Least recently used entries are removed above this size"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.cache_size",),
+      ()),
+     ("zh_HANS", "超过此大小时移除最久未使用的缓存",
+      (False, ())),
+     ),
+    (("*", "Clear Bake Cache"),
+     (("bpy.types.IMPORT_MIXAMO_OT_clear_cache",),
+      ()),
+     ("zh_HANS", "清除烘焙缓存",
+      (False, ())),
+     ),
+    (("*", "Remove all entries of the bake cache"),
+     (("bpy.types.IMPORT_MIXAMO_OT_clear_cache",),
+      ()),
+     ("zh_HANS", "移除烘焙缓存中的所有条目",
+      (False, ())),
+     ),
+    (("*", "Sync folder"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.is_sync_folder",),
+      ()),
+     ("zh_HANS", "同步文件夹",
+      (False, ())),
+     ),
+    (("*", "Import only the fbx files of the folder that are new or changed since the last sync; the file selection is ignored"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.is_sync_folder",),
+      ()),
+     ("zh_HANS", "只导入文件夹中自上次同步以来新增或修改的fbx文件；忽略文件选择",
+      (False, ())),
+     ),
+    (("*", "Deleted files"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sync_deleted",),
+      ()),
+     ("zh_HANS", "已删除的文件",
+      (False, ())),
+     ),
+    (("*", "What happens to the actions of files that were removed from the folder"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sync_deleted",),
+      ()),
+     ("zh_HANS", "从文件夹中移除的文件，其动作的处理方式",
+      (False, ())),
+     ),
+    (("*", "Flag"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sync_deleted:'FLAG'",),
+      ()),
+     ("zh_HANS", "标记",
+      (False, ())),
+     ),
+    (("*", "Keep the actions, marked with the 'mixamo_source_missing' property"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sync_deleted:'FLAG'",),
+      ()),
+     ("zh_HANS", "保留动作，并用“mixamo_source_missing”属性标记",
+      (False, ())),
+     ),
+    (("*", "Remove"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sync_deleted:'REMOVE'",),
+      ()),
+     ("zh_HANS", "移除",
+      (False, ())),
+     ),
+    (("*", "Remove the actions"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sync_deleted:'REMOVE'",),
+      ()),
+     ("zh_HANS", "移除这些动作",
+      (False, ())),
+     ),
+    (("*", "Watch folder"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.is_watch_folder",),
+      ()),
+     ("zh_HANS", "监视文件夹",
+      (False, ())),
+     ),
+    (("*", "Keep syncing the folder in the background"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.is_watch_folder",),
+      ()),
+     ("zh_HANS", "在后台持续同步文件夹",
+      (False, ())),
+     ),
+    (("*", "Interval"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.watch_interval",),
+      ()),
+     ("zh_HANS", "间隔",
+      (False, ())),
+     ),
+    (("*", "Seconds between two checks of the watched folder"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.watch_interval",),
+      ()),
+     ("zh_HANS", "两次检查监视文件夹之间的秒数",
+      (False, ())),
+     ),
+    (("*", "Folder Sync"),
+     (("bpy.types.IMPORT_PT_sync_settings",),
+      ()),
+     ("zh_HANS", "文件夹同步",
+      (False, ())),
+     ),
+    (("*", "Stop Watching Folders"),
+     (("bpy.types.IMPORT_MIXAMO_OT_stop_watch",),
+      ()),
+     ("zh_HANS", "停止监视文件夹",
+      (False, ())),
+     ),
+    (("*", "Stop watching all synced folders"),
+     (("bpy.types.IMPORT_MIXAMO_OT_stop_watch",),
+      ()),
+     ("zh_HANS", "停止监视所有同步的文件夹",
+      (False, ())),
+     ),
+    (("*", "Profile"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.is_profile",),
+      ()),
+     ("zh_HANS", "性能分析",
+      (False, ())),
+     ),
+    (("*", "Report the time spent in every stage of the import"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.is_profile",),
+      ()),
+     ("zh_HANS", "报告导入各阶段所用的时间",
+      (False, ())),
+     ),
+    (("*", "Trace"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.trace_path",),
+      ()),
+     ("zh_HANS", "跟踪文件",
+      (False, ())),
+     ),
+    (("*", "Write wall time, frame_set calls and memory change per file and stage to this .json / .csv file"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.trace_path",),
+      ()),
+     ("zh_HANS", "把每个文件每个阶段的耗时、frame_set 调用次数和内存变化写入此 .json / .csv 文件",
+      (False, ())),
+     ),
+    (("*", "cProfile file"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.profile_file_name",),
+      ()),
+     ("zh_HANS", "cProfile 文件",
+      (False, ())),
+     ),
+    (("*", "Run cProfile while importing the file with this name; the stats are saved as <name>.prof"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.profile_file_name",),
+      ()),
+     ("zh_HANS", "导入此名称的文件时运行 cProfile；统计结果保存为 <名称>.prof",
+      (False, ())),
+     ),
+    (("*", "Contact bones"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.contact_bone_names",),
+      ()),
+     ("zh_HANS", "接触骨骼",
+      (False, ())),
+     ),
+    (("*", "Comma separated bones whose lowest point in world space is the height of the Bone method; empty uses the six key bones of 'Name Settings'"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.contact_bone_names",),
+      ()),
+     ("zh_HANS", "以逗号分隔的骨骼，其在世界空间中的最低点作为“骨骼”方法的高度；留空则使用“名称设置”中的六个关键骨骼",
+      (False, ())),
+     ),
+    (("*", "Reduce Keyframes"),
+     (("bpy.types.IMPORT_PT_reduce_settings",),
+      ()),
+     ("zh_HANS", "关键帧精简",
+      (False, ())),
+     ),
+    (("*", "Reduce keyframes"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_reduce_keys",),
+      ()),
+     ("zh_HANS", "精简关键帧",
+      (False, ())),
+     ),
+    (("*", "Remove keyframes within the tolerance from all transform curves of the action; reduced curves use linear interpolation, static channels at their rest value are removed"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_reduce_keys",),
+      ()),
+     ("zh_HANS", "删除动作所有变换曲线中误差范围内的关键帧；精简后的曲线使用线性插值，保持在默认值的静止通道将被删除",
+      (False, ())),
+     ),
+    (("*", "Location"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.reduce_location_tolerance",),
+      ()),
+     ("zh_HANS", "位置",
+      (False, ())),
+     ),
+    (("*", "Maximum location error of the reduced curves"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.reduce_location_tolerance",),
+      ()),
+     ("zh_HANS", "精简后曲线的最大位置误差",
+      (False, ())),
+     ),
+    (("*", "Rotation"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.reduce_rotation_tolerance",),
+      ()),
+     ("zh_HANS", "旋转",
+      (False, ())),
+     ),
+    (("*", "Maximum error of the reduced rotation curves (radians / quaternion components)"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.reduce_rotation_tolerance",),
+      ()),
+     ("zh_HANS", "精简后旋转曲线的最大误差（弧度/四元数分量）",
+      (False, ())),
+     ),
+    (("*", "Scale"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.reduce_scale_tolerance",),
+      ()),
+     ("zh_HANS", "缩放",
+      (False, ())),
+     ),
+    (("*", "Maximum scale error of the reduced curves"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.reduce_scale_tolerance",),
+      ()),
+     ("zh_HANS", "精简后曲线的最大缩放误差",
+      (False, ())),
+     ),
+    (("*", "Import profile"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_profile",),
+      ()),
+     ("zh_HANS", "导入配置",
+      (False, ())),
+     ),
+    (("*", "Fbx importer options"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_profile",),
+      ()),
+     ("zh_HANS", "Fbx导入器选项",
+      (False, ())),
+     ),
+    (("*", "Full"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_profile:'FULL'",),
+      ()),
+     ("zh_HANS", "完整",
+      (False, ())),
+     ),
+    (("*", "Default fbx importer options; meshes, materials and textures are imported"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_profile:'FULL'",),
+      ()),
+     ("zh_HANS", "默认的fbx导入选项；导入网格、材质和贴图",
+      (False, ())),
+     ),
+    (("*", "Animation only"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_profile:'ANIMATION'",),
+      ()),
+     ("zh_HANS", "仅动画",
+      (False, ())),
+     ),
+    (("*", "Skip image search, custom properties and custom normals; meshes and other child objects are removed right after the import (kept for the Bound box method)"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.import_profile:'ANIMATION'",),
+      ()),
+     ("zh_HANS", "跳过图像搜索、自定义属性和自定义法线；导入后立即删除网格等子物体（“边界盒”方法除外）",
+      (False, ())),
+     ),
+    (("*", "Primary bone axis"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.primary_bone_axis",),
+      ()),
+     ("zh_HANS", "主骨骼轴向",
+      (False, ())),
+     ),
+    (("*", "Secondary bone axis"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.secondary_bone_axis",),
+      ()),
+     ("zh_HANS", "次骨骼轴向",
+      (False, ())),
+     ),
+    (("*", "Passed to the fbx importer"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.primary_bone_axis",),
+      ()),
+     ("zh_HANS", "传递给fbx导入器",
+      (False, ())),
+     ),
+    (("*", "Sample rate"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode",),
+      ()),
+     ("zh_HANS", "采样率",
+      (False, ())),
+     ),
+    (("*", "Times at which the root and the main bone are baked"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode",),
+      ()),
+     ("zh_HANS", "烘焙根骨骼和主骨骼的时间点",
+      (False, ())),
+     ),
+    (("*", "Source keys"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode:'SOURCE'",),
+      ()),
+     ("zh_HANS", "源关键帧",
+      (False, ())),
+     ),
+    (("*", "Bake at the keyframes of the main bone in the file"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode:'SOURCE'",),
+      ()),
+     ("zh_HANS", "在文件中主骨骼的关键帧处烘焙",
+      (False, ())),
+     ),
+    (("*", "Scene frame rate"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode:'SCENE'",),
+      ()),
+     ("zh_HANS", "场景帧率",
+      (False, ())),
+     ),
+    (("*", "Bake at a fixed rate: the frame rate of the scene"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode:'SCENE'",),
+      ()),
+     ("zh_HANS", "以固定速率烘焙：场景的帧率",
+      (False, ())),
+     ),
+    (("*", "Custom"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode:'CUSTOM'",),
+      ()),
+     ("zh_HANS", "自定义",
+      (False, ())),
+     ),
+    (("*", "Bake at a fixed custom rate"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_mode:'CUSTOM'",),
+      ()),
+     ("zh_HANS", "以自定义的固定速率烘焙",
+      (False, ())),
+     ),
+    (("*", "Rate"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_fps",),
+      ()),
+     ("zh_HANS", "速率",
+      (False, ())),
+     ),
+    (("*", "Samples per second of the custom sample rate"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.resample_fps",),
+      ()),
+     ("zh_HANS", "自定义采样率的每秒采样数",
+      (False, ())),
+     ),
+    (("*", "Show progress"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_modal",),
+      ()),
+     ("zh_HANS", "显示进度",
+      (False, ())),
+     ),
+    (("*", "Import one file at a time in the background of the interface, with progress and remaining time in the status bar; Esc stops after the current file and keeps the imported ones"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.use_modal",),
+      ()),
+     ("zh_HANS", "在界面后台逐个导入文件，在状态栏显示进度和剩余时间；按Esc在当前文件完成后停止，并保留已导入的文件",
+      (False, ())),
+     ),
+    (("*", "Root motion file"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_format",),
+      ()),
+     ("zh_HANS", "根运动文件",
+      (False, ())),
+     ),
+    (("*", "Write the baked root trajectory of every file as a binary file for game runtimes"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_format",),
+      ()),
+     ("zh_HANS", "将每个文件烘焙后的根骨骼轨迹写入二进制文件，供游戏运行时使用",
+      (False, ())),
+     ),
+    (("*", "Do not write root motion files"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_format:'NONE'",),
+      ()),
+     ("zh_HANS", "不写入根运动文件",
+      (False, ())),
+     ),
+    (("*", "Header and float32 rows (frame, x, y, z); can be memory-mapped"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_format:'FLOAT32'",),
+      ()),
+     ("zh_HANS", "文件头和float32数据行（帧, x, y, z）；可内存映射",
+      (False, ())),
+     ),
+    (("*", "Quantized"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_format:'UINT16'",),
+      ()),
+     ("zh_HANS", "量化",
+      (False, ())),
+     ),
+    (("*", "Header and uint16 rows quantized to the bounds of the header"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_format:'UINT16'",),
+      ()),
+     ("zh_HANS", "文件头和按文件头范围量化的uint16数据行",
+      (False, ())),
+     ),
+    (("*", "Header fields and float32 rows as NumPy arrays"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_format:'NPZ'",),
+      ()),
+     ("zh_HANS", "以NumPy数组保存文件头字段和float32数据行",
+      (False, ())),
+     ),
+    (("*", "Folder"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_dir",),
+      ()),
+     ("zh_HANS", "文件夹",
+      (False, ())),
+     ),
+    (("*", "Folder of the root motion files; empty writes them next to the fbx files"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.sidecar_dir",),
+      ()),
+     ("zh_HANS", "根运动文件的文件夹；留空则写在fbx文件旁边",
+      (False, ())),
+     ),
+    (("*", "Duplicates"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "重复动画",
+      (False, ())),
+     ),
+    (("*", "Files with the same animation as an imported action (keyframes compared after the import, options included)"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "与已导入动作动画相同的文件（导入后比较关键帧，包含选项）",
+      (False, ())),
+     ),
+    (("*", "Import every file"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "导入所有文件",
+      (False, ())),
+     ),
+    (("*", "Skip files whose animation was already imported"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "跳过动画已导入的文件",
+      (False, ())),
+     ),
+    (("*", "Alias"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "别名",
+      (False, ())),
+     ),
+    (("*", "Skip files whose animation was already imported, record their file names on the existing action"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "跳过动画已导入的文件，并将其文件名记录到已有动作上",
+      (False, ())),
+     ),
+    (("*", "Import"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "导入",
+      (False, ())),
+     ),
+    (("*", "Skip"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.duplicate_mode",),
+      ()),
+     ("zh_HANS", "跳过",
+      (False, ())),
+     ),
+    (("*", "Bone remap"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.bone_remap",),
+      ()),
+     ("zh_HANS", "骨骼重映射",
+      (False, ())),
+     ),
+    (("*", "Extra bone renames, 'old=new' pairs separated by commas; old is the name after the prefix / suffix options or the original name"),
+     (("bpy.types.IMPORT_MIXAMO_OT_root_motion.bone_remap",),
+      ()),
+     ("zh_HANS", "额外的骨骼重命名，以逗号分隔的“旧名=新名”；旧名为应用前缀/后缀选项后的名称或原始名称",
+      (False, ())),
+     ),
     (("Operator", "Mixamo fbx(folder/*.fbx)"),
      (("extensions/user_default/import_mixamo_root_motion/import_mixamo_root_motion.py:628",),
       ()),